@@ -1,185 +1,560 @@
-#!/usr/bin/env python3
-"""
-Kütüphane Yönetim Sistemi - FastAPI Web Servisi
-Aşama 3: API endpoint'leri
-"""
-
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List
-from models import Book, Library
-import uvicorn
-
-
-# Pydantic modelleri
-class BookResponse(BaseModel):
-    title: str
-    author: str
-    isbn: str
-    
-    class Config:
-        from_attributes = True
-
-
-class BookCreate(BaseModel):
-    isbn: str
-
-
-class ErrorResponse(BaseModel):
-    error: str
-    message: str
-
-
-# FastAPI uygulaması
-app = FastAPI(
-    title="📚 Kütüphane Yönetim Sistemi API",
-    description="Kitaplarınızı yönetmek için RESTful API",
-    version="1.0.0"
-)
-
-# Library instance'ı - Global olarak tanımla
-library = None
-
-@app.on_event("startup")
-async def startup_event():
-    """Uygulama başlangıcında library'yi initialize et"""
-    global library
-    library = Library()
-    print(f"📚 Kütüphane başlatıldı. Mevcut kitap sayısı: {len(library.books)}")
-
-def get_library():
-    """Library instance'ını döndür"""
-    global library
-    if library is None:
-        library = Library()
-    return library
-
-
-@app.get("/", summary="Ana Sayfa")
-async def root():
-    """API ana sayfası"""
-    return {
-        "message": "📚 Kütüphane Yönetim Sistemi API'sine hoş geldiniz!",
-        "version": "1.0.0",
-        "endpoints": {
-            "GET /books": "Tüm kitapları listele",
-            "POST /books": "Yeni kitap ekle (ISBN ile)",
-            "DELETE /books/{isbn}": "Kitap sil",
-            "GET /docs": "API dokümantasyonu"
-        }
-    }
-
-
-@app.get("/books", response_model=List[BookResponse], summary="Tüm Kitapları Listele")
-async def get_books():
-    """Kütüphanedeki tüm kitapların listesini döndürür"""
-    current_library = get_library()
-    books = current_library.list_books()
-    print(f"📖 API: {len(books)} kitap listeleniyor")  # Debug için
-    return [BookResponse(title=book.title, author=book.author, isbn=book.isbn) for book in books]
-
-
-@app.post("/books", response_model=BookResponse, summary="Kitap Ekle")
-async def add_book(book_data: BookCreate):
-    """
-    ISBN numarası ile Open Library API'sinden kitap bilgilerini çekerek
-    kütüphaneye yeni kitap ekler
-    """
-    current_library = get_library()
-    isbn = book_data.isbn.strip()
-    
-    if not isbn:
-        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
-    
-    # Kitap zaten var mı kontrol et
-    existing_book = current_library.find_book(isbn)
-    if existing_book:
-        raise HTTPException(
-            status_code=409, 
-            detail=f"ISBN {isbn} ile bir kitap zaten mevcut!"
-        )
-    
-    # Kitap eklemeye çalış
-    print(f"🔍 API: ISBN {isbn} ile kitap ekleme deneniyor...")  # Debug için
-    success = current_library.add_book(isbn)
-    
-    if not success:
-        raise HTTPException(
-            status_code=404, 
-            detail="Kitap bulunamadı veya API hatası oluştu"
-        )
-    
-    # Eklenen kitabı döndür
-    added_book = current_library.find_book(isbn)
-    if added_book:
-        print(f"✅ API: Kitap başarıyla eklendi: {added_book}")  # Debug için
-        return BookResponse(
-            title=added_book.title, 
-            author=added_book.author, 
-            isbn=added_book.isbn
-        )
-    else:
-        raise HTTPException(status_code=500, detail="Kitap eklenirken beklenmeyen hata oluştu")
-
-
-@app.delete("/books/{isbn}", summary="Kitap Sil")
-async def delete_book(isbn: str):
-    """Belirtilen ISBN'e sahip kitabı kütüphaneden siler"""
-    current_library = get_library()
-    isbn = isbn.strip()
-    
-    if not isbn:
-        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
-    
-    # Kitap var mı kontrol et
-    book = current_library.find_book(isbn)
-    if not book:
-        raise HTTPException(status_code=404, detail="Kitap bulunamadı!")
-    
-    # Kitabı sil
-    success = current_library.remove_book(isbn)
-    
-    if success:
-        return {"message": f"Kitap başarıyla silindi: {book.title}"}
-    else:
-        raise HTTPException(status_code=500, detail="Kitap silinirken hata oluştu")
-
-
-@app.get("/books/{isbn}", response_model=BookResponse, summary="Kitap Ara")
-async def get_book(isbn: str):
-    """Belirtilen ISBN'e sahip kitabı bulur ve döndürür"""
-    current_library = get_library()
-    isbn = isbn.strip()
-    
-    if not isbn:
-        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
-    
-    book = current_library.find_book(isbn)
-    if not book:
-        raise HTTPException(status_code=404, detail="Kitap bulunamadı!")
-    
-    return BookResponse(title=book.title, author=book.author, isbn=book.isbn)
-
-
-@app.get("/health", summary="Sağlık Kontrolü")
-async def health_check():
-    """API sağlık durumunu kontrol eder"""
-    current_library = get_library()
-    return {
-        "status": "healthy",
-        "total_books": len(current_library.list_books()),
-        "message": "API çalışıyor"
-    }
-
-
-if __name__ == "__main__":
-    print("🚀 Kütüphane API'si başlatılıyor...")
-    print("📖 Dokümantasyon: http://localhost:8000/docs")
-    print("🔄 API Test: http://localhost:8000/health")
-    
-    uvicorn.run(
-        "api:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=True
+#!/usr/bin/env python3
+"""
+Kütüphane Yönetim Sistemi - FastAPI Web Servisi
+Aşama 3: API endpoint'leri
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+from typing import Dict, List, Optional, Tuple, Union
+from models import Book, Library, ResponseCache
+from models.metrics import CATALOG_SIZE, REGISTRY
+import uvicorn
+
+
+# Pydantic modelleri
+class BookResponse(BaseModel):
+    title: str
+    author: str
+    isbn: str
+    
+    class Config:
+        from_attributes = True
+
+
+class BookPage(BaseModel):
+    items: List[BookResponse]
+    next_cursor: Optional[str] = None
+
+
+class BookCreate(BaseModel):
+    isbn: str
+
+
+class BookBatchCreate(BaseModel):
+    isbns: List[str]
+    concurrency: int = Field(default=Library.DEFAULT_CONCURRENCY, ge=1, le=100)
+
+
+class BookBatchResponse(BaseModel):
+    results: Dict[str, str]
+    summary: Dict[str, int]
+
+
+class BookBatchDelete(BaseModel):
+    isbns: Optional[List[str]] = None
+    author: Optional[str] = None
+
+
+class ErrorResponse(BaseModel):
+    error: str
+    message: str
+
+
+# FastAPI uygulaması
+app = FastAPI(
+    title="📚 Kütüphane Yönetim Sistemi API",
+    description="Kitaplarınızı yönetmek için RESTful API",
+    version="1.0.0"
+)
+
+# Library instance'ı - Global olarak tanımla
+library = None
+
+# İstek metrikleri; route etiketi yol şablonudur (/books/{isbn}), böylece
+# ISBN başına ayrı seri oluşmaz
+REQUEST_COUNT = REGISTRY.counter(
+    "http_requests_total", "Route ve durum koduna göre HTTP istekleri", ("method", "route", "status")
+)
+REQUEST_LATENCY = REGISTRY.histogram(
+    "http_request_duration_seconds", "Route ve durum koduna göre HTTP istek süresi",
+    ("method", "route", "status"),
+)
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Her isteğin süresini ve sonucunu metriklere yazar"""
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        labels = {
+            "method": request.method,
+            "route": getattr(route, "path", "unmatched"),
+            "status": status,
+        }
+        REQUEST_COUNT.inc(**labels)
+        REQUEST_LATENCY.observe(time.perf_counter() - started, **labels)
+
+
+def create_library() -> Library:
+    """Open Library yanıt önbelleği ile Library örneği oluşturur
+    
+    Katalog arka planda yüklenir; yükleme sürerken de ISBN aramaları yanıtlanır.
+    LIBRARY_SHARED=1 ile birden çok worker aynı dosyayı paylaşabilir
+    (uvicorn api:app --workers 4). Değişiklikler grup yazımıyla kaydedilir;
+    kapanışta bekleyen grup yazılır.
+    """
+    shared = os.environ.get("LIBRARY_SHARED", "") not in ("", "0")
+    return Library(cache=ResponseCache(), background_load=True, snapshot=True, shared=shared,
+                   group_commit=True)
+
+
+# Değiştiren uç noktalarda dayanıklılık seçimi: durable=false ise yanıt,
+# değişiklik diske yazılmadan (bir sonraki grupta yazılmak üzere) döner
+DURABLE_QUERY = Query(True, description="False ise diske yazılmasını beklemeden yanıt ver")
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Uygulama başlangıcında library'yi initialize et"""
+    global library
+    library = create_library()
+    print("📚 Kütüphane başlatıldı, katalog arka planda yükleniyor")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Uygulama kapanırken bekleyen yazımları diske indir, HTTP bağlantı havuzlarını ve önbelleği kapat"""
+    global library
+    if library is not None:
+        await library.aclose()
+        if library.cache is not None:
+            library.cache.close()
+        library = None
+
+
+def encode_cursor(isbn: str, seq: int) -> str:
+    """Sayfanın son kitabını (ISBN ve sıra numarası) opak imlece çevirir
+    
+    Sıra numarası aynı süreçte kitap silinip yeniden eklense de imlecin
+    yerini korur; ISBN ise aynı dosyayı paylaşan başka bir worker'ın
+    sayfalamaya kendi kataloğundaki yerinden devam etmesini sağlar.
+    """
+    raw = json.dumps({"isbn": isbn, "after": seq}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int]:
+    """Opak imleci (ISBN, sıra numarası) çiftine çevirir, geçersizse 400 döndürür"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        isbn, seq = data["isbn"], data["after"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Geçersiz cursor değeri!")
+    if not isinstance(isbn, str) or type(seq) is not int:
+        raise HTTPException(status_code=400, detail="Geçersiz cursor değeri!")
+    return isbn, seq
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match başlığı verilen ETag ile eşleşiyor mu (zayıf karşılaştırma)"""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    etag = etag.removeprefix("W/")
+    return "*" in candidates or etag in (candidate.removeprefix("W/") for candidate in candidates)
+
+
+def list_etag(current_library: Library, revision: str) -> str:
+    """Kitap listesinin ETag'i
+    
+    Paylaşımlı modda ETag tüm worker'larda ortaktır ama imleçler süreç içi
+    sıra numarası da taşır; gövdeler eşdeğer olsa da bayt bayt aynı
+    olmadığından zayıf ETag kullanılır.
+    """
+    return f'W/"{revision}"' if current_library.shared else f'"{revision}"'
+
+
+def not_modified(etag: str) -> Response:
+    """Gövdesiz 304 yanıtı"""
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+def book_etag(book: Book) -> str:
+    """Tek kitabın içeriğinden türetilen ETag; diğer kitaplar değişse de sabit kalır"""
+    digest = hashlib.sha1(f"{book.isbn}\0{book.title}\0{book.author}".encode("utf-8")).hexdigest()
+    return f'"{digest[:16]}"'
+
+
+class RawJSONResponse(Response):
+    """Önceden serileştirilmiş JSON gövdesini doğrulama/kodlama yapmadan gönderir"""
+    media_type = "application/json"
+
+
+def serialize_books(books: List[Book]) -> List[dict]:
+    return [{"title": book.title, "author": book.author, "isbn": book.isbn} for book in books]
+
+
+def encode_json(data) -> bytes:
+    """FastAPI'nin JSONResponse'u ile aynı biçimde kodlar"""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def build_page_body(current_library: Library, limit: int,
+                    after: Optional[int]) -> Tuple[bytes, Optional[int], str, int]:
+    """Sayfayı keser ve kodlar: (gövde, sonraki after, revision, version)"""
+    books, next_after, revision, version = current_library.page(limit, after)
+    body = encode_json({
+        "items": serialize_books(books),
+        "next_cursor": encode_cursor(books[-1].isbn, next_after) if next_after is not None else None,
+    })
+    return body, next_after, revision, version
+
+
+class BookListBodyCache:
+    """GET /books yanıt gövdelerini bayt olarak tutar
+    
+    Tam liste, Library'nin döndürdüğü liste nesnesine bağlıdır: katalog
+    değişince Library yeni bir liste üretir ve gövde yeniden kodlanır.
+    Sayfalar (limit, after) ile anahtarlanır ve kapsadıkları sıra numarası
+    aralığını tutar. Katalog değişince Library'nin değişiklik kaydına
+    bakılır, yalnızca değişen numaraları kapsayan sayfalar atılır (yeni
+    eklemeler yalnızca son sayfayı etkiler). Eksik sayfalar döngü dışında
+    kesilip kodlanır. Sayfa sayısı MAX_PAGES ile sınırlıdır (LRU).
+    """
+    
+    MAX_PAGES = 256
+    
+    def __init__(self):
+        self._full: Optional[Tuple[List[Book], bytes]] = None
+        self._owner: Optional[str] = None
+        self._version: Optional[int] = None
+        # (limit, after) -> (gövde, sayfanın son sıra numarası; son sayfada None)
+        self._pages: "OrderedDict[Tuple[int, Optional[int]], Tuple[bytes, Optional[int]]]" = OrderedDict()
+    
+    def full(self, books: List[Book]) -> bytes:
+        if self._full is None or self._full[0] is not books:
+            self._full = (books, encode_json(serialize_books(books)))
+        return self._full[1]
+    
+    def _sync(self, current_library: Library) -> str:
+        """Sayfaları kataloğun güncel sürümüne getirir, güncel revision'ı döndürür"""
+        if current_library.instance_id != self._owner:
+            self._owner, self._version = current_library.instance_id, None
+        version, revision, changed = current_library.changes_since(self._version)
+        if changed is None:
+            self._pages.clear()
+        elif changed:
+            for key, (_, last) in list(self._pages.items()):
+                after = key[1]
+                if any((after is None or seq > after) and (last is None or seq <= last) for seq in changed):
+                    del self._pages[key]
+        self._version = version
+        return revision
+    
+    async def page(self, current_library: Library, limit: int,
+                   after: Optional[int]) -> Tuple[bytes, str]:
+        """Sayfa gövdesi ve kesildiği katalog sürümünün revision'ı"""
+        revision = self._sync(current_library)
+        key = (limit, after)
+        cached = self._pages.get(key)
+        if cached is not None:
+            self._pages.move_to_end(key)
+            return cached[0], revision
+        body, last, revision, version = await asyncio.to_thread(build_page_body, current_library, limit, after)
+        # Beklerken katalog değiştiyse sayfa önbelleğe alınmaz
+        self._sync(current_library)
+        if version == self._version:
+            self._pages[key] = (body, last)
+            if len(self._pages) > self.MAX_PAGES:
+                self._pages.popitem(last=False)
+        return body, revision
+
+
+books_body_cache = BookListBodyCache()
+
+
+async def find_book_when_loaded(current_library: Library, isbn: str) -> Optional[Book]:
+    """ISBN ile kitabı olay döngüsünü bloklamadan arar
+    
+    Yüklenmiş kitaplar hemen döner; yükleme sürerken bulunamayan ISBN için
+    yüklemenin bitmesi bir iş parçacığında beklenir.
+    """
+    book = current_library.find_book(isbn, wait=False)
+    if not book and current_library.loading:
+        await asyncio.to_thread(current_library.wait_until_loaded)
+        book = current_library.find_book(isbn, wait=False)
+    return book
+
+
+async def get_library() -> Library:
+    """Library instance'ını döndür
+    
+    Paylaşımlı modda önce diğer worker'ların değişiklikleri uygulanır; dosya
+    kilidi ve olası yeniden yükleme döngüyü bloklamasın diye bir iş
+    parçacığında yapılır.
+    """
+    global library
+    if library is None:
+        library = create_library()
+    elif library.shared:
+        await asyncio.to_thread(library.refresh)
+    return library
+
+
+@app.get("/", summary="Ana Sayfa")
+async def root():
+    """API ana sayfası"""
+    return {
+        "message": "📚 Kütüphane Yönetim Sistemi API'sine hoş geldiniz!",
+        "version": "1.0.0",
+        "endpoints": {
+            "GET /books": "Kitapları sayfa sayfa listele (limit, cursor; tümü için all=true)",
+            "POST /books": "Yeni kitap ekle (ISBN ile)",
+            "POST /books/batch": "Birden çok ISBN ile toplu kitap ekle",
+            "GET /books/search?q=": "Başlık veya yazara göre kitap ara",
+            "DELETE /books/{isbn}": "Kitap sil",
+            "DELETE /books": "ISBN listesi ya da yazara göre toplu kitap sil",
+            "GET /metrics": "Prometheus biçiminde metrikler",
+            "GET /upstream": "Open Library hız sınırı, yeniden deneme ve devre kesici durumu",
+            "GET /docs": "API dokümantasyonu"
+        }
+    }
+
+
+@app.get("/books", response_model=Union[BookPage, List[BookResponse]], summary="Kitapları Listele")
+async def get_books(
+    limit: int = Query(100, ge=1, le=1000, description="Sayfa başına kitap sayısı"),
+    cursor: Optional[str] = Query(None, description="Önceki yanıttaki next_cursor değeri"),
+    all: bool = Query(False, description="Sayfalamadan tüm kitapları tek listede döndür"),
+    if_none_match: Optional[str] = Header(None),
+):
+    """
+    Kütüphanedeki kitapları ekleme sırasıyla sayfa sayfa döndürür.
+    İmleç önceki sayfanın son kitabıdır (ISBN ve sıra numarası) ve ekleme
+    sırasındaki yerine çözülür; sayfalar arasında yapılan ekleme ve silmeler kitapların
+    atlanmasına veya tekrarlanmasına yol açmaz, imleç başka bir worker'da da
+    geçerlidir. all=true eski davranıştaki gibi tüm listeyi döndürür.
+    ETag kataloğun sürümüdür (paylaşımlı modda tüm worker'larda ortak);
+    değişiklik yoksa If-None-Match ile 304 döner.
+    """
+    current_library = await get_library()
+    if current_library.loading:
+        await asyncio.to_thread(current_library.wait_until_loaded)
+    # Gövdeler önbellekten bayt olarak gönderilir; pydantic modeli kurulmaz
+    if all:
+        # Tek bir değişmez görünüm: ETag ve gövde aynı katalog sürümünden gelir.
+        # Tam liste değişiklikten sonraki ilk istekte kurulur; kurma ve
+        # kodlama döngü dışında yapılır
+        view = await asyncio.to_thread(current_library.view)
+        etag = list_etag(current_library, view.revision)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+        body = await asyncio.to_thread(lambda: books_body_cache.full(view.books))
+        print(f"📖 API: {len(view.books)} kitap listeleniyor")  # Debug için
+        return RawJSONResponse(body, headers={"ETag": etag})
+    
+    etag = list_etag(current_library, current_library.revision)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    
+    after = None
+    if cursor:
+        after = current_library.cursor_seq(*decode_cursor(cursor))
+        if after is None:
+            raise HTTPException(status_code=410, detail="Cursor artık geçerli değil, listeyi baştan alın!")
+    
+    # Sayfa katalog kopyalanmadan kesilir (maliyeti limit'e bağlı); ETag
+    # sayfanın kesildiği sürümdendir
+    body, revision = await books_body_cache.page(current_library, limit, after)
+    return RawJSONResponse(body, headers={"ETag": list_etag(current_library, revision)})
+
+
+@app.post("/books", response_model=BookResponse, summary="Kitap Ekle")
+async def add_book(book_data: BookCreate, durable: bool = DURABLE_QUERY):
+    """
+    ISBN numarası ile Open Library API'sinden kitap bilgilerini çekerek
+    kütüphaneye yeni kitap ekler
+    """
+    current_library = await get_library()
+    isbn = book_data.isbn.strip()
+    
+    if not isbn:
+        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
+    
+    # Kitap zaten var mı kontrol et
+    existing_book = await find_book_when_loaded(current_library, isbn)
+    if existing_book:
+        raise HTTPException(
+            status_code=409, 
+            detail=f"ISBN {isbn} ile bir kitap zaten mevcut!"
+        )
+    
+    # Kitap eklemeye çalış
+    print(f"🔍 API: ISBN {isbn} ile kitap ekleme deneniyor...")  # Debug için
+    success = await current_library.add_book_async(isbn, durable=durable)
+    
+    if not success:
+        raise HTTPException(
+            status_code=404, 
+            detail="Kitap bulunamadı veya API hatası oluştu"
+        )
+    
+    # Eklenen kitabı döndür
+    added_book = current_library.find_book(isbn)
+    if added_book:
+        print(f"✅ API: Kitap başarıyla eklendi: {added_book}")  # Debug için
+        return BookResponse(
+            title=added_book.title, 
+            author=added_book.author, 
+            isbn=added_book.isbn
+        )
+    else:
+        raise HTTPException(status_code=500, detail="Kitap eklenirken beklenmeyen hata oluştu")
+
+
+@app.post("/books/batch", response_model=BookBatchResponse, summary="Toplu Kitap Ekle")
+async def add_books_batch(batch: BookBatchCreate, durable: bool = DURABLE_QUERY):
+    """
+    Birden çok ISBN'i Open Library API'sinden eşzamanlı olarak çözer,
+    tek seferde kaydeder ve ISBN başına sonuç raporu döndürür
+    """
+    current_library = await get_library()
+    if not any(isbn.strip() for isbn in batch.isbns):
+        raise HTTPException(status_code=400, detail="ISBN listesi boş olamaz!")
+    
+    results = await current_library.add_books_async(
+        batch.isbns, concurrency=batch.concurrency, durable=durable
+    )
+    summary: Dict[str, int] = {}
+    for status in results.values():
+        summary[status] = summary.get(status, 0) + 1
+    return BookBatchResponse(results=results, summary=summary)
+
+
+@app.delete("/books", response_model=BookBatchResponse, summary="Toplu Kitap Sil")
+async def delete_books_batch(batch: BookBatchDelete, durable: bool = DURABLE_QUERY):
+    """
+    ISBN listesindeki ya da belirtilen yazara ait kitapları tek seferde siler,
+    değişiklikleri bir kez kaydeder ve ISBN başına sonuç raporu döndürür
+    """
+    current_library = await get_library()
+    if (batch.isbns is None) == (batch.author is None):
+        raise HTTPException(status_code=400, detail="ISBN listesi ya da yazar verilmelidir (ikisi birden değil)")
+    if batch.isbns is not None and not any(isbn.strip() for isbn in batch.isbns):
+        raise HTTPException(status_code=400, detail="ISBN listesi boş olamaz!")
+    if batch.author is not None and not batch.author.strip():
+        raise HTTPException(status_code=400, detail="Yazar boş olamaz!")
+    
+    results = await current_library.remove_books_async(
+        isbns=batch.isbns, author=batch.author, durable=durable
+    )
+    summary: Dict[str, int] = {}
+    for status in results.values():
+        summary[status] = summary.get(status, 0) + 1
+    return BookBatchResponse(results=results, summary=summary)
+
+
+@app.get("/books/search", response_model=List[BookResponse], summary="Başlık/Yazar ile Ara")
+async def search_books(
+    q: str = Query(..., min_length=1, description="Aranacak kelimeler (önek eşleşmesi)"),
+    limit: int = Query(50, ge=1, le=500),
+):
+    """Başlık ve yazar alanlarında tüm kelimelerle eşleşen kitapları döndürür"""
+    current_library = await get_library()
+    # İlk arama indeksi kurar, geniş önekler çok kitapla eşleşir: döngü dışında
+    books = await asyncio.to_thread(current_library.search_books, q, limit=limit)
+    return [BookResponse(title=book.title, author=book.author, isbn=book.isbn) for book in books]
+
+
+@app.delete("/books/{isbn}", summary="Kitap Sil")
+async def delete_book(isbn: str, durable: bool = DURABLE_QUERY):
+    """Belirtilen ISBN'e sahip kitabı kütüphaneden siler"""
+    current_library = await get_library()
+    isbn = isbn.strip()
+    
+    if not isbn:
+        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
+    
+    # Kitap var mı kontrol et
+    book = await find_book_when_loaded(current_library, isbn)
+    if not book:
+        raise HTTPException(status_code=404, detail="Kitap bulunamadı!")
+    
+    # Kitabı sil
+    success = await current_library.remove_book_async(isbn, durable=durable)
+    
+    if success:
+        return {"message": f"Kitap başarıyla silindi: {book.title}"}
+    else:
+        raise HTTPException(status_code=500, detail="Kitap silinirken hata oluştu")
+
+
+@app.get("/books/{isbn}", response_model=BookResponse, summary="Kitap Ara")
+async def get_book(isbn: str, response: Response, if_none_match: Optional[str] = Header(None)):
+    """Belirtilen ISBN'e sahip kitabı bulur ve döndürür"""
+    current_library = await get_library()
+    isbn = isbn.strip()
+    
+    if not isbn:
+        raise HTTPException(status_code=400, detail="ISBN boş olamaz!")
+    
+    book = await find_book_when_loaded(current_library, isbn)
+    if not book:
+        raise HTTPException(status_code=404, detail="Kitap bulunamadı!")
+    
+    etag = book_etag(book)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return BookResponse(title=book.title, author=book.author, isbn=book.isbn)
+
+
+@app.get("/health", summary="Sağlık Kontrolü")
+async def health_check():
+    """API sağlık durumunu kontrol eder"""
+    current_library = await get_library()
+    health = {
+        "status": "healthy",
+        "total_books": current_library.count_books(),
+        "loading": current_library.loading,
+        "message": "API çalışıyor"
+    }
+    if current_library.cache is not None:
+        health["cache"] = current_library.cache.stats()
+    return health
+
+
+@app.get("/metrics", response_class=PlainTextResponse, summary="Metrikler")
+async def metrics():
+    """İstek, Open Library, kayıt ve katalog metriklerini Prometheus metin biçiminde döndürür"""
+    CATALOG_SIZE.set((await get_library()).count_books())
+    return PlainTextResponse(REGISTRY.render(), media_type=REGISTRY.CONTENT_TYPE)
+
+
+@app.get("/upstream", summary="Open Library Politika Durumu")
+async def upstream_status():
+    """Open Library çağrı politikasının ayarlarını ve anlık durumunu döndürür
+    
+    Devre kesici durumu (closed / open / half_open), hız sınırı kovası,
+    süren istek sayısı ve yeniden deneme sayaçları.
+    """
+    return (await get_library()).upstream.state()
+
+
+if __name__ == "__main__":
+    print("🚀 Kütüphane API'si başlatılıyor...")
+    print("📖 Dokümantasyon: http://localhost:8000/docs")
+    print("🔄 API Test: http://localhost:8000/health")
+    
+    uvicorn.run(
+        "api:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True
     )
\ No newline at end of file
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Library ve API sıcak yolları için performans ölçümü
+
+Her katalog boyutu için (varsayılan 1k / 100k / 1M kitap) geçici bir
+dizinde sentetik library.json üretir ve şu işlemleri ölçer:
+- Library: load_books, find_book, add_book_manual, remove_book, save_books
+- API (TestClient): GET /books, GET /books?all=true, GET /books/{isbn}, POST /books
+POST /books, Open Library yerine httpx.MockTransport ile yanıtlanır.
+
+İşlem başına verim (işlem/sn), p50/p99 gecikme (ms) ve tracemalloc ile
+ölçülen tepe bellek raporlanır. Her işlemin ilk çağrısı tracemalloc altında
+bellek için, kalanları zamanlama için çalıştırılır.
+
+Kullanım:
+  python benchmarks/hot_paths.py [--sizes 1000,100000] [--ops 1000] [--write-ops 20]
+                                 [--journal] [--snapshot] [--json çıktı.json]
+                                 [--compare önceki.json]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+from fastapi.testclient import TestClient
+
+import api
+from models.book import Book
+from models.library import Library
+
+
+DEFAULT_SIZES = "1000,100000,1000000"
+
+
+def synthetic_book(i: int, author_pool: int = 1000) -> Book:
+    """Sıra numarasından belirlenimci sentetik kitap üretir"""
+    return Book(
+        title=f"Sentetik Kitap Başlığı {i}",
+        author=f"Yazar Adı Soyadı {i % author_pool}",
+        isbn=f"978{i:010d}",
+    )
+
+
+def write_catalog(filename: str, count: int) -> None:
+    """library.json biçiminde sentetik katalog yazar"""
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump([synthetic_book(i).to_dict() for i in range(count)], file, ensure_ascii=False)
+
+
+def mock_open_library() -> httpx.AsyncClient:
+    """Her ISBN için tek yazarlı bir baskı döndüren sahte Open Library istemcisi"""
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/isbn/"):
+            isbn = path[len("/isbn/"):-len(".json")]
+            return httpx.Response(200, json={
+                "title": f"Uzak Kitap {isbn}",
+                "authors": [{"key": "/authors/OL1A"}],
+            })
+        if path.startswith("/authors/"):
+            return httpx.Response(200, json={"name": "Uzak Yazar"})
+        return httpx.Response(404)
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Sıralı listeden en yakın sıra yöntemiyle yüzdelik değer"""
+    if not sorted_values:
+        return 0.0
+    position = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[position]
+
+
+def measure(calls: List[Callable[[], object]]) -> Dict[str, float]:
+    """İlk çağrıyı bellek, kalanları zamanlama için çalıştırır"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        calls[0]()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        latencies = []
+        for call in calls[1:]:
+            start = time.perf_counter()
+            call()
+            latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    total = sum(latencies)
+    return {
+        "ops": len(latencies),
+        "throughput_per_s": round(len(latencies) / total, 1) if total else 0.0,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 4),
+        "peak_memory_bytes": peak,
+    }
+
+
+def bench_size(count: int, args: argparse.Namespace, workdir: str) -> Dict[str, Dict[str, float]]:
+    """Tek bir katalog boyutu için tüm işlemleri ölçer"""
+    filename = os.path.join(workdir, f"library_{count}.json")
+    write_catalog(filename, count)
+    options = {"journal": args.journal, "snapshot": args.snapshot}
+    rng = random.Random(count)
+    results: Dict[str, Dict[str, float]] = {}
+
+    load_repeats = 3 if count <= 100_000 else 1
+    results["load_books"] = measure([
+        lambda: Library(filename, **options) for _ in range(load_repeats + 1)
+    ])
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        library = Library(filename, async_client=mock_open_library(), **options)
+
+    lookups = [f"978{rng.randrange(count):010d}" for _ in range(args.ops + 1)]
+    results["find_book"] = measure([lambda isbn=isbn: library.find_book(isbn) for isbn in lookups])
+
+    new_isbns = [f"979{i:010d}" for i in range(args.write_ops + 1)]
+    results["add_book_manual"] = measure([
+        lambda isbn=isbn: library.add_book_manual(Book("Yeni Kitap", "Yeni Yazar", isbn))
+        for isbn in new_isbns
+    ])
+    results["remove_book"] = measure([lambda isbn=isbn: library.remove_book(isbn) for isbn in new_isbns])
+
+    save_repeats = 3 if count <= 100_000 else 1
+    results["save_books"] = measure([library.save_books for _ in range(save_repeats + 1)])
+
+    previous_library = api.library
+    api.library = library
+    try:
+        client = TestClient(api.app)
+        results["GET /books"] = measure([
+            lambda: client.get("/books") for _ in range(min(args.ops, 200) + 1)
+        ])
+        if count <= args.full_list_max:
+            results["GET /books?all=true"] = measure([
+                lambda: client.get("/books", params={"all": "true"}) for _ in range(3 + 1)
+            ])
+        results["GET /books/{isbn}"] = measure([
+            lambda isbn=isbn: client.get(f"/books/{isbn}") for isbn in lookups
+        ])
+        post_isbns = [f"977{i:010d}" for i in range(args.write_ops + 1)]
+        results["POST /books"] = measure([
+            lambda isbn=isbn: client.post("/books", json={"isbn": isbn}) for isbn in post_isbns
+        ])
+    finally:
+        api.library = previous_library
+        library.close()
+    return results
+
+
+def git_revision() -> Optional[str]:
+    """Ölçümün yapıldığı commit (git yoksa None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: dict, baseline: Optional[dict]) -> None:
+    """Sonuçları tablo halinde yazar; önceki ölçüm varsa p50 oranını ekler"""
+    for size, operations in report["results"].items():
+        print(f"\n📚 {size} kitap")
+        print(f"  {'işlem':<22}{'işlem/sn':>12}{'p50 ms':>10}{'p99 ms':>10}{'tepe MiB':>10}")
+        for name, stats in operations.items():
+            line = (f"  {name:<22}{stats['throughput_per_s']:>12.1f}{stats['p50_ms']:>10.3f}"
+                    f"{stats['p99_ms']:>10.3f}{stats['peak_memory_bytes'] / 1024 / 1024:>10.2f}")
+            previous = (baseline or {}).get("results", {}).get(size, {}).get(name)
+            if previous and previous["p50_ms"]:
+                line += f"  (p50 x{stats['p50_ms'] / previous['p50_ms']:.2f})"
+            print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Library/API sıcak yolu ölçümleri")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="Virgülle ayrılmış katalog boyutları")
+    parser.add_argument("--ops", type=int, default=1000, help="Okuma işlemi tekrar sayısı")
+    parser.add_argument("--write-ops", type=int, default=20, help="Yazma işlemi tekrar sayısı")
+    parser.add_argument("--full-list-max", type=int, default=100_000,
+                        help="GET /books?all=true ölçülecek en büyük katalog")
+    parser.add_argument("--journal", action="store_true", help="Günlük modunda ölç")
+    parser.add_argument("--snapshot", action="store_true", help="İkili anlık görüntü modunda ölç")
+    parser.add_argument("--json", dest="output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--compare", help="Karşılaştırma için önceki JSON çıktısı")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "journal": args.journal,
+            "snapshot": args.snapshot,
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in (int(value) for value in args.sizes.split(",")):
+            report["results"][str(size)] = bench_size(size, args, workdir)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
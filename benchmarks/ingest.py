@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+ISBN içe aktarma verimi ölçümü (yerel Open Library taklidine karşı)
+
+Aynı ISBN listesini üç yolla içe aktarır ve kitap/sn olarak raporlar:
+- sequential: Library.add_book ile tek tek (senkron istemci)
+- batched:    Library.add_books ile toplu (eşzamanlı çözümleme, tek kayıt)
+- concurrent: add_book_async çağrıları eşzamanlı (API'deki gibi istek başına kayıt)
+
+--base-url verilmezse benchmarks/openlibrary_stub.py bu süreçte rastgele
+bir portta başlatılır; gecikme ve hata oranları aynı parametrelerle ayarlanır.
+
+Kullanım:
+  python benchmarks/ingest.py [--count 500] [--concurrency 20] [--latency-ms 20]
+      [--jitter-ms 5] [--not-found-rate 0.02] [--error-rate 0.0] [--seed 1]
+      [--modes sequential,batched,concurrent] [--journal] [--json çıktı.json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import uvicorn
+
+from models.library import Library
+from openlibrary_stub import build_parser as stub_parser, app_from_args
+
+
+MODES = ("sequential", "batched", "concurrent")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@contextlib.contextmanager
+def running_stub(args: argparse.Namespace):
+    """Taklit sunucuyu arka plan iş parçacığında çalıştırır, adresini verir"""
+    port = free_port()
+    config = uvicorn.Config(app_from_args(args), host="127.0.0.1", port=port, log_level="warning")
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join()
+
+
+def import_sequential(library: Library, isbns: List[str], concurrency: int) -> Dict[str, str]:
+    return {isbn: Library.STATUS_ADDED if library.add_book(isbn) else Library.STATUS_ERROR for isbn in isbns}
+
+
+def import_batched(library: Library, isbns: List[str], concurrency: int) -> Dict[str, str]:
+    return library.add_books(isbns, concurrency=concurrency)
+
+
+def import_concurrent(library: Library, isbns: List[str], concurrency: int) -> Dict[str, str]:
+    async def run() -> Dict[str, str]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def add(isbn: str) -> bool:
+            async with semaphore:
+                return await library.add_book_async(isbn)
+
+        try:
+            results = await asyncio.gather(*(add(isbn) for isbn in isbns))
+        finally:
+            await library.aclose()
+        return {isbn: Library.STATUS_ADDED if ok else Library.STATUS_ERROR for isbn, ok in zip(isbns, results)}
+    return asyncio.run(run())
+
+
+IMPORTERS = {
+    "sequential": import_sequential,
+    "batched": import_batched,
+    "concurrent": import_concurrent,
+}
+
+
+def bench_mode(mode: str, base_url: str, isbns: List[str], args: argparse.Namespace, workdir: str) -> dict:
+    """Tek bir içe aktarma yolunu boş bir kütüphaneyle ölçer"""
+    filename = os.path.join(workdir, f"ingest_{mode}.json")
+    with contextlib.redirect_stdout(io.StringIO()):
+        library = Library(filename, journal=args.journal, base_url=base_url)
+        start = time.perf_counter()
+        report = IMPORTERS[mode](library, isbns, args.concurrency)
+        elapsed = time.perf_counter() - start
+        library.close()
+    statuses = Counter(report.values())
+    return {
+        "seconds": round(elapsed, 3),
+        "books_per_s": round(statuses[Library.STATUS_ADDED] / elapsed, 1) if elapsed else 0.0,
+        "statuses": dict(statuses),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ISBN içe aktarma verimi", parents=[stub_parser()],
+                                     conflict_handler="resolve")
+    parser.add_argument("--count", type=int, default=500, help="İçe aktarılacak ISBN sayısı")
+    parser.add_argument("--concurrency", type=int, default=Library.DEFAULT_CONCURRENCY)
+    parser.add_argument("--modes", default=",".join(MODES))
+    parser.add_argument("--base-url", help="Çalışan bir taklit sunucunun adresi")
+    parser.add_argument("--journal", action="store_true", help="Günlük modunda kaydet")
+    parser.add_argument("--json", dest="output", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    isbns = [f"978{i:010d}" for i in range(args.count)]
+    modes = [mode for mode in args.modes.split(",") if mode]
+    report = {"count": args.count, "concurrency": args.concurrency, "latency_ms": args.latency_ms,
+              "jitter_ms": args.jitter_ms, "not_found_rate": args.not_found_rate,
+              "error_rate": args.error_rate, "journal": args.journal, "results": {}}
+
+    with contextlib.ExitStack() as stack, tempfile.TemporaryDirectory() as workdir:
+        base_url = args.base_url or stack.enter_context(running_stub(args))
+        for mode in modes:
+            report["results"][mode] = bench_mode(mode, base_url, isbns, args, workdir)
+            result = report["results"][mode]
+            print(f"📥 {mode:<11} {result['books_per_s']:>8.1f} kitap/sn  "
+                  f"({result['seconds']:.2f} sn, {result['statuses']})")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Kitap başına bellek kullanımı ölçümü
+
+Aynı sentetik kataloğu üç farklı bellek düzeniyle kurar ve tracemalloc ile
+kitap başına bayt değerini raporlar:
+- dict_plain:   __slots__ olmayan eski Book sınıfı + dict indeksi (önceki durum)
+- dict_slots:   __slots__ kullanan Book + dict indeksi
+- columnar:     BookColumns (sözlük kodlamalı yazarlar, tembel Book üretimi)
+- library_*:    aynı düzenlerle kurulan Library, birkaç sayfa okunduktan sonra
+                (sıra numarası tabloları dahil; sayfa okumak kataloğu
+                Book nesnesi olarak bellekte tutmamalıdır)
+
+Kullanım: python benchmarks/memory_book.py [kitap_sayısı] [--json çıktı.json]
+"""
+
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.columns import BookColumns
+from models.library import Library
+
+
+class PlainBook:
+    """__slots__ öncesi Book sınıfının birebir kopyası (karşılaştırma için)"""
+
+    def __init__(self, title: str, author: str, isbn: str):
+        self.title = title
+        self.author = author
+        self.isbn = isbn
+
+
+def synthetic_catalog_json(count: int, author_pool: int = 1000) -> str:
+    """library.json biçiminde sentetik katalog metni üretir"""
+    records = [
+        {
+            "title": f"Sentetik Kitap Başlığı {i}",
+            "author": f"Yazar Adı Soyadı {i % author_pool}",
+            "isbn": f"978{i:010d}",
+        }
+        for i in range(count)
+    ]
+    return json.dumps(records, ensure_ascii=False)
+
+
+def build_dict(records, book_class):
+    index = {}
+    for data in records:
+        index[data["isbn"]] = book_class(data["title"], data["author"], data["isbn"])
+    return index
+
+
+def build_columnar(records):
+    columns = BookColumns()
+    for data in records:
+        columns[data["isbn"]] = Book(data["title"], data["author"], data["isbn"])
+    return columns
+
+
+def build_library_paged(records, columnar: bool, workdir: str):
+    """Library'yi kurar ve GET /books gibi birkaç sayfa okur"""
+    library = Library(os.path.join(workdir, "yok.json"), columnar=columnar)
+    library.books = [Book(data["title"], data["author"], data["isbn"]) for data in records]
+    after = None
+    for _ in range(10):
+        _, after = library.list_books_page(100, after)
+    return library
+
+
+def measure(raw: str, builder) -> int:
+    """JSON'dan yükleyip kurulan yapının kalıcı bellek kullanımını ölçer"""
+    gc.collect()
+    tracemalloc.start()
+    records = json.loads(raw)
+    structure = builder(records)
+    del records
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del structure
+    return current
+
+
+def main():
+    args = sys.argv[1:]
+    output = None
+    if "--json" in args:
+        position = args.index("--json")
+        output = args[position + 1]
+        del args[position:position + 2]
+    count = int(args[0]) if args else 100_000
+
+    raw = synthetic_catalog_json(count)
+    workdir = tempfile.mkdtemp()
+    results = {
+        "dict_plain": measure(raw, lambda records: build_dict(records, PlainBook)),
+        "dict_slots": measure(raw, lambda records: build_dict(records, Book)),
+        "columnar": measure(raw, build_columnar),
+        "library_dict": measure(raw, lambda records: build_library_paged(records, False, workdir)),
+        "library_columnar": measure(raw, lambda records: build_library_paged(records, True, workdir)),
+    }
+
+    print(f"📏 {count} kitap için kitap başına bellek:")
+    report = {"books": count, "bytes_per_book": {}}
+    for name, total in results.items():
+        per_book = total / count
+        report["bytes_per_book"][name] = round(per_book, 1)
+        print(f"  {name:<16} {per_book:8.1f} bayt/kitap  (toplam {total / 1024 / 1024:.1f} MiB)")
+
+    if output:
+        with open(output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
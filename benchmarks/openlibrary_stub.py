@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Yerel Open Library taklidi (gecikme ve hata enjeksiyonlu)
+
+Library'nin kullandığı iki uç noktayı sunar:
+- GET /isbn/{isbn}.json       baskı kaydı (başlık + yazar anahtarları)
+- GET /authors/{key}.json     yazar kaydı (ad)
+
+Kayıtlar bir fikstür dosyasından okunur; fikstürde olmayan ISBN'ler için
+belirlenimci sentetik kayıt üretilir (1-2 yazarlı, yazarlar sınırlı bir
+havuzdan). Her istek için gecikme, sapma, 404 ve 5xx oranları ayarlanabilir.
+
+Fikstür biçimi:
+  {"editions": {"<isbn>": {...}}, "authors": {"OL1A": {...}}}
+
+Kullanım:
+  python benchmarks/openlibrary_stub.py [--port 8100] [--latency-ms 50]
+      [--jitter-ms 20] [--not-found-rate 0.05] [--error-rate 0.01]
+      [--fixtures fikstür.json] [--seed 1]
+  OPEN_LIBRARY_URL=http://127.0.0.1:8100 python main.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import zlib
+from typing import Optional
+
+from fastapi import FastAPI, HTTPException
+
+
+def create_app(fixtures: Optional[dict] = None, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+               not_found_rate: float = 0.0, error_rate: float = 0.0, author_pool: int = 500,
+               seed: Optional[int] = None) -> FastAPI:
+    """Verilen ayarlarla taklit sunucu uygulamasını oluşturur"""
+    fixtures = fixtures or {}
+    editions = fixtures.get("editions", {})
+    authors = fixtures.get("authors", {})
+    rng = random.Random(seed)
+    stub = FastAPI(title="Open Library Stub")
+    stub.state.requests = {"editions": 0, "authors": 0, "not_found": 0, "errors": 0}
+
+    async def simulate(kind: str) -> None:
+        """Gecikmeyi uygular, gerekirse 5xx hatası üretir"""
+        stub.state.requests[kind] += 1
+        delay = latency_ms + rng.uniform(-jitter_ms, jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if rng.random() < error_rate:
+            stub.state.requests["errors"] += 1
+            raise HTTPException(status_code=503, detail="Servis geçici olarak kullanılamıyor")
+
+    def not_found() -> HTTPException:
+        stub.state.requests["not_found"] += 1
+        return HTTPException(status_code=404, detail="Not found")
+
+    @stub.get("/isbn/{isbn}.json")
+    async def get_edition(isbn: str):
+        await simulate("editions")
+        if isbn in editions:
+            return editions[isbn]
+        # Aynı ISBN her zaman aynı kaydı (ya da 404'ü) döndürür; böylece
+        # farklı içe aktarma yolları aynı veriyle karşılaştırılabilir
+        digest = zlib.crc32(isbn.encode("utf-8"))
+        if (digest % 10_000) < not_found_rate * 10_000:
+            raise not_found()
+        keys = [f"/authors/OL{digest % author_pool}A"]
+        if digest % 4 == 0:
+            keys.append(f"/authors/OL{(digest // 7) % author_pool}A")
+        return {
+            "title": f"Taklit Kitap {isbn}",
+            "authors": [{"key": key} for key in keys],
+            "isbn_13": [isbn],
+        }
+
+    @stub.get("/authors/{key}.json")
+    async def get_author(key: str):
+        await simulate("authors")
+        if key in authors:
+            return authors[key]
+        if not key.startswith("OL"):
+            raise not_found()
+        return {"key": f"/authors/{key}", "name": f"Taklit Yazar {key}"}
+
+    @stub.get("/stats")
+    async def stats():
+        """Sunucuya gelen istek sayıları"""
+        return stub.state.requests
+
+    return stub
+
+
+def load_fixtures(filename: Optional[str]) -> dict:
+    """Fikstür dosyasını okur (verilmezse boş)"""
+    if not filename:
+        return {}
+    with open(filename, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Yerel Open Library taklidi")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Ortalama yanıt gecikmesi")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Gecikmeye eklenen ± sapma")
+    parser.add_argument("--not-found-rate", type=float, default=0.0, help="404 döndürülecek ISBN oranı")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 döndürülecek istek oranı")
+    parser.add_argument("--fixtures", help="Baskı/yazar kayıtlarını içeren JSON dosyası")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir hata dağılımı için tohum")
+    return parser
+
+
+def app_from_args(args: argparse.Namespace) -> FastAPI:
+    return create_app(
+        fixtures=load_fixtures(args.fixtures),
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        not_found_rate=args.not_found_rate,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+
+def main():
+    import uvicorn
+
+    args = build_parser().parse_args()
+    print(f"🧪 Open Library taklidi: http://{args.host}:{args.port} "
+          f"(OPEN_LIBRARY_URL ile Library'yi bu adrese yönlendirin)")
+    uvicorn.run(app_from_args(args), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
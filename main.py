@@ -1,121 +1,217 @@
-#!/usr/bin/env python3
-"""
-Kütüphane Yönetim Sistemi - Terminal Uygulaması
-Aşama 1: OOP ile terminal uygulaması
-Aşama 2: Harici API entegrasyonu
-"""
-
-from models import Book, Library
-
-
-def display_menu():
-    """Ana menüyü gösterir"""
-    print("\n" + "="*50)
-    print("📚 KÜTÜPHANİ YÖNETİM SİSTEMİ")
-    print("="*50)
-    print("1. Kitap Ekle (ISBN ile)")
-    print("2. Kitap Ekle (Manuel)")
-    print("3. Kitap Sil")
-    print("4. Kitapları Listele")
-    print("5. Kitap Ara")
-    print("6. Çıkış")
-    print("-"*50)
-
-
-def add_book_by_isbn(library: Library):
-    """ISBN ile kitap ekler (API kullanarak)"""
-    isbn = input("📖 Kitap ISBN'ini giriniz: ").strip()
-    if not isbn:
-        print("❌ ISBN boş olamaz!")
-        return
-    
-    print("🔍 Kitap bilgileri API'den çekiliyor...")
-    library.add_book(isbn)
-
-
-def add_book_manual(library: Library):
-    """Manuel kitap ekleme"""
-    title = input("📖 Kitap başlığı: ").strip()
-    author = input("👤 Yazar: ").strip()
-    isbn = input("🔢 ISBN: ").strip()
-    
-    if not all([title, author, isbn]):
-        print("❌ Tüm alanları doldurunuz!")
-        return
-    
-    book = Book(title=title, author=author, isbn=isbn)
-    library.add_book_manual(book)
-
-
-def remove_book(library: Library):
-    """Kitap siler"""
-    isbn = input("🗑️  Silinecek kitabın ISBN'ini giriniz: ").strip()
-    if not isbn:
-        print("❌ ISBN boş olamaz!")
-        return
-    
-    library.remove_book(isbn)
-
-
-def list_books(library: Library):
-    """Kitapları listeler"""
-    books = library.list_books()
-    if not books:
-        print("📚 Kütüphanede henüz kitap bulunmuyor.")
-        return
-    
-    print(f"\n📚 KÜTÜPHANEDEKİ KİTAPLAR ({len(books)} adet):")
-    print("-"*80)
-    for i, book in enumerate(books, 1):
-        print(f"{i:2d}. {book}")
-
-
-def search_book(library: Library):
-    """Kitap arar"""
-    isbn = input("🔍 Aranacak kitabın ISBN'ini giriniz: ").strip()
-    if not isbn:
-        print("❌ ISBN boş olamaz!")
-        return
-    
-    book = library.find_book(isbn)
-    if book:
-        print(f"✅ Kitap bulundu: {book}")
-    else:
-        print("❌ Kitap bulunamadı!")
-
-
-def main():
-    """Ana uygulama döngüsü"""
-    print("🚀 Kütüphane Yönetim Sistemi başlatılıyor...")
-    library = Library()
-    
-    while True:
-        try:
-            display_menu()
-            choice = input("Seçiminizi yapınız (1-6): ").strip()
-            
-            if choice == "1":
-                add_book_by_isbn(library)
-            elif choice == "2":
-                add_book_manual(library)
-            elif choice == "3":
-                remove_book(library)
-            elif choice == "4":
-                list_books(library)
-            elif choice == "5":
-                search_book(library)
-            elif choice == "6":
-                print("👋 Güle güle!")
-                break
-            else:
-                print("❌ Geçersiz seçim! Lütfen 1-6 arası bir sayı giriniz.")
-                
-        except KeyboardInterrupt:
-            print("\n\n👋 Program sonlandırıldı. Güle güle!")
-            break
-        except Exception as e:
-            print(f"❌ Beklenmeyen hata: {e}")
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Kütüphane Yönetim Sistemi - Terminal Uygulaması
+Aşama 1: OOP ile terminal uygulaması
+Aşama 2: Harici API entegrasyonu
+
+Etkileşimsiz komutlar:
+    python main.py migrate library.json library.db
+    python main.py import katalog.csv --enrich
+"""
+
+import argparse
+import sys
+
+from models import Book, Library, ResponseCache
+from models.importer import FORMATS, BookImporter
+from models.storage import migrate
+from models.upstream import UpstreamPolicy
+
+
+def display_menu():
+    """Ana menüyü gösterir"""
+    print("\n" + "="*50)
+    print("📚 KÜTÜPHANİ YÖNETİM SİSTEMİ")
+    print("="*50)
+    print("1. Kitap Ekle (ISBN ile)")
+    print("2. Kitap Ekle (Manuel)")
+    print("3. Kitap Sil")
+    print("4. Kitapları Listele")
+    print("5. Kitap Ara (ISBN ile)")
+    print("6. Kitap Ara (Başlık/Yazar)")
+    print("7. Çıkış")
+    print("-"*50)
+
+
+def add_book_by_isbn(library: Library):
+    """ISBN ile kitap ekler (API kullanarak)"""
+    isbn = input("📖 Kitap ISBN'ini giriniz: ").strip()
+    if not isbn:
+        print("❌ ISBN boş olamaz!")
+        return
+    
+    print("🔍 Kitap bilgileri API'den çekiliyor...")
+    library.add_book(isbn)
+
+
+def add_book_manual(library: Library):
+    """Manuel kitap ekleme"""
+    title = input("📖 Kitap başlığı: ").strip()
+    author = input("👤 Yazar: ").strip()
+    isbn = input("🔢 ISBN: ").strip()
+    
+    if not all([title, author, isbn]):
+        print("❌ Tüm alanları doldurunuz!")
+        return
+    
+    book = Book(title=title, author=author, isbn=isbn)
+    library.add_book_manual(book)
+
+
+def remove_book(library: Library):
+    """Kitap siler"""
+    isbn = input("🗑️  Silinecek kitabın ISBN'ini giriniz: ").strip()
+    if not isbn:
+        print("❌ ISBN boş olamaz!")
+        return
+    
+    library.remove_book(isbn)
+
+
+def list_books(library: Library):
+    """Kitapları listeler"""
+    books = library.list_books()
+    if not books:
+        print("📚 Kütüphanede henüz kitap bulunmuyor.")
+        return
+    
+    print(f"\n📚 KÜTÜPHANEDEKİ KİTAPLAR ({len(books)} adet):")
+    print("-"*80)
+    for i, book in enumerate(books, 1):
+        print(f"{i:2d}. {book}")
+
+
+def search_book(library: Library):
+    """Kitap arar"""
+    isbn = input("🔍 Aranacak kitabın ISBN'ini giriniz: ").strip()
+    if not isbn:
+        print("❌ ISBN boş olamaz!")
+        return
+    
+    book = library.find_book(isbn)
+    if book:
+        print(f"✅ Kitap bulundu: {book}")
+    else:
+        print("❌ Kitap bulunamadı!")
+
+
+def search_books_by_text(library: Library):
+    """Başlık veya yazara göre kitap arar"""
+    query = input("🔍 Aranacak başlık/yazar: ").strip()
+    if not query:
+        print("❌ Arama metni boş olamaz!")
+        return
+    
+    books = library.search_books(query)
+    if not books:
+        print("❌ Eşleşen kitap bulunamadı!")
+        return
+    
+    print(f"\n✅ {len(books)} kitap bulundu:")
+    for i, book in enumerate(books, 1):
+        print(f"{i:2d}. {book}")
+
+
+def run_command(argv):
+    """Etkileşimsiz komut satırı komutlarını çalıştırır"""
+    parser = argparse.ArgumentParser(prog="main.py", description="Kütüphane Yönetim Sistemi komutları")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    migrate_parser = subparsers.add_parser("migrate", help="Kataloğu başka bir depolama biçimine taşı")
+    migrate_parser.add_argument("source", help="Kaynak dosya (ör. library.json)")
+    migrate_parser.add_argument("target", help="Hedef dosya (ör. library.db)")
+    
+    import_parser = subparsers.add_parser("import", help="CSV/NDJSON dosyasından toplu kitap içe aktar")
+    import_parser.add_argument("file", help="Kaynak dosya (isbn, title, author alanları)")
+    import_parser.add_argument("--library", default="library.json", help="Hedef katalog dosyası")
+    import_parser.add_argument("--format", choices=FORMATS, help="Dosya biçimi (varsayılan: uzantıdan)")
+    import_parser.add_argument("--enrich", action="store_true",
+                               help="Başlığı/yazarı eksik kayıtları Open Library'den tamamla")
+    import_parser.add_argument("--chunk-size", type=int, default=BookImporter.DEFAULT_CHUNK_SIZE,
+                               help="Tek seferde kaydedilecek kayıt sayısı")
+    import_parser.add_argument("--concurrency", type=int, default=Library.DEFAULT_CONCURRENCY,
+                               help="Zenginleştirmede eşzamanlı Open Library isteği sayısı")
+    import_parser.add_argument("--rate", type=float, default=None,
+                               help="Zenginleştirmede saniyedeki en fazla Open Library isteği")
+    
+    args = parser.parse_args(argv)
+    if args.command == "migrate":
+        count = migrate(args.source, args.target)
+        print(f"✅ {count} kitap {args.source} → {args.target} taşındı")
+    elif args.command == "import":
+        import_books(args)
+
+
+def import_books(args):
+    """main.py import: dosyayı parça parça kataloğa ekler"""
+    # Parçalar günlüğe eklenir; her parçada tüm dosya yeniden yazılmaz,
+    # sonda günlük tek bir anlık görüntüye katlanır
+    upstream = UpstreamPolicy(rate=args.rate, max_concurrency=args.concurrency)
+    library = Library(args.library, journal=True, cache=ResponseCache(), upstream=upstream)
+    try:
+        importer = BookImporter(library, chunk_size=args.chunk_size, enrich=args.enrich,
+                                concurrency=args.concurrency)
+        importer.run(args.file, args.format)
+        if library.journal is not None:
+            library.compact()
+    finally:
+        close_library(library)
+
+
+def main():
+    """Ana uygulama döngüsü"""
+    if len(sys.argv) > 1:
+        run_command(sys.argv[1:])
+        return
+    
+    print("🚀 Kütüphane Yönetim Sistemi başlatılıyor...")
+    # Grup yazımı: çıkışta (library.close) bekleyen değişiklikler diske yazılır
+    library = Library(cache=ResponseCache(), snapshot=True, group_commit=True)
+    
+    try:
+        run_menu(library)
+    finally:
+        close_library(library)
+
+
+def close_library(library: Library):
+    """Bekleyen yazımları diske indirir, ardından önbelleği kapatır (biriken erişim zamanları yazılır)"""
+    library.close()
+    if library.cache is not None:
+        library.cache.close()
+
+
+def run_menu(library: Library):
+    """Etkileşimli menü döngüsü"""
+    while True:
+        try:
+            display_menu()
+            choice = input("Seçiminizi yapınız (1-7): ").strip()
+            
+            if choice == "1":
+                add_book_by_isbn(library)
+            elif choice == "2":
+                add_book_manual(library)
+            elif choice == "3":
+                remove_book(library)
+            elif choice == "4":
+                list_books(library)
+            elif choice == "5":
+                search_book(library)
+            elif choice == "6":
+                search_books_by_text(library)
+            elif choice == "7":
+                print("👋 Güle güle!")
+                break
+            else:
+                print("❌ Geçersiz seçim! Lütfen 1-7 arası bir sayı giriniz.")
+                
+        except KeyboardInterrupt:
+            print("\n\n👋 Program sonlandırıldı. Güle güle!")
+            break
+        except Exception as e:
+            print(f"❌ Beklenmeyen hata: {e}")
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,28 +1,31 @@
-class Book:
-    """Kitap sınıfı - Her bir kitabı temsil eder"""
-    
-    def __init__(self, title: str, author: str, isbn: str):
-        self.title = title
-        self.author = author
-        self.isbn = isbn
-    
-    def __str__(self) -> str:
-        """Kitap bilgilerini okunaklı şekilde döndürür"""
-        return f"{self.title} by {self.author} (ISBN: {self.isbn})"
-    
-    def to_dict(self) -> dict:
-        """Kitap nesnesini sözlüğe çevirir (JSON kayıt için)"""
-        return {
-            "title": self.title,
-            "author": self.author,
-            "isbn": self.isbn
-        }
-    
-    @classmethod
-    def from_dict(cls, data: dict):
-        """Sözlükten kitap nesnesi oluşturur (JSON yükleme için)"""
-        return cls(
-            title=data["title"],
-            author=data["author"],
-            isbn=data["isbn"]
+class Book:
+    """Kitap sınıfı - Her bir kitabı temsil eder"""
+    
+    # Örnek başına __dict__ oluşturulmaz; büyük kataloglarda belleği azaltır
+    __slots__ = ("title", "author", "isbn")
+    
+    def __init__(self, title: str, author: str, isbn: str):
+        self.title = title
+        self.author = author
+        self.isbn = isbn
+    
+    def __str__(self) -> str:
+        """Kitap bilgilerini okunaklı şekilde döndürür"""
+        return f"{self.title} by {self.author} (ISBN: {self.isbn})"
+    
+    def to_dict(self) -> dict:
+        """Kitap nesnesini sözlüğe çevirir (JSON kayıt için)"""
+        return {
+            "title": self.title,
+            "author": self.author,
+            "isbn": self.isbn
+        }
+    
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Sözlükten kitap nesnesi oluşturur (JSON yükleme için)"""
+        return cls(
+            title=data["title"],
+            author=data["author"],
+            isbn=data["isbn"]
         )
\ No newline at end of file
@@ -0,0 +1,178 @@
+import json
+import sqlite3
+import sys
+import threading
+import time
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """Open Library yanıtları için SQLite tabanlı kalıcı önbellek
+
+    Kayıtlar yol anahtarıyla (ör. "/isbn/9780140328721.json") saklanır,
+    böylece önbellek API adresinden bağımsızdır. Süresi (TTL) dolan
+    kayıtlar okunurken silinir; kayıt sayısı sınırı aşılınca en uzun
+    süredir kullanılmayan (LRU) kayıtlar atılır.
+
+    İsabetlerdeki erişim zamanları bellekte biriktirilir ve bir sonraki
+    yazmada, TOUCH_BATCH isabette bir ya da kapanışta tek işlemle yazılır;
+    böylece okumalar diske commit beklemez.
+    """
+
+    DEFAULT_FILENAME = "openlibrary_cache.db"
+    TOUCH_BATCH = 1000
+
+    def __init__(self, filename: str = DEFAULT_FILENAME, ttl: Optional[float] = 30 * 24 * 3600,
+                 max_entries: int = 100_000):
+        self.filename = filename
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # Henüz yazılmamış erişim zamanları (anahtar -> zaman)
+        self._touched: Dict[str, float] = {}
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        # Erişim zamanları sık yazıldığı için WAL ile fsync maliyeti düşürülür
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed ON responses(accessed_at)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[dict]:
+        """Önbellekteki yanıtı döndürür, yoksa veya süresi dolmuşsa None"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            body, stored_at = row
+            if self.ttl is not None and now - stored_at > self.ttl:
+                self._touched.pop(key, None)
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._size -= 1
+                self.misses += 1
+                return None
+            self._touched[key] = now
+            if len(self._touched) >= self.TOUCH_BATCH:
+                self._write_touched()
+                self._conn.commit()
+            self.hits += 1
+        return json.loads(body)
+
+    def _write_touched(self) -> None:
+        """Biriken erişim zamanlarını yazar (kilit altında, commit çağırana kalır)"""
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()],
+            )
+            self._touched = {}
+
+    def set(self, key: str, data: dict) -> None:
+        """Yanıtı önbelleğe yazar, gerekirse eski kayıtları atar"""
+        self._set_many({key: data})
+
+    def _set_many(self, items: Dict[str, dict]) -> None:
+        now = time.time()
+        with self._lock:
+            # LRU sırası güncel olsun diye önce biriken erişimler yazılır
+            self._write_touched()
+            for key, data in items.items():
+                exists = self._conn.execute(
+                    "SELECT 1 FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, stored_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(data, ensure_ascii=False), now, now),
+                )
+                if not exists:
+                    self._size += 1
+            overflow = self._size - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN "
+                    "(SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                    (overflow,),
+                )
+                self._size -= overflow
+            self._conn.commit()
+
+    def seed(self, dump_filename: str) -> int:
+        """Önbelleği bir döküm dosyasından doldurur (çevrimdışı yeniden kurulum için)
+
+        Döküm, her satırı {"key": ..., "data": ...} olan bir NDJSON dosyasıdır
+        (export() ile üretilir). Eklenen kayıt sayısını döndürür.
+        """
+        batch: Dict[str, dict] = {}
+        count = 0
+        with open(dump_filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                batch[record["key"]] = record["data"]
+                if len(batch) >= 1000:
+                    self._set_many(batch)
+                    count += len(batch)
+                    batch = {}
+        if batch:
+            self._set_many(batch)
+            count += len(batch)
+        print(f"🗄️  Önbelleğe {count} yanıt yüklendi")
+        return count
+
+    def export(self, dump_filename: str) -> int:
+        """Önbellekteki tüm yanıtları NDJSON döküm dosyasına yazar"""
+        count = 0
+        with self._lock, open(dump_filename, 'w', encoding='utf-8') as file:
+            for key, body in self._conn.execute("SELECT key, body FROM responses ORDER BY key"):
+                file.write(json.dumps({"key": key, "data": json.loads(body)}, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def stats(self) -> dict:
+        """İsabet/ıskalama sayaçlarını ve kayıt sayısını döndürür"""
+        return {"hits": self.hits, "misses": self.misses, "entries": self._size}
+
+    def clear(self) -> None:
+        """Önbelleği boşaltır"""
+        with self._lock:
+            self._touched = {}
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._size = 0
+
+    def close(self) -> None:
+        """Biriken erişim zamanlarını yazar ve veritabanı bağlantısını kapatır"""
+        with self._lock:
+            self._write_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+if __name__ == "__main__":
+    # Kullanım: python -m models.cache seed|export <döküm.ndjson> [önbellek.db]
+    if len(sys.argv) < 3 or sys.argv[1] not in ("seed", "export"):
+        print("Kullanım: python -m models.cache seed|export <döküm.ndjson> [önbellek.db]")
+        sys.exit(1)
+    cache = ResponseCache(sys.argv[3] if len(sys.argv) > 3 else ResponseCache.DEFAULT_FILENAME)
+    if sys.argv[1] == "seed":
+        cache.seed(sys.argv[2])
+    else:
+        print(f"🗄️  {cache.export(sys.argv[2])} yanıt dışa aktarıldı")
+    cache.close()
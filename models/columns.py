@@ -0,0 +1,90 @@
+from array import array
+from typing import Dict, Iterator, List, MutableMapping, Optional
+from .book import Book
+
+
+class BookColumns(MutableMapping[str, Book]):
+    """Kitapları sütun düzeninde tutan, ISBN anahtarlı sıralı eşleme
+
+    Library'nin dict tabanlı indeksiyle aynı arayüzü sunar, ama kitap başına
+    bir nesne yerine paralel sütunlar kullanır:
+    - başlıklar bir liste,
+    - yazarlar sözlük kodlamalı: her farklı yazar adı bir kez saklanır,
+      satırlarda yalnızca 4 baytlık kimliği tutulur,
+    - ISBN sütunu ile satır eşlemesi aynı str nesnelerini paylaşır.
+    Book nesneleri yalnızca erişildiğinde üretilir. Silinen satırlar boş
+    bırakılır; boşluklar çoğalınca sütunlar sıkıştırılır.
+    """
+
+    _COMPACT_MIN_ROWS = 1024
+
+    def __init__(self):
+        self._rows: Dict[str, int] = {}
+        self._isbns: List[Optional[str]] = []
+        self._titles: List[Optional[str]] = []
+        self._author_ids = array('I')
+        self._authors: List[str] = []
+        self._author_lookup: Dict[str, int] = {}
+        self._deleted = 0
+
+    def _author_id(self, author: str) -> int:
+        author_id = self._author_lookup.get(author)
+        if author_id is None:
+            author_id = len(self._authors)
+            self._authors.append(author)
+            self._author_lookup[author] = author_id
+        return author_id
+
+    def _materialize(self, row: int) -> Book:
+        return Book(
+            title=self._titles[row],
+            author=self._authors[self._author_ids[row]],
+            isbn=self._isbns[row],
+        )
+
+    def __getitem__(self, isbn: str) -> Book:
+        return self._materialize(self._rows[isbn])
+
+    def __setitem__(self, isbn: str, book: Book) -> None:
+        row = self._rows.get(isbn)
+        if row is None:
+            # Yeni satır sona eklenir (dict gibi ekleme sırası korunur)
+            self._rows[isbn] = len(self._isbns)
+            self._isbns.append(isbn)
+            self._titles.append(book.title)
+            self._author_ids.append(self._author_id(book.author))
+        else:
+            self._titles[row] = book.title
+            self._author_ids[row] = self._author_id(book.author)
+
+    def __delitem__(self, isbn: str) -> None:
+        row = self._rows.pop(isbn)
+        self._isbns[row] = None
+        self._titles[row] = None
+        self._deleted += 1
+        if self._deleted > self._COMPACT_MIN_ROWS and self._deleted * 2 > len(self._isbns):
+            self._compact()
+
+    def __contains__(self, isbn: object) -> bool:
+        return isbn in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        for isbn in self._isbns:
+            if isbn is not None:
+                yield isbn
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def values(self):
+        """Kitapları satır sırasıyla üretir (anahtar araması yapmadan)"""
+        return [self._materialize(row) for row, isbn in enumerate(self._isbns) if isbn is not None]
+
+    def _compact(self) -> None:
+        """Silinmiş satırları atarak sütunları yeniden kurar"""
+        live = [row for row, isbn in enumerate(self._isbns) if isbn is not None]
+        self._isbns = [self._isbns[row] for row in live]
+        self._titles = [self._titles[row] for row in live]
+        self._author_ids = array('I', (self._author_ids[row] for row in live))
+        self._rows = {isbn: row for row, isbn in enumerate(self._isbns)}
+        self._deleted = 0
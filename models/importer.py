@@ -0,0 +1,176 @@
+import csv
+import json
+import os
+import re
+import time
+from typing import Dict, Iterator, List, Optional
+from .book import Book
+from .library import Library
+
+
+# Tire ve boşluklar atıldıktan sonra 10 (son hane X olabilir) ya da 13 haneli ISBN
+ISBN_PATTERN = re.compile(r"^(\d{9}[\dX]|\d{13})$")
+
+FORMATS = ("csv", "ndjson")
+_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+
+def detect_format(filename: str) -> str:
+    """Dosya uzantısından içe aktarma biçimini belirler"""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Desteklenmeyen dosya biçimi: {filename} (.csv, .ndjson veya .jsonl)")
+    return _EXTENSIONS[extension]
+
+
+def iter_records(filename: str, file_format: Optional[str] = None) -> Iterator[dict]:
+    """CSV ya da NDJSON dosyasını satır satır okur
+
+    Dosyanın tamamı belleğe alınmaz. Alan adları küçük harfe çevrilir;
+    NDJSON'da ayrıştırılamayan satırlar boş kayıt olarak döner (geçersiz
+    sayılır).
+    """
+    file_format = file_format or detect_format(filename)
+    with open(filename, 'r', encoding='utf-8-sig', newline='') as file:
+        if file_format == "csv":
+            for row in csv.DictReader(file):
+                yield {key.strip().lower(): value for key, value in row.items() if key}
+            return
+        for line in file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = None
+            yield {str(key).lower(): value for key, value in record.items()} if isinstance(record, dict) else {}
+
+
+def normalize_isbn(isbn: str) -> str:
+    """Tire ve boşlukları atar, X'i büyük harfe çevirir (tekilleştirme ve kayıt biçimi)"""
+    return re.sub(r"[\s-]", "", isbn).upper()
+
+
+def _is_valid_normalized(isbn: str) -> bool:
+    """Normalize edilmiş ISBN'in biçimi ve kontrol hanesi doğru mu"""
+    if not ISBN_PATTERN.match(isbn):
+        return False
+    if len(isbn) == 10:
+        total = sum((10 - i) * (10 if digit == "X" else int(digit)) for i, digit in enumerate(isbn))
+        return total % 11 == 0
+    total = sum(int(digit) * (3 if i % 2 else 1) for i, digit in enumerate(isbn))
+    return total % 10 == 0
+
+
+def is_valid_isbn(isbn: str) -> bool:
+    """ISBN-10/ISBN-13 biçim ve kontrol hanesi doğrulaması (tire ve boşluklar yok sayılır)"""
+    return _is_valid_normalized(normalize_isbn(isbn))
+
+
+class BookImporter:
+    """CSV/NDJSON dosyalarından kataloğa toplu içe aktarma
+
+    Kayıtlar akış halinde okunur, doğrulanır ve hem dosya içinde hem de
+    katalogdaki ISBN'lere karşı tekilleştirilir; ISBN'ler normalize
+    edilmiş halleriyle (tiresiz, büyük X) karşılaştırılır ve kaydedilir. Başlığı ya da yazarı eksik
+    kayıtlar enrich=True ise Open Library'den eşzamanlı olarak tamamlanır.
+    Geçerli kayıtlar chunk_size'lık parçalar halinde tek seferde kaydedilir;
+    her parçadan sonra ilerleme ve hız yazdırılır.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(self, library: Library, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 enrich: bool = False, concurrency: int = Library.DEFAULT_CONCURRENCY):
+        self.library = library
+        self.chunk_size = chunk_size
+        self.enrich = enrich
+        self.concurrency = concurrency
+        self.stats: Dict[str, int] = {}
+        self._seen: set = set()
+        self._started = 0.0
+
+    def run(self, filename: str, file_format: Optional[str] = None) -> Dict[str, int]:
+        """Dosyayı içe aktarır ve sayaçları döndürür
+
+        Sayaçlar: read, added, duplicate, invalid, enriched, not_found ve
+        errors (zenginleştirmede bağlantı/5xx hatası alınan kayıtlar).
+        """
+        self.stats = {"read": 0, "added": 0, "duplicate": 0, "invalid": 0, "enriched": 0,
+                      "not_found": 0, "errors": 0}
+        self._seen = set()
+        self._started = time.perf_counter()
+        complete: List[Book] = []
+        partial: List[dict] = []
+        for record in iter_records(filename, file_format):
+            self.stats["read"] += 1
+            row = self._validate(record)
+            if row is None:
+                continue
+            if row["title"] and row["author"]:
+                complete.append(Book(row["title"], row["author"], row["isbn"]))
+            else:
+                partial.append(row)
+            if len(complete) + len(partial) >= self.chunk_size:
+                self._commit(complete, partial)
+                complete, partial = [], []
+        if complete or partial:
+            self._commit(complete, partial)
+        self._print_progress(final=True)
+        return self.stats
+
+    def _validate(self, record: dict) -> Optional[dict]:
+        """Kaydı doğrular ve tekilleştirir; geçersiz ya da tekrar ise None"""
+        isbn = normalize_isbn(str(record.get("isbn") or ""))
+        title = str(record.get("title") or "").strip()
+        author = str(record.get("author") or "").strip()
+        if not _is_valid_normalized(isbn) or (not self.enrich and not (title and author)):
+            self.stats["invalid"] += 1
+            return None
+        if isbn in self._seen or self.library.find_book(isbn) is not None:
+            self.stats["duplicate"] += 1
+            return None
+        self._seen.add(isbn)
+        return {"isbn": isbn, "title": title, "author": author}
+
+    def _commit(self, complete: List[Book], partial: List[dict]) -> None:
+        """Bir parçayı (gerekirse zenginleştirip) tek seferde kaydeder"""
+        books = complete + self._enrich(partial) if partial else complete
+        if books:
+            report = self.library.add_books_manual(books)
+            for status in report.values():
+                key = "added" if status == Library.STATUS_ADDED else "duplicate"
+                self.stats[key] += 1
+        self._print_progress()
+
+    def _enrich(self, rows: List[dict]) -> List[Book]:
+        """Eksik başlık/yazar alanlarını Open Library'den eşzamanlı tamamlar
+        
+        fetch_books bulunamayan ISBN'leri None ile döndürür, hata alınanları
+        hiç döndürmez; ikincisi not_found değil errors olarak sayılır.
+        """
+        fetched = self.library.fetch_books([row["isbn"] for row in rows], concurrency=self.concurrency)
+        books: List[Book] = []
+        for row in rows:
+            if row["isbn"] not in fetched:
+                self.stats["errors"] += 1
+                continue
+            remote = fetched[row["isbn"]]
+            if remote is None:
+                self.stats["not_found"] += 1
+                continue
+            self.stats["enriched"] += 1
+            books.append(Book(row["title"] or remote.title, row["author"] or remote.author, row["isbn"]))
+        return books
+
+    def _print_progress(self, final: bool = False) -> None:
+        elapsed = time.perf_counter() - self._started
+        rate = self.stats["read"] / elapsed if elapsed > 0 else 0.0
+        prefix = "✅ İçe aktarma tamamlandı:" if final else "⏳"
+        print(
+            f"{prefix} {self.stats['read']} satır okundu, {self.stats['added']} eklendi, "
+            f"{self.stats['duplicate']} tekrar, {self.stats['invalid']} geçersiz, "
+            f"{self.stats['errors']} hata "
+            f"({rate:.0f} satır/sn, {elapsed:.1f} sn)"
+        )
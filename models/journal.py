@@ -0,0 +1,81 @@
+import json
+import os
+from typing import Iterator, List, Tuple
+
+
+class Journal:
+    """Yalnızca sona eklenen değişiklik günlüğü - her satır bir JSON kaydıdır"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+
+    def append(self, entries: List[dict], fsync: bool = False) -> int:
+        """Kayıtları günlüğün sonuna ekler, yazılan bayt sayısını döndürür
+        
+        fsync=True ise kayıtlar dönmeden önce diske indirilir.
+        """
+        payload = "".join(
+            json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries
+        ).encode("utf-8")
+        with open(self.filename, 'ab+') as file:
+            # Çökmeyle yarım kalmış satır yeni kayıtlarla birleşmesin
+            if file.tell() > 0:
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    payload = b"\n" + payload
+            file.write(payload)
+            if fsync:
+                file.flush()
+                os.fsync(file.fileno())
+        return len(payload)
+
+    def replay(self) -> Iterator[dict]:
+        """Günlükteki kayıtları yazıldıkları sırayla döndürür"""
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # Yarım kalmış son satır (ör. çökme sırasında) atlanır
+                    print(f"Günlükte bozuk kayıt atlandı: {line[:50]}")
+
+    def read_from(self, offset: int) -> Tuple[List[dict], int]:
+        """offset baytından itibaren tamamlanmış satırları okur
+        
+        Başka bir sürecin yazmakta olduğu son satır (henüz satır sonu yoksa)
+        okunmaz. Kayıtları ve bir sonraki okuma için offset'i döndürür.
+        """
+        try:
+            with open(self.filename, 'rb') as file:
+                file.seek(offset)
+                data = file.read()
+        except FileNotFoundError:
+            return [], offset
+        end = data.rfind(b"\n") + 1
+        entries = []
+        for line in data[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                print(f"Günlükte bozuk kayıt atlandı: {line[:50]!r}")
+        return entries, offset + end
+
+    def size(self) -> int:
+        """Günlük dosyasının bayt cinsinden boyutu"""
+        try:
+            return os.path.getsize(self.filename)
+        except OSError:
+            return 0
+
+    def clear(self) -> None:
+        """Günlüğü siler (anlık görüntü yazıldıktan sonra çağrılır)"""
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
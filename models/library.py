@@ -1,126 +1,1375 @@
-import json
-import os
-import httpx
-from typing import List, Optional
-from .book import Book
-
-
-class Library:
-    """Kütüphane sınıfı - Tüm kütüphane operasyonlarını yönetir"""
-    
-    def __init__(self, filename: str = "library.json"):
-        self.filename = filename
-        self.books: List[Book] = []
-        self.load_books()
-    
-    def add_book_manual(self, book: Book) -> bool:
-        """Manuel olarak Book nesnesi ekler"""
-        # ISBN benzersizliği kontrolü
-        if self.find_book(book.isbn):
-            print(f"ISBN {book.isbn} ile bir kitap zaten mevcut!")
-            return False
-        
-        self.books.append(book)
-        self.save_books()
-        print(f"Kitap başarıyla eklendi: {book}")
-        return True
-    
-    def add_book(self, isbn: str) -> bool:
-        """ISBN ile API'den kitap bilgilerini çekerek ekler (Aşama 2)"""
-        # ISBN benzersizliği kontrolü
-        if self.find_book(isbn):
-            print(f"ISBN {isbn} ile bir kitap zaten mevcut!")
-            return False
-        
-        try:
-            # Open Library API'sine istek gönder
-            with httpx.Client() as client:
-                response = client.get(f"https://openlibrary.org/isbn/{isbn}.json", timeout=10)
-                
-                if response.status_code == 404:
-                    print("Kitap bulunamadı. Lütfen geçerli bir ISBN giriniz.")
-                    return False
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                # Kitap bilgilerini çıkar
-                title = data.get("title", "Bilinmeyen Başlık")
-                
-                # Yazar bilgisini çıkar (karmaşık yapı olabilir)
-                authors = []
-                if "authors" in data:
-                    for author_ref in data["authors"]:
-                        author_key = author_ref["key"]
-                        # Yazar detaylarını çek
-                        author_response = client.get(f"https://openlibrary.org{author_key}.json", timeout=10)
-                        if author_response.status_code == 200:
-                            author_data = author_response.json()
-                            authors.append(author_data.get("name", "Bilinmeyen Yazar"))
-                
-                author = ", ".join(authors) if authors else "Bilinmeyen Yazar"
-                
-                # Kitap nesnesini oluştur ve ekle
-                book = Book(title=title, author=author, isbn=isbn)
-                self.books.append(book)
-                self.save_books()
-                print(f"✅ Kitap başarıyla eklendi: {book}")
-                print(f"📊 Toplam kitap sayısı: {len(self.books)}")
-                return True
-                
-        except httpx.RequestError:
-            print("İnternet bağlantısı hatası. Lütfen bağlantınızı kontrol edin.")
-            return False
-        except httpx.HTTPStatusError:
-            print("API'den veri çekilirken hata oluştu.")
-            return False
-        except Exception as e:
-            print(f"Beklenmeyen hata: {str(e)}")
-            return False
-    
-    def remove_book(self, isbn: str) -> bool:
-        """ISBN numarasına göre kitap siler"""
-        book = self.find_book(isbn)
-        if book:
-            self.books.remove(book)
-            self.save_books()
-            print(f"Kitap başarıyla silindi: {book}")
-            return True
-        else:
-            print("Kitap bulunamadı!")
-            return False
-    
-    def list_books(self) -> List[Book]:
-        """Kütüphanedeki tüm kitapları listeler"""
-        return self.books
-    
-    def find_book(self, isbn: str) -> Optional[Book]:
-        """ISBN ile kitap arar"""
-        for book in self.books:
-            if book.isbn == isbn:
-                return book
-        return None
-    
-    def load_books(self) -> None:
-        """JSON dosyasından kitapları yükler"""
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as file:
-                    data = json.load(file)
-                    self.books = [Book.from_dict(book_data) for book_data in data]
-                print(f"{len(self.books)} kitap yüklendi.")
-            except (json.JSONDecodeError, KeyError) as e:
-                print(f"JSON dosyası okunamadı: {e}")
-                self.books = []
-        else:
-            print("Veri dosyası bulunamadı, yeni kütüphane oluşturuluyor.")
-            self.books = []
-    
-    def save_books(self) -> None:
-        """Kitapları JSON dosyasına kaydeder"""
-        try:
-            with open(self.filename, 'w', encoding='utf-8') as file:
-                json.dump([book.to_dict() for book in self.books], file, indent=2, ensure_ascii=False)
-            print(f"💾 {len(self.books)} kitap {self.filename} dosyasına kaydedildi")
-        except Exception as e:
-            print(f"Kitaplar kaydedilirken hata oluştu: {e}")
\ No newline at end of file
+import asyncio
+import os
+import threading
+import time
+import uuid
+import httpx
+from bisect import bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Deque, Dict, Iterable, List, MutableMapping, Optional, Tuple
+from .book import Book
+from .cache import ResponseCache
+from .columns import BookColumns
+from .journal import Journal
+from .metrics import SAVE_BYTES, SAVE_DURATION, UPSTREAM_ERRORS, UPSTREAM_LATENCY
+from .snapshot import (BookSnapshot, SnapshotIndex, SnapshotView, snapshot_is_fresh, source_stamp,
+                       write_snapshot)
+from .storage import JsonStorage, SqliteStorage, StorageBackend, apply_entries, open_storage
+from .search import SearchIndex
+from .singleflight import SingleFlight
+from .upstream import CircuitOpenError, UpstreamPolicy
+from .writer import GroupCommitWriter
+
+
+class CatalogView:
+    """Kataloğun belirli bir sürümdeki değişmez görünümü
+    
+    books ve seqs listeleri yayımlandıktan sonra değiştirilmez; yeni bir
+    değişiklik yeni bir görünüm oluşturur. Anlık görüntü modunda görünüm
+    yalnızca değişiklik katmanının kopyasını tutar: sayfalar kayıtlardan
+    doğrudan kesilir, tam liste ilk istendiğinde (kilitsiz) kurulur.
+    """
+    
+    def __init__(self, version: int, books: Optional[List[Book]] = None,
+                 seqs: Optional[List[int]] = None, source: Optional[SnapshotView] = None,
+                 revision: str = ""):
+        self.version = version
+        # Görünümün ETag'i; kurulduğu anda yazıcı kilidi altında belirlenir
+        self.revision = revision
+        self._source = source
+        self._ordered = (books, seqs) if source is None else None
+    
+    def _materialize(self) -> Tuple[List[Book], List[int]]:
+        ordered = self._ordered
+        if ordered is None:
+            ordered = self._ordered = self._source.ordered()
+        return ordered
+    
+    @property
+    def books(self) -> List[Book]:
+        return self._materialize()[0]
+    
+    @property
+    def seqs(self) -> List[int]:
+        return self._materialize()[1]
+    
+    def page(self, limit: int, after: Optional[int] = None) -> Tuple[List[Book], Optional[int]]:
+        """after sıra numarasından sonraki en fazla limit kitap ve sonraki sayfanın after değeri"""
+        if self._ordered is None:
+            return self._source.page(limit, after)
+        books, seqs = self._ordered
+        start = 0 if after is None else bisect_right(seqs, after)
+        end = start + limit
+        next_after = seqs[end - 1] if end < len(books) else None
+        return books[start:end], next_after
+
+
+class Library:
+    """Kütüphane sınıfı - Tüm kütüphane operasyonlarını yönetir
+    
+    İş parçacığı güvenlidir: değişiklikler tek bir yazıcı kilidiyle sıraya
+    girer, okuyucular kilit almadan yayımlanmış değişmez görünümleri
+    (CatalogView) ve ISBN indeksini kullanır.
+    """
+    
+    JOURNAL_SUFFIX = JsonStorage.JOURNAL_SUFFIX
+    SNAPSHOT_SUFFIX = ".snap"
+    OPEN_LIBRARY_URL = "https://openlibrary.org"
+    # Yerel test sunucusu gibi farklı bir adres için ortam değişkeni
+    BASE_URL_ENV = "OPEN_LIBRARY_URL"
+    DEFAULT_CONCURRENCY = 10
+    DEFAULT_MAX_CONNECTIONS = 20
+    # İmleç çözümü için saklanan en fazla silinmiş ISBN sayısı
+    REMOVED_SEQS_MAX = 100_000
+    # Değişiklik kaydında tutulan en fazla (sürüm, sıra numarası) çifti
+    CHANGE_LOG_MAX = 10_000
+    
+    # Toplu eklemede ISBN başına sonuç durumları
+    STATUS_ADDED = "added"
+    STATUS_DUPLICATE = "duplicate"
+    STATUS_NOT_FOUND = "not_found"
+    STATUS_ERROR = "error"
+    # Toplu silmede ISBN başına sonuç durumu (bulunamayanlar STATUS_NOT_FOUND)
+    STATUS_REMOVED = "removed"
+    # Bu kadar kitap tek seferde silinince günlük beklemeden anlık görüntüye katlanır
+    BULK_COMPACT_MIN = 1000
+    # SQLite görünümünün değişiklik katmanı bu boyuta ulaşınca görünüm yenilenir
+    SNAPSHOT_REBASE_MIN = 10_000
+    
+    def __init__(self, filename: str = "library.json", journal: bool = False,
+                 compact_threshold: int = 1024 * 1024, cache: Optional[ResponseCache] = None,
+                 client: Optional[httpx.Client] = None,
+                 async_client: Optional[httpx.AsyncClient] = None,
+                 http2: bool = False, limits: Optional[httpx.Limits] = None,
+                 columnar: bool = False, storage: Optional[StorageBackend] = None,
+                 background_load: bool = False, snapshot: bool = False,
+                 base_url: Optional[str] = None, shared: bool = False,
+                 group_commit: bool = False,
+                 commit_interval: float = GroupCommitWriter.DEFAULT_INTERVAL,
+                 commit_threshold: int = GroupCommitWriter.DEFAULT_MAX_PENDING,
+                 upstream: Optional[UpstreamPolicy] = None):
+        # Depolama arka ucu: verilmezse uzantıya göre seçilir
+        # (.db/.sqlite -> SQLite, diğerleri -> JSON + isteğe bağlı günlük)
+        # Paylaşımlı mod: aynı dosyayı kullanan birden çok süreç (ör. uvicorn
+        # --workers) yazmaları kilitle sıraya sokar, birbirinin değişikliklerini
+        # refresh() ile artımlı olarak uygular
+        self.shared = shared
+        self.storage = storage or open_storage(
+            filename, journal=journal, compact_threshold=compact_threshold, shared=shared,
+            fsync=group_commit,
+        )
+        # Sütunlu mod: kitaplar Book nesneleri yerine sıkıştırılmış sütunlarda
+        # tutulur, Book nesneleri erişildiğinde üretilir (çok büyük kataloglar için)
+        self.columnar = columnar
+        # İkili anlık görüntü modu: library.json'un yanında mmap ile açılan
+        # <dosya>.snap tutulur; açılış kayıt sayısından bağımsızdır ve kayıtlar
+        # erişildikçe çözülür. JSON daha yeniyse yüklemede yeniden üretilir.
+        # SQLite'ta satırlar yüklenmez, açık bir okuma işleminden erişildikçe
+        # sorgulanır (SqliteSnapshot).
+        self.snapshot = snapshot and isinstance(self.storage, (JsonStorage, SqliteStorage))
+        # Open Library yanıtları için isteğe bağlı kalıcı önbellek
+        self.cache = cache
+        # Open Library adresi: parametre > ortam değişkeni > openlibrary.org
+        self.base_url = (base_url or os.environ.get(self.BASE_URL_ENV) or self.OPEN_LIBRARY_URL).rstrip("/")
+        # Open Library çağrı politikası: hız sınırı, eşzamanlılık sınırı,
+        # yeniden deneme ve devre kesici (varsayılanlar ortam değişkenlerinden)
+        self.upstream = upstream or UpstreamPolicy.from_env()
+        # Uzun ömürlü HTTP istemcileri: dışarıdan verilebilir (testler, benchmark'lar)
+        # ya da ilk kullanımda bağlantı havuzu ayarlarıyla oluşturulur
+        self.client = client
+        self.async_client = async_client
+        self._owns_client = client is None
+        self._owns_async_client = async_client is None
+        self._io_executor: Optional[ThreadPoolExecutor] = None
+        # Grup yazımı: değişiklikler arka planda biriktirilir, commit_interval
+        # saniyede ya da commit_threshold kayıtta bir kez (tek fsync ile) yazılır.
+        # Değiştiren metotlar durable=False ile yazımı beklemeden döner.
+        self._writer: Optional[GroupCommitWriter] = None
+        if group_commit:
+            self._writer = GroupCommitWriter(
+                self._commit_group, interval=commit_interval, max_pending=commit_threshold
+            )
+        # Yazar anahtarı -> ad; oturum boyunca aynı yazar yeniden çekilmez
+        self._author_names: Dict[str, str] = {}
+        # Süren Open Library çekmeleri ve eklemeler: aynı ISBN/yazar için
+        # eşzamanlı istekler tek bir çekmeyi ve tek bir eklemeyi paylaşır
+        self._flights = SingleFlight()
+        self.http2 = http2
+        self.limits = limits or httpx.Limits(
+            max_connections=self.DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=self.DEFAULT_MAX_CONNECTIONS,
+            keepalive_expiry=30,
+        )
+        # Yazıcılar (indeks değişiklikleri) ve disk yazımları için kilitler;
+        # sıralama her zaman: _persist_lock -> depo kilidi -> _write_lock
+        self._write_lock = threading.RLock()
+        self._persist_lock = threading.RLock()
+        # ISBN -> Book birincil indeksi; dict ekleme sırasını korur
+        self._index: MutableMapping[str, Book] = self._new_index()
+        # ISBN -> ekleme sıra numarası; silme/ekleme olsa da sayfalama imleçleri
+        # bu artan numaralara dayandığı için kararlı kalır
+        self._seqs: Dict[str, int] = {}
+        self._next_seq = 0
+        # Sıra numarası -> ISBN (silinenler None); sayfalar kataloğu
+        # kopyalamadan buradan kesilir. _slots[i], _slot_base + i numarasıdır.
+        # Anlık görüntü indeksi kendi sayfalamasını yaptığından orada None.
+        self._slots: Optional[List[Optional[str]]] = []
+        self._slot_base = 0
+        # Silinen ISBN -> silinmeden önceki sıra numarası; imleçteki ISBN
+        # silinmiş olsa da sayfalama kaldığı yerden sürer (tam yüklemede sıfırlanır)
+        self._removed_seqs: Dict[str, int] = {}
+        # Henüz depoya yazılmamış yerel değişiklik sayısı; sıfırken katalog
+        # depodaki sürümle aynıdır ve paylaşımlı modda ETag depodan türetilir
+        self._pending = 0
+        # (sürüm, sıra numarası) değişiklik kaydı: önbellekler yalnızca
+        # etkilenen sayfaları atabilsin diye; _log_floor'dan sonraki tüm
+        # değişiklikler kayıttadır
+        self._change_log: Deque[Tuple[int, int]] = deque(maxlen=self.CHANGE_LOG_MAX)
+        self._log_floor = 0
+        # Son yayımlanan sıralı görünüm; değişiklikte None olur, ilk okumada kurulur
+        self._view: Optional[CatalogView] = None
+        # Her değişiklikte artan sürüm; örnek kimliğiyle birlikte HTTP ETag'lerine
+        # temel olur (yeniden başlatılan süreç eski ETag'lerle eşleşmez)
+        self.version = 0
+        self.instance_id = uuid.uuid4().hex[:12]
+        # Başlık/yazar ters indeksi; ilk aramada kurulur, sonra indeksle
+        # birlikte güncellenir
+        self.search_index = SearchIndex()
+        self._search_ready = False
+        # Yerine yenisi yayımlanan anlık görüntü: kilitsiz okuyucuların elinde
+        # kalmış eski görünümler kapanmış dosyaya erişmesin diye bir yayım
+        # daha açık tutulur, sonra kapatılır
+        self._retired_snapshot: Optional[BookSnapshot] = None
+        # Arka planda yüklemede ISBN aramaları yükleme sürerken yanıtlanır;
+        # bulunamayan ISBN'ler ve tüm liste/değişiklik işlemleri yüklemeyi bekler
+        self._loaded = threading.Event()
+        if background_load:
+            threading.Thread(target=self.load_books, name="library-loader", daemon=True).start()
+        else:
+            self.load_books()
+    
+    @property
+    def books(self) -> List[Book]:
+        """Kitapları ekleme sırasıyla döndürür (indeksten türetilir)"""
+        return self._ordered()[0]
+    
+    @books.setter
+    def books(self, books: List[Book]) -> None:
+        """Kitap listesini değiştirir ve indeksi yeniden kurar"""
+        self.wait_until_loaded()
+        with self._write_lock:
+            index, seqs = self._new_index(), {}
+            for book in books:
+                self._append_loaded(index, seqs, book)
+            self._publish_index(index, seqs)
+            self._pending += 1
+    
+    @property
+    def loading(self) -> bool:
+        """Arka planda yükleme sürüyorsa True"""
+        return not self._loaded.is_set()
+    
+    def wait_until_loaded(self, timeout: Optional[float] = None) -> bool:
+        """Yükleme bitene kadar bekler"""
+        return self._loaded.wait(timeout)
+    
+    async def _wait_until_loaded_async(self) -> None:
+        """Yükleme sürüyorsa olay döngüsünü bloklamadan bekler"""
+        if self.loading:
+            await asyncio.to_thread(self._loaded.wait)
+    
+    def _append_loaded(self, index: MutableMapping[str, Book], seqs: MutableMapping[str, int],
+                       book: Book, replace: bool = False) -> None:
+        """Yükleme sırasında kitabı verilen indekse ekler (arama indeksi sonra kurulur)"""
+        if book.isbn not in index:
+            seqs[book.isbn] = self._next_seq
+            self._next_seq += 1
+        elif not replace:
+            return
+        index[book.isbn] = book
+    
+    def _remove_loaded(self, index: MutableMapping[str, Book], seqs: MutableMapping[str, int],
+                       isbn: str) -> None:
+        """Yükleme sırasında günlükteki silme kaydını uygular"""
+        if index.pop(isbn, None) is not None:
+            del seqs[isbn]
+    
+    def _publish_index(self, index: MutableMapping[str, Book], seqs: MutableMapping[str, int]) -> None:
+        """Yeni kurulan indeksi tek adımda yayımlar (yazıcı kilidi altında)"""
+        self._retire_index(index)
+        self._index = index
+        self._seqs = seqs
+        self._removed_seqs = {}
+        self._build_slots()
+        self._invalidate()
+        # Sıra numaraları değişti: önceki sürümlerden artımlı izlenemez
+        self._change_log.clear()
+        self._log_floor = self.version
+        # Arama indeksi ilk aramaya ertelenir; yükleme süresi aramadan bağımsızdır
+        self.search_index = SearchIndex()
+        self._search_ready = False
+    
+    def _retire_index(self, index: MutableMapping[str, Book]) -> None:
+        """Yerini index'e bırakan anlık görüntü indeksinin dosyasını kapatmaya alır"""
+        old = self._index
+        if old is index or not isinstance(old, SnapshotIndex):
+            return
+        retired, self._retired_snapshot = self._retired_snapshot, old.snapshot
+        if retired is not None:
+            retired.close()
+    
+    def _build_slots(self) -> None:
+        """Sıra numarası -> ISBN tablosunu yayımlanan indeksten kurar"""
+        if isinstance(self._index, SnapshotIndex):
+            self._slots = None
+            return
+        seqs = self._seqs
+        base = min(seqs.values(), default=self._next_seq)
+        slots: List[Optional[str]] = [None] * (self._next_seq - base)
+        for isbn, seq in seqs.items():
+            slots[seq - base] = isbn
+        self._slots, self._slot_base = slots, base
+    
+    def _new_index(self) -> MutableMapping[str, Book]:
+        """Moda göre boş birincil indeks oluşturur"""
+        return BookColumns() if self.columnar else {}
+    
+    def view(self) -> CatalogView:
+        """Kataloğun güncel değişmez görünümü
+        
+        Yayımlanmış bir görünüm varsa kilitsiz döndürülür; değişiklikten
+        sonraki ilk okuma görünümü yazıcı kilidi altında bir kez kurar.
+        Anlık görüntü modunda kilit altında yalnızca değişiklik katmanı
+        kopyalanır, kayıtlar çözülmez. Sütunlu modda tam liste her çağrıda
+        yeniden üretilir ve saklanmaz: Book nesnelerini kalıcı tutmak
+        sütunların bellek kazancını yok ederdi (sayfalar zaten görünüm
+        kullanmaz).
+        """
+        self.wait_until_loaded()
+        view = self._view
+        if view is None:
+            with self._write_lock:
+                view = self._view
+                if view is None:
+                    if isinstance(self._index, SnapshotIndex):
+                        view = CatalogView(self.version, source=self._index.freeze(),
+                                           revision=self.revision)
+                    else:
+                        books = list(self._index.values())
+                        seqs = [self._seqs[book.isbn] for book in books]
+                        view = CatalogView(self.version, books, seqs, revision=self.revision)
+                    if not self.columnar:
+                        self._view = view
+        return view
+    
+    def _ordered(self) -> Tuple[List[Book], List[int]]:
+        """Ekleme sırasındaki kitap listesi ve hizalı sıra numaraları"""
+        view = self.view()
+        return view.books, view.seqs
+    
+    def _invalidate(self) -> None:
+        """Yayımlanmış görünümü geçersiz kılar ve sürümü artırır"""
+        self._view = None
+        self.version += 1
+    
+    def _insert(self, book: Book, replace: bool = True, local: bool = True) -> bool:
+        """Kitabı indekse ekler
+        
+        replace=False ise ISBN zaten varsa hiçbir şey yapmadan False döndürür;
+        kontrol ve ekleme aynı kilit altında olduğundan eşzamanlı iki ekleme
+        aynı ISBN'i iki kez ekleyemez. local=False depodan okunan (henüz
+        yazılması gerekmeyen) değişiklikler içindir.
+        """
+        self.wait_until_loaded()
+        with self._write_lock:
+            previous = self._index.get(book.isbn)
+            if previous is not None:
+                if not replace:
+                    return False
+                if self._search_ready:
+                    self.search_index.remove(previous)
+            else:
+                self._seqs[book.isbn] = self._next_seq
+                if self._slots is not None:
+                    slots = self._slots
+                    slots.extend([None] * (self._next_seq - self._slot_base - len(slots)))
+                    slots.append(book.isbn)
+                self._next_seq += 1
+            self._index[book.isbn] = book
+            self._invalidate()
+            self._log_change(self._seqs[book.isbn])
+            if local:
+                self._pending += 1
+            if self._search_ready:
+                self.search_index.add(book)
+            return True
+    
+    def _delete(self, isbn: str, local: bool = True) -> Optional[Book]:
+        """Kitabı indeksten çıkarır"""
+        self.wait_until_loaded()
+        with self._write_lock:
+            seq = self._seqs.get(isbn)
+            book = self._index.pop(isbn, None)
+            if book is not None:
+                del self._seqs[isbn]
+                if self._slots is not None:
+                    self._slots[seq - self._slot_base] = None
+                self._remember_removed(isbn, seq)
+                self._invalidate()
+                self._log_change(seq)
+                if local:
+                    self._pending += 1
+                if self._search_ready:
+                    self.search_index.remove(book)
+            return book
+    
+    def _remember_removed(self, isbn: str, seq: int) -> None:
+        """Silinen ISBN'in sıra numarasını imleçler için saklar (en eskisi atılarak)"""
+        removed = self._removed_seqs
+        removed.pop(isbn, None)
+        removed[isbn] = seq
+        if len(removed) > self.REMOVED_SEQS_MAX:
+            del removed[next(iter(removed))]
+    
+    def _log_change(self, seq: int) -> None:
+        """Güncel sürümde değişen sıra numarasını kaydeder (yazıcı kilidi altında)"""
+        log = self._change_log
+        if len(log) == log.maxlen:
+            self._log_floor = log[0][0]
+        log.append((self.version, seq))
+    
+    def changes_since(self, version: Optional[int]) -> Tuple[int, str, Optional[List[int]]]:
+        """version'dan sonra değişen sıra numaraları: (güncel sürüm, revision, numaralar)
+        
+        Kayıt o kadar eskiye gitmiyorsa (ya da version None ise) numaralar
+        yerine None döner; çağıran her şeyin değiştiğini varsaymalıdır.
+        """
+        with self._write_lock:
+            current = self.version
+            if version is None or version < self._log_floor:
+                return current, self.revision, None
+            if version == current:
+                return current, self.revision, []
+            return current, self.revision, [seq for changed, seq in self._change_log if changed > version]
+    
+    def _mark_written(self, count: int) -> None:
+        """count yerel değişiklik depoya yazıldı"""
+        with self._write_lock:
+            self._pending = max(0, self._pending - count)
+            # Görünümün ETag'i depo sürümüne geçebilir
+            self._view = None
+    
+    def _lookup(self, isbn: str) -> Optional[Book]:
+        """ISBN ile indekse bakar
+        
+        dict indeksinde tek bir get işlemi atomiktir, kilit alınmaz. Sütunlu
+        ve anlık görüntü indeksleri bir kitabı birden çok yapıdan okuduğu
+        için yazıcılarla sıraya girer.
+        """
+        index = self._index
+        if type(index) is dict:
+            return index.get(isbn)
+        with self._write_lock:
+            return self._index.get(isbn)
+    
+    def add_book_manual(self, book: Book, durable: bool = True) -> bool:
+        """Manuel olarak Book nesnesi ekler
+        
+        Grup yazımı modunda durable=False ise kaydın diske yazılması beklenmez.
+        """
+        # ISBN benzersizliği kontrolü
+        if not self._insert(book, replace=False):
+            print(f"ISBN {book.isbn} ile bir kitap zaten mevcut!")
+            return False
+        
+        self._persist_add([book], durable)
+        print(f"Kitap başarıyla eklendi: {book}")
+        return True
+    
+    def add_book(self, isbn: str, durable: bool = True) -> bool:
+        """ISBN ile API'den kitap bilgilerini çekerek ekler (Aşama 2)"""
+        # ISBN benzersizliği kontrolü
+        if self.find_book(isbn):
+            print(f"ISBN {isbn} ile bir kitap zaten mevcut!")
+            return False
+        
+        try:
+            # Open Library API'sine paylaşılan istemci üzerinden istek gönder
+            client = self._get_client()
+            data = self._get_json(client, f"/isbn/{isbn}.json")
+            
+            if data is None:
+                print("Kitap bulunamadı. Lütfen geçerli bir ISBN giriniz.")
+                return False
+            
+            # Yazar bilgisini çıkar (karmaşık yapı olabilir)
+            authors = self._resolve_authors(client, self._author_keys(data))
+            
+            # Kitap nesnesini oluştur ve ekle
+            book = self._build_book(isbn, data, authors)
+            if not self._insert(book, replace=False):
+                # İstek sürerken aynı ISBN başka bir iş parçacığıyla eklenmiş olabilir
+                print(f"ISBN {isbn} ile bir kitap zaten mevcut!")
+                return False
+            self._persist_add([book], durable)
+            print(f"✅ Kitap başarıyla eklendi: {book}")
+            print(f"📊 Toplam kitap sayısı: {len(self._index)}")
+            return True
+            
+        except httpx.RequestError:
+            print("İnternet bağlantısı hatası. Lütfen bağlantınızı kontrol edin.")
+            return False
+        except httpx.HTTPStatusError:
+            print("API'den veri çekilirken hata oluştu.")
+            return False
+        except Exception as e:
+            print(f"Beklenmeyen hata: {str(e)}")
+            return False
+    
+    def _build_book(self, isbn: str, data: dict, authors: List[str]) -> Book:
+        """Open Library baskı verisinden Book nesnesi oluşturur"""
+        title = data.get("title", "Bilinmeyen Başlık")
+        author = ", ".join(authors) if authors else "Bilinmeyen Yazar"
+        return Book(title=title, author=author, isbn=isbn)
+    
+    def _get_client(self) -> httpx.Client:
+        """Paylaşılan senkron HTTP istemcisini döndürür (gerekirse oluşturur)"""
+        if self.client is None:
+            # http2=True için 'h2' paketi gerekir: pip install httpx[http2]
+            self.client = httpx.Client(
+                http2=self.http2, limits=self.limits, timeout=10, follow_redirects=True
+            )
+        return self.client
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Paylaşılan asenkron HTTP istemcisini döndürür (gerekirse oluşturur)
+        
+        İstemcinin bağlantı havuzu ilk kullanıldığı olay döngüsüne bağlıdır;
+        bu yüzden asyncio.run ile çalışan senkron sarmalayıcılar kendi
+        geçici istemcilerini kullanır.
+        """
+        if self.async_client is None:
+            self.async_client = self._new_async_client(self.limits)
+        return self.async_client
+    
+    def _new_async_client(self, limits: httpx.Limits) -> httpx.AsyncClient:
+        """Kütüphane ayarlarıyla yeni bir asenkron istemci oluşturur"""
+        return httpx.AsyncClient(
+            http2=self.http2, limits=limits, timeout=10, follow_redirects=True
+        )
+    
+    def close(self) -> None:
+        """Bekleyen disk yazımlarını bitirir; HTTP istemcisini, anlık görüntüleri ve depoyu kapatır"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True)
+            self._io_executor = None
+        if self.client is not None and self._owns_client:
+            self.client.close()
+            self.client = None
+        with self._write_lock:
+            if self._retired_snapshot is not None:
+                self._retired_snapshot.close()
+                self._retired_snapshot = None
+            if isinstance(self._index, SnapshotIndex):
+                self._index.snapshot.close()
+        self.storage.close()
+    
+    async def aclose(self) -> None:
+        """Kütüphanenin oluşturduğu tüm HTTP istemcilerini kapatır"""
+        self.close()
+        if self.async_client is not None and self._owns_async_client:
+            await self.async_client.aclose()
+            self.async_client = None
+    
+    def _get_json(self, client: httpx.Client, path: str, raise_errors: bool = True) -> Optional[dict]:
+        """Open Library'den JSON çeker; önbellek varsa önce ona bakar
+        
+        404 için (raise_errors=False ise tüm hatalarda) None döndürür.
+        """
+        if self.cache is not None:
+            cached = self.cache.get(path)
+            if cached is not None:
+                return cached
+        started = time.perf_counter()
+        url = f"{self.base_url}{path}"
+        try:
+            response = self.upstream.send(lambda: client.get(url, timeout=self.upstream.timeout))
+        except httpx.RequestError as e:
+            self._observe_upstream(path, started, self._error_reason(e))
+            raise
+        self._observe_upstream(path, started, response.status_code)
+        return self._handle_response(path, response, raise_errors)
+    
+    async def _get_json_async(self, client: httpx.AsyncClient, path: str,
+                              raise_errors: bool = True) -> Optional[dict]:
+        """_get_json'un asenkron karşılığı"""
+        if self.cache is not None:
+            cached = self.cache.get(path)
+            if cached is not None:
+                return cached
+        started = time.perf_counter()
+        url = f"{self.base_url}{path}"
+        try:
+            response = await self.upstream.send_async(lambda: client.get(url, timeout=self.upstream.timeout))
+        except httpx.RequestError as e:
+            self._observe_upstream(path, started, self._error_reason(e))
+            raise
+        self._observe_upstream(path, started, response.status_code)
+        return self._handle_response(path, response, raise_errors)
+    
+    def _observe_upstream(self, path: str, started: float, outcome) -> None:
+        """Open Library istek süresini ve hatalarını metriklere yazar (404 hata sayılmaz)"""
+        kind = "edition" if path.startswith("/isbn/") else "author"
+        UPSTREAM_LATENCY.observe(time.perf_counter() - started, kind=kind)
+        if outcome not in (200, 404):
+            UPSTREAM_ERRORS.inc(kind=kind, reason=outcome)
+    
+    def _error_reason(self, error: httpx.RequestError) -> str:
+        """Bağlantı hatasının metrik etiketi"""
+        return "circuit_open" if isinstance(error, CircuitOpenError) else "connection"
+    
+    def _handle_response(self, path: str, response: httpx.Response, raise_errors: bool) -> Optional[dict]:
+        """Yanıtı çözümler ve başarılı yanıtları önbelleğe yazar"""
+        if response.status_code == 200:
+            data = response.json()
+            if self.cache is not None:
+                self.cache.set(path, data)
+            return data
+        if response.status_code == 404 or not raise_errors:
+            return None
+        response.raise_for_status()
+        return None
+    
+    async def _fetch_book_async(self, client: httpx.AsyncClient, isbn: str) -> Optional[Book]:
+        """ISBN için baskı ve yazar bilgilerini çeker, bulunamazsa None döndürür
+        
+        Aynı ISBN için süren bir çekme varsa yeni istek atılmaz, onun sonucu paylaşılır.
+        """
+        book, _ = await self._flights.do(("edition", isbn), lambda: self._request_book_async(client, isbn))
+        return book
+    
+    async def _request_book_async(self, client: httpx.AsyncClient, isbn: str) -> Optional[Book]:
+        """_fetch_book_async'in gövdesi: baskıyı ve yazarlarını çeker"""
+        data = await self._get_json_async(client, f"/isbn/{isbn}.json")
+        if data is None:
+            return None
+        
+        authors = await self._resolve_authors_async(client, self._author_keys(data))
+        return self._build_book(isbn, data, authors)
+    
+    def _author_keys(self, data: dict) -> List[str]:
+        """Baskı kaydındaki yazar anahtarlarını sırayı koruyarak tekilleştirir"""
+        return list(dict.fromkeys(author_ref["key"] for author_ref in data.get("authors", [])))
+    
+    def _remember_authors(self, keys: List[str], responses: List[Optional[dict]]) -> None:
+        """Çekilen yazar adlarını oturum boyu paylaşılan belleğe yazar"""
+        for key, author_data in zip(keys, responses):
+            if author_data is not None:
+                self._author_names[key] = author_data.get("name", "Bilinmeyen Yazar")
+    
+    def _resolve_authors(self, client: httpx.Client, keys: List[str]) -> List[str]:
+        """Yazar adlarını çözer; bilinmeyen yazarlar iş parçacıklarıyla paralel çekilir"""
+        missing = [key for key in keys if key not in self._author_names]
+        if len(missing) == 1:
+            self._remember_authors(missing, [self._get_json(client, f"{missing[0]}.json", raise_errors=False)])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=min(len(missing), self.DEFAULT_CONCURRENCY)) as pool:
+                responses = list(pool.map(
+                    lambda key: self._get_json(client, f"{key}.json", raise_errors=False), missing
+                ))
+            self._remember_authors(missing, responses)
+        return [self._author_names[key] for key in keys if key in self._author_names]
+    
+    async def _resolve_authors_async(self, client: httpx.AsyncClient, keys: List[str]) -> List[str]:
+        """Yazar adlarını çözer; bilinmeyen yazarlar eşzamanlı çekilir"""
+        missing = [key for key in keys if key not in self._author_names]
+        if missing:
+            responses = await asyncio.gather(*(self._fetch_author_async(client, key) for key in missing))
+            self._remember_authors(missing, list(responses))
+        return [self._author_names[key] for key in keys if key in self._author_names]
+    
+    async def _fetch_author_async(self, client: httpx.AsyncClient, key: str) -> Optional[dict]:
+        """Yazar kaydını çeker; farklı ISBN'ler aynı yazarı bekliyorsa tek istek atılır"""
+        data, _ = await self._flights.do(
+            ("author", key), lambda: self._get_json_async(client, f"{key}.json", raise_errors=False)
+        )
+        return data
+    
+    async def add_book_async(self, isbn: str, durable: bool = True) -> bool:
+        """add_book'un olay döngüsünü bloklamayan karşılığı (API için)
+        
+        Open Library istekleri paylaşılan AsyncClient üzerinden yapılır,
+        kayıt işlemi döngü dışında yürütülür. Aynı ISBN için eşzamanlı
+        çağrılar tek bir çekme ve eklemeyi paylaşır ve aynı sonucu alır.
+        """
+        added, shared = await self._flights.do(("add", isbn), lambda: self._add_book_once(isbn, durable))
+        if shared and added and durable and self._writer is not None:
+            # Eklemeyi başlatan çağrı yazımı beklemediyse bu çağrı bekler
+            await asyncio.get_running_loop().run_in_executor(None, self._writer.flush)
+        return added
+    
+    async def _add_book_once(self, isbn: str, durable: bool) -> bool:
+        """add_book_async'in gövdesi (ISBN başına aynı anda bir kez çalışır)"""
+        await self._wait_until_loaded_async()
+        if self.find_book(isbn):
+            print(f"ISBN {isbn} ile bir kitap zaten mevcut!")
+            return False
+        
+        try:
+            book = await self._fetch_book_async(self._get_async_client(), isbn)
+        except httpx.RequestError:
+            print("İnternet bağlantısı hatası. Lütfen bağlantınızı kontrol edin.")
+            return False
+        except httpx.HTTPStatusError:
+            print("API'den veri çekilirken hata oluştu.")
+            return False
+        except Exception as e:
+            print(f"Beklenmeyen hata: {str(e)}")
+            return False
+        
+        if book is None:
+            print("Kitap bulunamadı. Lütfen geçerli bir ISBN giriniz.")
+            return False
+        if not self._insert(book, replace=False):
+            # İstek sürerken aynı ISBN başka bir istekle eklenmiş olabilir
+            print(f"ISBN {isbn} ile bir kitap zaten mevcut!")
+            return False
+        
+        await self._persist_async(self._add_entries([book]), durable)
+        print(f"✅ Kitap başarıyla eklendi: {book}")
+        return True
+    
+    async def add_books_async(self, isbns: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY,
+                              client: Optional[httpx.AsyncClient] = None,
+                              durable: bool = True) -> Dict[str, str]:
+        """Birden çok ISBN'i eşzamanlı çözerek ekler, tek seferde kaydeder
+        
+        ISBN başına sonuç durumunu (added / duplicate / not_found / error)
+        girdi sırasıyla döndürür.
+        """
+        await self._wait_until_loaded_async()
+        report: Dict[str, str] = {}
+        pending: List[str] = []
+        for isbn in isbns:
+            isbn = isbn.strip()
+            if not isbn or isbn in report:
+                continue
+            if self._lookup(isbn) is not None:
+                report[isbn] = self.STATUS_DUPLICATE
+            else:
+                report[isbn] = self.STATUS_ERROR
+                pending.append(isbn)
+        
+        fetched = await self.fetch_books_async(pending, concurrency=concurrency, client=client)
+        
+        added: List[Book] = []
+        for isbn in pending:
+            if isbn not in fetched:
+                continue
+            book = fetched[isbn]
+            if book is None:
+                report[isbn] = self.STATUS_NOT_FOUND
+            elif not self._insert(book, replace=False):
+                # Çözümleme sırasında başka bir yoldan eklenmiş olabilir
+                report[isbn] = self.STATUS_DUPLICATE
+            else:
+                report[isbn] = self.STATUS_ADDED
+                added.append(book)
+        
+        if added:
+            await self._persist_async(self._add_entries(added), durable)
+        print(f"📦 Toplu ekleme: {len(added)} / {len(report)} kitap eklendi")
+        return report
+    
+    async def fetch_books_async(self, isbns: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY,
+                                client: Optional[httpx.AsyncClient] = None) -> Dict[str, Optional[Book]]:
+        """ISBN'leri Open Library'den eşzamanlı çözer, kataloğa eklemez
+        
+        Bulunamayan ISBN'ler None ile döner; hata alınan ISBN'ler sonuçta yer almaz.
+        """
+        if client is None:
+            client = self._get_async_client()
+        semaphore = asyncio.Semaphore(concurrency)
+        results: Dict[str, Optional[Book]] = {}
+        
+        async def resolve(isbn: str) -> None:
+            async with semaphore:
+                try:
+                    results[isbn] = await self._fetch_book_async(client, isbn)
+                except (httpx.HTTPError, ValueError, KeyError) as e:
+                    print(f"ISBN {isbn} çekilirken hata oluştu: {e}")
+        
+        await asyncio.gather(*(resolve(isbn) for isbn in isbns))
+        return results
+    
+    def add_books(self, isbns: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY,
+                  durable: bool = True) -> Dict[str, str]:
+        """add_books_async'in senkron sarmalayıcısı (CLI ve betikler için)"""
+        return self._run_batch(
+            lambda client: self.add_books_async(isbns, concurrency=concurrency, client=client,
+                                                durable=durable),
+            concurrency,
+        )
+    
+    def fetch_books(self, isbns: Iterable[str],
+                    concurrency: int = DEFAULT_CONCURRENCY) -> Dict[str, Optional[Book]]:
+        """fetch_books_async'in senkron sarmalayıcısı (CLI ve betikler için)"""
+        return self._run_batch(
+            lambda client: self.fetch_books_async(isbns, concurrency=concurrency, client=client),
+            concurrency,
+        )
+    
+    def _run_batch(self, call, concurrency: int):
+        """Toplu asenkron işlemi eşzamanlılığa uygun bir bağlantı havuzuyla çalıştırır
+        
+        Dışarıdan verilmiş AsyncClient varsa o kullanılır (call None alır).
+        """
+        async def run():
+            if self.async_client is not None and not self._owns_async_client:
+                return await call(None)
+            limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+            async with self._new_async_client(limits) as client:
+                return await call(client)
+        return asyncio.run(run())
+    
+    def add_books_manual(self, books: Iterable[Book], durable: bool = True) -> Dict[str, str]:
+        """Birden çok Book nesnesini ekler ve tek seferde kaydeder
+        
+        ISBN başına sonuç durumunu (added / duplicate) girdi sırasıyla döndürür.
+        """
+        self.wait_until_loaded()
+        report: Dict[str, str] = {}
+        added: List[Book] = []
+        for book in books:
+            if book.isbn in report:
+                continue
+            if self._insert(book, replace=False):
+                report[book.isbn] = self.STATUS_ADDED
+                added.append(book)
+            else:
+                report[book.isbn] = self.STATUS_DUPLICATE
+        if added:
+            self._persist_add(added, durable)
+        print(f"📦 Toplu ekleme: {len(added)} / {len(report)} kitap eklendi")
+        return report
+    
+    def remove_book(self, isbn: str, durable: bool = True) -> bool:
+        """ISBN numarasına göre kitap siler"""
+        book = self._delete(isbn)
+        if book:
+            self._persist_remove([isbn], durable)
+            print(f"Kitap başarıyla silindi: {book}")
+            return True
+        else:
+            print("Kitap bulunamadı!")
+            return False
+    
+    async def remove_book_async(self, isbn: str, durable: bool = True) -> bool:
+        """remove_book'un kaydı döngü dışında yapan karşılığı (API için)"""
+        await self._wait_until_loaded_async()
+        book = self._delete(isbn)
+        if book:
+            await self._persist_async(self._remove_entries([isbn]), durable)
+            print(f"Kitap başarıyla silindi: {book}")
+            return True
+        else:
+            print("Kitap bulunamadı!")
+            return False
+    
+    def remove_books(self, isbns: Optional[Iterable[str]] = None, author: Optional[str] = None,
+                     durable: bool = True) -> Dict[str, str]:
+        """Birden çok kitabı siler ve değişiklikleri tek seferde kaydeder
+        
+        isbns listesi ya da author filtresi (büyük/küçük harf ve Türkçe
+        karakter duyarsız tam eşleşme) verilir. ISBN başına sonuç durumunu
+        (removed / not_found) girdi sırasıyla döndürür. Çok sayıda silmede
+        günlük doğrudan yeni anlık görüntüye katlanır.
+        """
+        report, removed = self._delete_many(isbns, author)
+        if removed:
+            self._persist_remove(removed, durable)
+            if self._should_compact(removed):
+                self.compact()
+        print(f"🗑️ Toplu silme: {len(removed)} / {len(report)} kitap silindi")
+        return report
+    
+    async def remove_books_async(self, isbns: Optional[Iterable[str]] = None,
+                                 author: Optional[str] = None, durable: bool = True) -> Dict[str, str]:
+        """remove_books'un kaydı döngü dışında yapan karşılığı (API için)"""
+        await self._wait_until_loaded_async()
+        # Yazar eşleştirme ve silme döngü dışında; kilit yalnızca silme için alınır
+        report, removed = await asyncio.to_thread(self._delete_many, isbns, author)
+        if removed:
+            await self._persist_async(self._remove_entries(removed), durable)
+            if self._should_compact(removed):
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._get_io_executor(), self.compact)
+        print(f"🗑️ Toplu silme: {len(removed)} / {len(report)} kitap silindi")
+        return report
+    
+    def _delete_many(self, isbns: Optional[Iterable[str]],
+                     author: Optional[str]) -> Tuple[Dict[str, str], List[str]]:
+        """Toplu silmenin bellek kısmı: eşleşenleri tek kilit altında indeksten çıkarır
+        
+        Yazar filtresinin adayları kilit dışında arama indeksinden bulunur;
+        kilit altında yalnızca eşleşmenin hâlâ geçerli olduğu doğrulanır.
+        """
+        if (isbns is None) == (author is None):
+            raise ValueError("Silmek için ya ISBN listesi ya da yazar verilmelidir")
+        self.wait_until_loaded()
+        key = None
+        if author is not None:
+            key = SearchIndex.normalize(author.strip())
+            isbns = self._match_author(author, key)
+        report: Dict[str, str] = {}
+        removed: List[str] = []
+        with self._write_lock:
+            for isbn in isbns:
+                isbn = isbn.strip()
+                if not isbn or isbn in report:
+                    continue
+                if key is not None:
+                    # Eşleştirmeden sonra değiştirilmiş ya da silinmiş olabilir
+                    book = self._index.get(isbn)
+                    if book is None or SearchIndex.normalize(book.author) != key:
+                        continue
+                if self._delete(isbn) is not None:
+                    report[isbn] = self.STATUS_REMOVED
+                    removed.append(isbn)
+                else:
+                    report[isbn] = self.STATUS_NOT_FOUND
+        return report, removed
+    
+    def _match_author(self, author: str, key: str) -> List[str]:
+        """Yazarı key ile (normalize edilmiş hali) tam eşleşen kitapların ISBN'leri
+        
+        Tüm katalog taranmaz: adaylar arama indeksinde yazarın kelimelerini
+        içeren kitaplardır, normalize karşılaştırması yalnızca onlara yapılır.
+        Kilit yalnızca aday kümesini almak için tutulur. Ekleme sırasıyla döner.
+        """
+        with self._write_lock:
+            if not self._search_ready:
+                self._build_search_index()
+            search_index = self.search_index
+            terms = search_index.terms_for(author)
+        matches = []
+        for isbn in search_index.matches(terms):
+            book = self._lookup(isbn)
+            if book is not None and SearchIndex.normalize(book.author) == key:
+                matches.append(isbn)
+        with self._write_lock:
+            seqs = {isbn: self._seqs.get(isbn, 0) for isbn in matches}
+        return sorted(matches, key=seqs.__getitem__)
+    
+    def _should_compact(self, removed: List[str]) -> bool:
+        """Toplu silmeden sonra günlüğün hemen katlanıp katlanmayacağı
+        
+        Grup yazımında katlama yazıcıya bırakılır (günlük eşiği).
+        """
+        return (len(removed) >= self.BULK_COMPACT_MIN and self._writer is None
+                and getattr(self.storage, "journal_mode", False))
+    
+    @property
+    def revision(self) -> str:
+        """Kataloğun o anki durumunu tanımlayan opak değer (ETag için)
+        
+        Paylaşımlı modda bekleyen yerel değişiklik yoksa depo sürümüdür
+        (anlık görüntü kimliği ve günlük konumu); aynı dosya durumunu
+        uygulamış tüm süreçler aynı değeri üretir. Aksi halde süreç içi
+        sürümdür.
+        """
+        if self.shared and self._pending == 0:
+            revision = self.storage.revision()
+            if revision is not None:
+                return revision
+        return f"{self.instance_id}-{self.version}"
+    
+    def cursor_seq(self, isbn: str, seq: Optional[int] = None) -> Optional[int]:
+        """İmleçteki ISBN ve sıra numarasını bu kataloktaki sıra numarasına çevirir
+        
+        seq, ISBN'in bu süreçteki (güncel ya da silinmeden önceki) numarasıyla
+        aynıysa olduğu gibi kullanılır; kitap silinip yeniden eklendiyse de
+        imleç eski yerinden devam eder. Aksi halde (başka bir worker'ın ya da
+        yeniden yüklemeden önceki imleç) ISBN'in buradaki yerine çözülür.
+        ISBN bilinmiyorsa ya da silinip yeniden eklendiği için yeri
+        belirsizse None döner.
+        """
+        with self._write_lock:
+            live = self._seqs.get(isbn)
+            removed = self._removed_seqs.get(isbn)
+            if seq is not None and seq in (live, removed):
+                return seq
+            if live is not None and removed is not None:
+                return None
+            return removed if live is None else live
+    
+    def list_books(self) -> List[Book]:
+        """Kütüphanedeki tüm kitapları listeler
+        
+        Dönen liste yayımlanmış görünümün kendisidir; değiştirilmemelidir.
+        """
+        return self.books
+    
+    def count_books(self) -> int:
+        """Kitap sayısı (yükleme sürüyorsa o ana kadar yüklenenler, beklemeden)"""
+        return len(self._index)
+    
+    def list_books_page(self, limit: int, after: Optional[int] = None,
+                        view: Optional[CatalogView] = None) -> Tuple[List[Book], Optional[int]]:
+        """Kitapları sayfa sayfa listeler
+        
+        after, önceki sayfanın son kitabının sıra numarasıdır (bkz. cursor_seq).
+        Sonraki sayfa için kullanılacak sıra numarasını (son sayfada None)
+        döndürür. view verilirse sayfa o görünümden kesilir.
+        """
+        if view is not None:
+            return view.page(limit, after)
+        books, next_after, _, _ = self.page(limit, after)
+        return books, next_after
+    
+    def page(self, limit: int, after: Optional[int] = None) -> Tuple[List[Book], Optional[int], str, int]:
+        """Tek sayfa ile birlikte kesildiği katalog sürümü: (kitaplar, sonraki after, revision, version)
+        
+        Sayfa sıra numarası tablosundan kesilir: maliyet katalog boyutuna
+        değil limit'e (ve aradaki silinmiş satırlara) bağlıdır, görünüm
+        kurulmaz. Sayfa ve sürüm aynı kilit altında alınır (ETag tutarlılığı).
+        """
+        self.wait_until_loaded()
+        with self._write_lock:
+            slots = self._slots
+            if slots is None:
+                view = self.view()
+                return (*view.page(limit, after), view.revision, view.version)
+            index, base = self._index, self._slot_base
+            position = 0 if after is None else max(0, after + 1 - base)
+            found: List[int] = []
+            end = len(slots)
+            # Bir fazlası okunur: sonraki sayfa var mı
+            while position < end and len(found) <= limit:
+                if slots[position] is not None:
+                    found.append(position)
+                position += 1
+            next_after = base + found[limit - 1] if len(found) > limit else None
+            books = [index[slots[row]] for row in found[:limit]]
+            return books, next_after, self.revision, self.version
+    
+    def find_book(self, isbn: str, wait: bool = True) -> Optional[Book]:
+        """ISBN ile kitap arar
+        
+        Arka planda yükleme sürerken yüklenmiş kitaplar hemen döndürülür;
+        bulunamayan ISBN için wait=True ise yüklemenin bitmesi beklenir.
+        """
+        book = self._lookup(isbn)
+        if book is None and wait and self.loading:
+            self.wait_until_loaded()
+            book = self._lookup(isbn)
+        return book
+    
+    def search_books(self, query: str, limit: int = 50) -> List[Book]:
+        """Başlık ve yazarda arama yapar (Türkçe duyarlı, kelime öneki eşleşmesi)
+        
+        Sonuçlar başlığa göre sıralıdır; yalnızca ilk limit kitap seçilir ve
+        çözülür. İlk arama arama indeksini kurar (API bunu döngü dışında çağırır).
+        Kilit altında yalnızca sorguyla eşleşen terimlerin listesi alınır;
+        birleşim ve sıralama kilit dışında yapılır, yazıcılar beklemez.
+        """
+        self.wait_until_loaded()
+        with self._write_lock:
+            if not self._search_ready:
+                self._build_search_index()
+            search_index = self.search_index
+            terms = search_index.terms_for(query)
+        isbns = search_index.rank(search_index.matches(terms), limit)
+        # Bu arada silinen kitaplar atlanır
+        books = [self._lookup(isbn) for isbn in isbns]
+        return [book for book in books if book is not None]
+    
+    @property
+    def filename(self) -> str:
+        """Depolama arka ucunun dosya adı"""
+        return self.storage.filename
+    
+    @filename.setter
+    def filename(self, filename: str) -> None:
+        self.storage.filename = filename
+    
+    @property
+    def journal(self) -> Optional[Journal]:
+        """JSON deposunun değişiklik günlüğü (diğer arka uçlarda None)"""
+        return getattr(self.storage, "journal", None)
+    
+    def load_books(self) -> None:
+        """Depolama arka ucundan kitapları akış halinde yükler
+        
+        Kitaplar okundukça birincil indekse eklenir, böylece tüm dosyanın
+        ayrıştırılmış hali bellekte tutulmaz. Arama indeksi ilk aramaya
+        ertelenir. Anlık görüntü modunda güncel bir .snap dosyası varsa JSON
+        hiç okunmaz.
+        """
+        self._loaded.clear()
+        try:
+            with self.storage.lock():
+                self._load_from_storage()
+        finally:
+            self._loaded.set()
+        print(f"{len(self._index)} kitap yüklendi.")
+    
+    def _load_from_storage(self) -> None:
+        """load_books'un gövdesi (depo kilidi altında çağrılır)
+        
+        Yeni indeks yan tarafta kurulur ve tek adımda yayımlanır; yeniden
+        yükleme sırasında okuyucular eski kataloğu görmeye devam eder. İlk
+        yüklemede ise indeks doldukça find_book ile görünür olur.
+        """
+        snapshot_index = self._open_snapshot()
+        if snapshot_index is not None:
+            index, seqs = snapshot_index, snapshot_index.seqs
+        else:
+            # Anlık görüntü, okumaya başlamadan önceki JSON durumuyla damgalanır
+            stamp = source_stamp(self.filename) if self.snapshot and self._json_snapshot else None
+            index, seqs = self._new_index(), {}
+            progressive = self.loading
+            if progressive:
+                with self._write_lock:
+                    self._retire_index(index)
+                    self._index, self._seqs = index, seqs
+                    self._invalidate()
+            # dict dışındaki indekslerde okuyucular kilit aldığından ekleme de kilitli
+            lock = self._write_lock if progressive and type(index) is not dict else nullcontext()
+            for book in self.storage.iter_load():
+                with lock:
+                    self._append_loaded(index, seqs, book)
+            if stamp is not None:
+                self._write_binary_snapshot(index.values(), stamp)
+        with self._write_lock:
+            apply_entries(
+                self.storage.load_tail(),
+                add=lambda book: self._append_loaded(index, seqs, book, replace=True),
+                remove=lambda isbn: self._remove_loaded(index, seqs, isbn),
+            )
+            self._publish_index(index, seqs)
+    
+    @property
+    def snapshot_filename(self) -> str:
+        """İkili anlık görüntü dosyasının adı"""
+        return self.filename + self.SNAPSHOT_SUFFIX
+    
+    @property
+    def _json_snapshot(self) -> bool:
+        """Anlık görüntü library.json'un yanındaki .snap dosyasından mı açılır"""
+        return isinstance(self.storage, JsonStorage)
+    
+    def _open_snapshot(self) -> Optional[SnapshotIndex]:
+        """Güncel anlık görüntü varsa ona bağlı bir indeks döndürür
+        
+        JSON'da .snap dosyası, SQLite'ta veritabanının kendisi (satırlar
+        yüklenmeden, açık bir okuma işlemi üzerinden) kullanılır.
+        """
+        if not self.snapshot:
+            return None
+        if self._json_snapshot:
+            if not snapshot_is_fresh(self.snapshot_filename, self.filename):
+                return None
+            try:
+                snapshot = BookSnapshot(self.snapshot_filename)
+            except (OSError, ValueError) as e:
+                print(f"Anlık görüntü açılamadı, JSON'dan yükleniyor: {e}")
+                return None
+        else:
+            snapshot = self.storage.open_snapshot()
+            if snapshot is None:
+                return None
+        index = SnapshotIndex(snapshot)
+        self._next_seq = max(self._next_seq, len(index.snapshot))
+        return index
+    
+    def _rebase_snapshot(self) -> None:
+        """SQLite görünümünü değişiklik katmanı büyüyünce güncel veritabanına taşır
+        
+        Açık okuma işlemi WAL'in başa sarılmasını engeller, katman da bellekte
+        büyür. Tüm yerel değişiklikler yazılmışsa katalog yeni bir görünümle
+        yeniden yayımlanır; içerik aynı olduğundan arama indeksi korunur.
+        _persist_lock ve depo kilidi altında çağrılır.
+        """
+        index = self._index
+        if (self._json_snapshot or not isinstance(index, SnapshotIndex)
+                or index.changes < self.SNAPSHOT_REBASE_MIN or self._pending):
+            return
+        # Diğer süreçlerin yazmaları refresh ile (tam yükleme) uygulanır
+        if self.storage.has_changes():
+            return
+        version = self.version
+        snapshot = self.storage.open_snapshot()
+        if snapshot is None:
+            return
+        with self._write_lock:
+            if self.version != version or self._pending:
+                snapshot.close()
+                return
+            search_index, search_ready = self.search_index, self._search_ready
+            self._next_seq = max(self._next_seq, len(snapshot))
+            fresh = SnapshotIndex(snapshot)
+            self._publish_index(fresh, fresh.seqs)
+            self.search_index, self._search_ready = search_index, search_ready
+    
+    def _write_binary_snapshot(self, books: Iterable[Book], stamp: Tuple[int, int]) -> None:
+        """JSON'dan yüklenen kataloğu ikili anlık görüntü olarak yazar"""
+        try:
+            count = write_snapshot(self.snapshot_filename, books, stamp)
+            print(f"💾 {count} kitap {self.snapshot_filename} dosyasına kaydedildi")
+        except OSError as e:
+            print(f"Anlık görüntü yazılamadı: {e}")
+    
+    def _build_search_index(self) -> None:
+        """Arama indeksini birincil indeksten kurar"""
+        self.search_index.build(self._index.values())
+        self._search_ready = True
+    
+    def _add_entries(self, books: List[Book]) -> List[dict]:
+        """Eklenen kitaplar için günlük kayıtları"""
+        return [{"op": "add", "book": book.to_dict()} for book in books]
+    
+    def _remove_entries(self, isbns: List[str]) -> List[dict]:
+        """Silinen kitaplar için günlük kayıtları"""
+        return [{"op": "remove", "isbn": isbn} for isbn in isbns]
+    
+    def _persist_add(self, books: List[Book], durable: bool = True) -> None:
+        """Eklenen kitapları kalıcı hale getirir"""
+        self._persist(self._add_entries(books), durable)
+    
+    def _persist_remove(self, isbns: List[str], durable: bool = True) -> None:
+        """Silinen kitapları kalıcı hale getirir"""
+        self._persist(self._remove_entries(isbns), durable)
+    
+    def _persist(self, entries: List[dict], durable: bool = True) -> None:
+        """Değişiklikleri kalıcı hale getirir
+        
+        Grup yazımı modunda kayıtlar yazıcıya verilir; durable=True ise
+        grubun yazılması beklenir. Aksi halde hemen yazılır.
+        """
+        if self._writer is not None:
+            future = self._writer.submit(entries)
+            if durable:
+                future.result()
+            return
+        self._commit(entries)
+    
+    def _commit(self, entries: List[dict], strict: bool = False) -> None:
+        """Değişiklikleri arka uca yazar, gerekirse tam anlık görüntü alır
+        
+        Paylaşımlı modda önce diğer süreçlerin kayıtları kilit altında
+        uygulanır; böylece anlık görüntü onların değişikliklerini de içerir.
+        strict=True ise yazma hataları yazdırılıp yeniden yükseltilir.
+        """
+        with self._persist_lock, self.storage.lock():
+            if self.shared and self._apply_changes():
+                # Katalog diskten yeniden kuruldu: henüz yazılmamış kendi
+                # değişikliklerimiz yeni duruma tekrar uygulanır
+                for entry in entries:
+                    if entry["op"] == "add":
+                        self._insert(Book.from_dict(entry["book"]), local=False)
+                    else:
+                        self._delete(entry["isbn"], local=False)
+            if self._write_entries(entries, strict):
+                self._save_books(strict)
+            self._rebase_snapshot()
+    
+    def _commit_group(self, entries: List[dict]) -> None:
+        """Grup yazıcısının flush'ı; hata gruptaki tüm bekleyenlere iletilir
+        
+        Böylece durable=True çağrılar yazılamayan kayıt için başarı döndürmez.
+        """
+        self._commit(entries, strict=True)
+    
+    async def _persist_async(self, entries: List[dict], durable: bool = True) -> None:
+        """_persist'in olay döngüsünü bloklamayan karşılığı
+        
+        Disk yazımları tek iş parçacıklı bir yürütücüde sırayla yapılır;
+        böylece günlük kayıtlarının sırası korunur. Kilit beklemesi, diğer
+        süreçlerin kayıtları ve anlık görüntü için kitap listesinin alınması
+        da (O(n)) yürütücüde, döngü dışında yapılır.
+        """
+        if self._writer is not None:
+            future = self._writer.submit(entries)
+            if durable:
+                await asyncio.wrap_future(future)
+            return
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._get_io_executor(), self._commit, entries)
+    
+    def _get_io_executor(self) -> ThreadPoolExecutor:
+        """Disk yazımları için tek iş parçacıklı yürütücüyü döndürür"""
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="library-io")
+        return self._io_executor
+    
+    def _write_entries(self, entries: List[dict], strict: bool = False) -> bool:
+        """Kayıtları arka uca yazar; tam anlık görüntü gerekiyorsa True döndürür"""
+        try:
+            with self._persist_lock:
+                full = self.storage.write(entries)
+        except Exception as e:
+            print(f"Değişiklikler kaydedilirken hata oluştu: {e}")
+            if strict:
+                raise
+            return False
+        self._mark_written(len(entries))
+        return full
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Grup yazımında bekleyen değişiklikleri hemen yazar ve bekler
+        
+        Grup yazımı kapalıysa her şey zaten yazılmıştır. Zaman aşımında
+        False döndürür.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+    
+    def compact(self) -> None:
+        """Günlüğü yeni bir anlık görüntüye katlar ve günlüğü temizler"""
+        self.save_books()
+    
+    def save_books(self) -> None:
+        """Kitapları depolama arka ucuna kaydeder
+        
+        Grup yazımında bekleyen değişiklikler önce yazılır; böylece
+        paylaşımlı modda yeniden yükleme onları kaybettirmez.
+        """
+        if self._writer is not None:
+            self._writer.flush()
+        self._save_books()
+    
+    def _save_books(self, strict: bool = False) -> None:
+        """save_books'un gövdesi; strict=True ise yazma hatası yükseltilir
+        
+        Paylaşımlı modda anlık görüntü günlüğü sıfırladığından önce diğer
+        süreçlerin günlükteki kayıtları kilit altında uygulanır; aksi halde
+        onların değişiklikleri kaybolurdu.
+        """
+        with self._persist_lock, self.storage.lock():
+            if self.shared:
+                self._apply_changes()
+            view = self.view()
+            if self._write_snapshot(view.books, strict):
+                with self._write_lock:
+                    if self.version == view.version:
+                        self._pending = 0
+                    self._view = None
+    
+    def refresh(self) -> bool:
+        """Aynı dosyayı kullanan diğer süreçlerin değişikliklerini uygular
+        
+        Değişiklik yoksa yalnızca dosya durumlarına bakılır (kilit alınmaz).
+        Günlükteki yeni kayıtlar artımlı uygulanır; anlık görüntü başka bir
+        süreçte yeniden yazıldıysa katalog baştan yüklenir. Bir şey
+        değiştiyse True döndürür.
+        """
+        if self.loading or not self.storage.has_changes():
+            return False
+        with self.storage.lock():
+            self._apply_changes()
+        return True
+    
+    def _apply_changes(self) -> bool:
+        """Depodaki yabancı değişiklikleri indekse uygular (kilit altında)
+        
+        Katalog baştan yüklendiyse True döndürür.
+        """
+        with self._write_lock:
+            # Günlük konumu ve uygulanan kayıtlar görünümlerle birlikte değişir
+            changes = self.storage.changes()
+            if changes:
+                apply_entries(
+                    changes,
+                    add=lambda book: self._insert(book, local=False),
+                    remove=lambda isbn: self._delete(isbn, local=False),
+                )
+                self._view = None
+        if changes is None:
+            self._load_from_storage()
+            print(f"🔄 Katalog yeniden yüklendi: {len(self._index)} kitap")
+            return True
+        return False
+    
+    def _write_snapshot(self, books: List[Book], strict: bool = False) -> bool:
+        """Verilen kitap listesini tam anlık görüntü olarak yazar, başarılıysa True"""
+        try:
+            started = time.perf_counter()
+            with self._persist_lock:
+                written = self.storage.save_all(books)
+            SAVE_DURATION.observe(time.perf_counter() - started)
+            if written:
+                SAVE_BYTES.inc(written)
+            print(f"💾 {len(books)} kitap {self.filename} dosyasına kaydedildi")
+            return True
+        except Exception as e:
+            print(f"Kitaplar kaydedilirken hata oluştu: {e}")
+            if strict:
+                raise
+            return False
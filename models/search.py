@@ -0,0 +1,125 @@
+import heapq
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Set
+from .book import Book
+
+
+class SearchIndex:
+    """Başlık ve yazar alanları için bellek içi ters indeks
+
+    Her kelime (terim) onu içeren kitapların ISBN kümesine eşlenir. Terimler
+    ayrıca sıralı bir listede tutulur; böylece önek araması tüm kayıtları
+    taramadan ikili arama ile yapılır. Sonuçları başlığa göre sıralamak
+    için her kitabın normalize edilmiş başlığı da saklanır.
+    """
+
+    _TOKEN_PATTERN = re.compile(r"\w+")
+    # Türkçe büyük/küçük harf dönüşümü: str.lower() "İ" harfini "i̇" yapar
+    _TURKISH_LOWER = str.maketrans({"İ": "i", "I": "ı"})
+    # Önek aralığının üst sınırı için: hiçbir terim bu karakteri içermez
+    _MAX_CHAR = "\U0010ffff"
+
+    def __init__(self):
+        self._postings: Dict[str, Set[str]] = {}
+        self._terms: List[str] = []
+        # ISBN -> normalize edilmiş başlık (sıralama anahtarı)
+        self._titles: Dict[str, str] = {}
+
+    @classmethod
+    def normalize(cls, text: str) -> str:
+        """Metni Türkçe kurallarıyla küçültür ve aksanlardan arındırır
+
+        "İSTANBUL", "istanbul" ve "Istanbul" aynı terime dönüşür; "Ümit"
+        araması "umit" ile de bulunur (Türkçe klavyesiz sorgular için).
+        """
+        lowered = text.translate(cls._TURKISH_LOWER).lower().replace("ı", "i")
+        decomposed = unicodedata.normalize("NFKD", lowered)
+        return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Metni normalize edilmiş terimlere ayırır"""
+        return cls._TOKEN_PATTERN.findall(cls.normalize(text))
+
+    def _book_terms(self, book: Book) -> Set[str]:
+        return set(self.tokenize(book.title)) | set(self.tokenize(book.author))
+
+    def build(self, books: Iterable[Book]) -> None:
+        """İndeksi sıfırdan kurar (toplu yükleme için, terimler bir kez sıralanır)"""
+        self._postings = {}
+        self._titles = {}
+        for book in books:
+            self._titles[book.isbn] = self.normalize(book.title)
+            for term in self._book_terms(book):
+                self._postings.setdefault(term, set()).add(book.isbn)
+        self._terms = sorted(self._postings)
+
+    def add(self, book: Book) -> None:
+        """Kitabı indekse ekler"""
+        self._titles[book.isbn] = self.normalize(book.title)
+        for term in self._book_terms(book):
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = set()
+                insort(self._terms, term)
+            postings.add(book.isbn)
+
+    def remove(self, book: Book) -> None:
+        """Kitabı indeksten çıkarır"""
+        self._titles.pop(book.isbn, None)
+        for term in self._book_terms(book):
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.discard(book.isbn)
+            if not postings:
+                del self._postings[term]
+                position = bisect_left(self._terms, term)
+                if position < len(self._terms) and self._terms[position] == term:
+                    del self._terms[position]
+
+    def _prefix_terms(self, prefix: str) -> List[str]:
+        """Verilen önekle başlayan terimler (ikili arama ve tek dilimleme ile)"""
+        start = bisect_left(self._terms, prefix)
+        end = bisect_left(self._terms, prefix + self._MAX_CHAR, start)
+        return self._terms[start:end]
+
+    def terms_for(self, query: str) -> List[List[str]]:
+        """Sorgunun her kelimesi için o önekle başlayan terimler
+
+        Yalnızca sıralı terim listesinden dilim alır; indeksi değiştirenlerle
+        aynı kilit altında çağrılırsa birleşim ve sıralama kilit dışında
+        matches() ve rank() ile yapılabilir (arada silinen terimler atlanır).
+        """
+        tokens = sorted(set(self.tokenize(query)), key=len, reverse=True)
+        return [self._prefix_terms(token) for token in tokens]
+
+    def matches(self, groups: List[List[str]]) -> Set[str]:
+        """terms_for() çıktısından tüm kelimelerle eşleşen ISBN'ler"""
+        result = None
+        for terms in groups:
+            found: Set[str] = set()
+            for term in terms:
+                found |= self._postings.get(term, ())
+            result = found if result is None else result & found
+            if not result:
+                return set()
+        return result or set()
+
+    def search(self, query: str) -> Set[str]:
+        """Sorgudaki tüm terimlerle (önek olarak) eşleşen kitapların ISBN'leri"""
+        return self.matches(self.terms_for(query))
+
+    def rank(self, isbns: Iterable[str], limit: int) -> List[str]:
+        """ISBN'lerden başlığa (sonra ISBN'e) göre ilk limit tanesi
+
+        Tüm eşleşmeler sıralanmaz; heapq ile yalnızca ilk limit tanesi seçilir.
+        """
+        titles = self._titles
+        return heapq.nsmallest(limit, isbns, key=lambda isbn: (titles.get(isbn, ""), isbn))
+
+    def ranked(self, query: str, limit: int) -> List[str]:
+        """search() sonucundan başlığa (sonra ISBN'e) göre ilk limit ISBN"""
+        return self.rank(self.search(query), limit)
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Aynı anahtar için eşzamanlı asenkron işleri tek bir çalıştırmada birleştirir
+
+    Bir anahtar için iş sürerken gelen çağrılar yeni iş başlatmaz, süren işin
+    sonucunu (ya da hatasını) paylaşır. İş bitince anahtar kayıttan düşer;
+    sonraki çağrı yeniden çalıştırır (sonuç önbelleklenmez). Kayıtlar olay
+    döngüsüne göre ayrılır, böylece asyncio.run ile açılan ayrı döngüler
+    birbirinin Future'larını beklemez.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        """Süren iş sayısı"""
+        return len(self._inflight)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """call()'ı anahtar başına bir kez çalıştırır
+
+        (sonuç, paylaşıldı_mı) döndürür; paylaşıldı_mı, sonucun başka bir
+        çağrının başlattığı işten geldiğini belirtir. Bekleyen çağrılardan
+        biri iptal edilse de iş diğerleri için sürer.
+        """
+        loop = asyncio.get_running_loop()
+        slot = (loop, key)
+        future = self._inflight.get(slot)
+        if future is not None:
+            return await asyncio.shield(future), True
+        future = loop.create_task(call())
+        self._inflight[slot] = future
+        future.add_done_callback(lambda done: self._finish(slot, done))
+        return await asyncio.shield(future), False
+
+    def _finish(self, slot: Tuple[asyncio.AbstractEventLoop, Hashable], future: asyncio.Future) -> None:
+        if self._inflight.get(slot) is future:
+            del self._inflight[slot]
+        # Tüm bekleyenler iptal edildiyse hata "alınmadı" uyarısı üretmesin
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,335 @@
+import mmap
+import os
+import struct
+from bisect import bisect_right
+from typing import Dict, FrozenSet, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
+from .book import Book
+
+
+class BookSnapshot:
+    """mmap ile açılan ikili katalog anlık görüntüsü
+
+    Dosya düzeni (tüm sayılar little-endian):
+    - başlık:  8 bayt sihirli değer + kayıt sayısı (u64) + üretildiği
+               kaynak dosyanın boyutu (u64) ve değişiklik zamanı (ns, i64)
+    - kayıtlar: kayıt başına sabit genişlikte başlık/yazar/ISBN
+                konum (u64) ve uzunlukları (u32)
+    - ISBN'e göre sıralı kayıt numaraları (u32), ikili arama için
+    - UTF-8 metin yığını
+    Dosyayı açmak kayıt sayısından bağımsızdır; kayıtlar yalnızca
+    erişildiklerinde çözülür.
+    """
+
+    MAGIC = b"LIBSNAP2"
+    _HEADER = struct.Struct("<8sQQq")
+    _RECORD = struct.Struct("<QIQIQI")
+    _ROW = struct.Struct("<I")
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        with open(filename, 'rb') as file:
+            size = os.fstat(file.fileno()).st_size
+            self._mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        if len(self._mm) < self._HEADER.size:
+            raise ValueError("Anlık görüntü dosyası çok kısa")
+        magic, self.count, source_size, source_mtime_ns = self._HEADER.unpack_from(self._mm, 0)
+        self.source_stamp = (source_size, source_mtime_ns)
+        if magic != self.MAGIC:
+            raise ValueError("Geçersiz anlık görüntü dosyası")
+        self._records_start = self._HEADER.size
+        self._sorted_start = self._records_start + self.count * self._RECORD.size
+        self._heap_start = self._sorted_start + self.count * self._ROW.size
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _text(self, offset: int, length: int) -> str:
+        start = self._heap_start + offset
+        return bytes(self._mm[start:start + length]).decode("utf-8")
+
+    def _isbn_bytes(self, row: int) -> bytes:
+        fields = self._RECORD.unpack_from(self._mm, self._records_start + row * self._RECORD.size)
+        start = self._heap_start + fields[4]
+        return bytes(self._mm[start:start + fields[5]])
+
+    def isbn(self, row: int) -> str:
+        """Kayıt numarasındaki ISBN"""
+        return self._isbn_bytes(row).decode("utf-8")
+
+    def book(self, row: int) -> Book:
+        """Kayıt numarasındaki kitabı çözer"""
+        title_off, title_len, author_off, author_len, isbn_off, isbn_len = self._RECORD.unpack_from(
+            self._mm, self._records_start + row * self._RECORD.size
+        )
+        return Book(
+            title=self._text(title_off, title_len),
+            author=self._text(author_off, author_len),
+            isbn=self._text(isbn_off, isbn_len),
+        )
+
+    def iter_books(self) -> Iterator[Book]:
+        """Tüm kitaplar kayıt sırasıyla"""
+        for row in range(self.count):
+            yield self.book(row)
+
+    def find(self, isbn: str) -> Optional[int]:
+        """ISBN'in kayıt numarasını ikili aramayla bulur"""
+        target = isbn.encode("utf-8")
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            row = self._ROW.unpack_from(self._mm, self._sorted_start + middle * self._ROW.size)[0]
+            candidate = self._isbn_bytes(row)
+            if candidate < target:
+                low = middle + 1
+            elif candidate > target:
+                high = middle
+            else:
+                return row
+        return None
+
+    def close(self) -> None:
+        """mmap'i kapatır (dosya tanıtıcısı açılışta kapatılmıştır); tekrar çağrılabilir"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+
+def source_stamp(filename: str) -> Optional[Tuple[int, int]]:
+    """Kaynak dosyanın boyutu ve değişiklik zamanı (ns); dosya yoksa None"""
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def write_snapshot(filename: str, books: Iterable[Book],
+                   source: Tuple[int, int] = (0, 0)) -> int:
+    """Kitapları ikili anlık görüntü olarak yazar (geçici dosya + yeniden adlandırma)
+
+    source, kitapların okunduğu kaynak dosyanın source_stamp() değeridir;
+    snapshot_is_fresh bununla karşılaştırır.
+    """
+    heap = bytearray()
+    records = bytearray()
+    isbns: List[bytes] = []
+    for book in books:
+        fields = []
+        for text in (book.title, book.author, book.isbn):
+            encoded = text.encode("utf-8")
+            fields.extend((len(heap), len(encoded)))
+            heap += encoded
+        records += BookSnapshot._RECORD.pack(*fields)
+        isbns.append(book.isbn.encode("utf-8"))
+
+    sorted_rows = bytearray()
+    for row in sorted(range(len(isbns)), key=isbns.__getitem__):
+        sorted_rows += BookSnapshot._ROW.pack(row)
+
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, 'wb') as file:
+        file.write(BookSnapshot._HEADER.pack(BookSnapshot.MAGIC, len(isbns), *source))
+        file.write(records)
+        file.write(sorted_rows)
+        file.write(heap)
+    os.replace(temp_filename, filename)
+    return len(isbns)
+
+
+def snapshot_is_fresh(snapshot_filename: str, source_filename: str) -> bool:
+    """Anlık görüntü, kaynak JSON dosyasının şu anki halinden üretildiyse True
+
+    Başlıktaki kaynak boyutu ve değişiklik zamanı (ns) dosyanınkiyle birebir
+    karşılaştırılır; aynı saniyede yapılan düzenlemeler ve kopyalanan
+    dosyalar da bayat sayılır.
+    """
+    stamp = source_stamp(source_filename)
+    if stamp is None:
+        # Kaynak dosya yoksa anlık görüntü de güvenilir değildir
+        return False
+    try:
+        with open(snapshot_filename, 'rb') as file:
+            header = file.read(BookSnapshot._HEADER.size)
+    except OSError:
+        return False
+    if len(header) < BookSnapshot._HEADER.size:
+        return False
+    magic, _, size, mtime_ns = BookSnapshot._HEADER.unpack(header)
+    return magic == BookSnapshot.MAGIC and (size, mtime_ns) == stamp
+
+
+class SnapshotView:
+    """SnapshotIndex'in belirli bir andaki değişmez görünümü
+
+    mmap'teki temel kayıtlar paylaşılır, yalnızca bellekteki değişiklik
+    katmanı kopyalanır. Sayfalar kayıtlardan doğrudan kesilir; sıra
+    numarası temel kayıtlarda kayıt numarası olduğundan arama gerekmez.
+    """
+
+    def __init__(self, snapshot: BookSnapshot, deleted: FrozenSet[int], overrides: Dict[int, Book],
+                 added: List[Book], added_seqs: List[int]):
+        self.snapshot = snapshot
+        self._deleted = deleted
+        self._overrides = overrides
+        self._added = added
+        self._added_seqs = added_seqs
+
+    def __len__(self) -> int:
+        return len(self.snapshot) - len(self._deleted) + len(self._added)
+
+    def _book(self, row: int) -> Book:
+        return self._overrides.get(row) or self.snapshot.book(row)
+
+    def page(self, limit: int, after: Optional[int] = None) -> Tuple[List[Book], Optional[int]]:
+        """after sıra numarasından sonraki en fazla limit kitap
+
+        Sonraki sayfa için after değerini (son sayfada None) döndürür.
+        Yalnızca sayfadaki kayıtlar (ve aradaki silinmişler) okunur.
+        """
+        books: List[Book] = []
+        seqs: List[int] = []
+        row = 0 if after is None else max(after + 1, 0)
+        # Bir fazlası okunur: sonraki sayfa var mı?
+        while row < len(self.snapshot) and len(books) <= limit:
+            if row not in self._deleted:
+                books.append(self._book(row))
+                seqs.append(row)
+            row += 1
+        if len(books) <= limit:
+            start = 0 if after is None else bisect_right(self._added_seqs, after)
+            end = start + limit + 1 - len(books)
+            books.extend(self._added[start:end])
+            seqs.extend(self._added_seqs[start:end])
+        if len(books) > limit:
+            return books[:limit], seqs[limit - 1]
+        return books, None
+
+    def ordered(self) -> Tuple[List[Book], List[int]]:
+        """Ekleme sırasındaki tüm kitaplar ve sıra numaraları"""
+        books: List[Book] = []
+        seqs: List[int] = []
+        for row, book in enumerate(self.snapshot.iter_books()):
+            if row in self._deleted:
+                continue
+            books.append(self._overrides.get(row) or book)
+            seqs.append(row)
+        books.extend(self._added)
+        seqs.extend(self._added_seqs)
+        return books, seqs
+
+
+class SnapshotIndex(MutableMapping[str, Book]):
+    """Anlık görüntü üzerinde ISBN -> Book eşlemesi
+
+    Temel kayıtlar mmap'ten (ya da aynı arayüzdeki SqliteSnapshot'tan)
+    okunur; sonradan yapılan ekleme, güncelleme ve silmeler bellekteki küçük
+    bir katmanda tutulur. Ekleme sırası: önce anlık görüntüdeki kayıtlar
+    (dosya sırasıyla), sonra yeni eklenenler.
+    """
+
+    def __init__(self, snapshot: BookSnapshot):
+        self.snapshot = snapshot
+        self._overrides: Dict[int, Book] = {}
+        self._deleted: Set[int] = set()
+        self._added: Dict[str, Book] = {}
+        self.seqs = SnapshotSeqs(self)
+
+    def base_row(self, isbn: str) -> Optional[int]:
+        """ISBN anlık görüntüde varsa ve silinmemişse kayıt numarası"""
+        row = self.snapshot.find(isbn)
+        if row is None or row in self._deleted:
+            return None
+        return row
+
+    def __getitem__(self, isbn: str) -> Book:
+        book = self._added.get(isbn)
+        if book is not None:
+            return book
+        row = self.base_row(isbn)
+        if row is None:
+            raise KeyError(isbn)
+        return self._overrides.get(row) or self.snapshot.book(row)
+
+    def __setitem__(self, isbn: str, book: Book) -> None:
+        if isbn in self._added:
+            self._added[isbn] = book
+            return
+        row = self.base_row(isbn)
+        if row is None:
+            self._added[isbn] = book
+        else:
+            self._overrides[row] = book
+
+    def __delitem__(self, isbn: str) -> None:
+        if self._added.pop(isbn, None) is not None:
+            return
+        row = self.base_row(isbn)
+        if row is None:
+            raise KeyError(isbn)
+        self._deleted.add(row)
+        self._overrides.pop(row, None)
+
+    def __contains__(self, isbn: object) -> bool:
+        return isbn in self._added or self.base_row(isbn) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for row in range(len(self.snapshot)):
+            if row not in self._deleted:
+                yield self.snapshot.isbn(row)
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        return len(self.snapshot) - len(self._deleted) + len(self._added)
+
+    @property
+    def changes(self) -> int:
+        """Değişiklik katmanının boyutu"""
+        return len(self._overrides) + len(self._deleted) + len(self._added)
+
+    def freeze(self) -> SnapshotView:
+        """Değişiklik katmanının kopyasıyla değişmez görünüm (maliyet değişiklik sayısı kadar)"""
+        added = list(self._added.items())
+        return SnapshotView(
+            self.snapshot, frozenset(self._deleted), dict(self._overrides),
+            [book for _, book in added], [self.seqs.added[isbn] for isbn, _ in added],
+        )
+
+    def ordered(self) -> Tuple[List[Book], List[int]]:
+        """Ekleme sırasındaki kitaplar ve sıra numaraları (temel kayıtlarda kayıt numarası)"""
+        return self.freeze().ordered()
+
+    def values(self):
+        return self.ordered()[0]
+
+
+class SnapshotSeqs(MutableMapping[str, int]):
+    """SnapshotIndex için ISBN -> sıra numarası görünümü
+
+    Anlık görüntüdeki kitapların sıra numarası kayıt numarasıdır; yalnızca
+    sonradan eklenenler bellekte tutulur.
+    """
+
+    def __init__(self, index: SnapshotIndex):
+        self._index = index
+        self.added: Dict[str, int] = {}
+
+    def __getitem__(self, isbn: str) -> int:
+        if isbn in self.added:
+            return self.added[isbn]
+        row = self._index.base_row(isbn)
+        if row is None:
+            raise KeyError(isbn)
+        return row
+
+    def __setitem__(self, isbn: str, seq: int) -> None:
+        self.added[isbn] = seq
+
+    def __delitem__(self, isbn: str) -> None:
+        # Temel kayıtların sıra numarası silme katmanıyla birlikte geçersizleşir
+        self.added.pop(isbn, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
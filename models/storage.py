@@ -0,0 +1,535 @@
+import contextlib
+import json
+import os
+import sqlite3
+import threading
+from array import array
+from bisect import bisect_left
+from typing import Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+from .book import Book
+from .journal import Journal
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Süreçler arası özel kilit (POSIX'te fcntl.flock, Windows'ta msvcrt.locking)
+    
+    Aynı süreç içinde iç içe kullanılabilir; iş parçacıkları da birbirini
+    bekler. Kilit, korunan dosyanın yanındaki <dosya>.lock üzerinde tutulur.
+    """
+    
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file = None
+    
+    def __enter__(self) -> "FileLock":
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._file = open(self.filename, 'a+b')
+                if fcntl is not None:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+                else:
+                    self._file.seek(0)
+                    msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+            except Exception:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+            self._file.close()
+            self._file = None
+        self._thread_lock.release()
+
+
+@contextlib.contextmanager
+def atomic_write(filename: str) -> Iterator:
+    """Dosyayı geçici dosya + fsync + yeniden adlandırma ile yazar
+    
+    Okuyucular (başka süreçler dahil) her zaman ya eski ya da yeni dosyanın
+    tamamını görür; yazma sırasında çökme yarım dosya bırakmaz.
+    """
+    temp_filename = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(temp_filename, 'w', encoding='utf-8') as file:
+            yield file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_filename, filename)
+    except BaseException:
+        if os.path.exists(temp_filename):
+            os.remove(temp_filename)
+        raise
+
+
+def iter_json_array(filename: str, chunk_size: int = 1 << 16) -> Iterator[dict]:
+    """Üst düzeyi dizi olan bir JSON dosyasını kayıt kayıt okur
+
+    Dosya parça parça okunur ve her öğe json.JSONDecoder.raw_decode ile
+    ayrıştırılır; bellekte aynı anda yalnızca okunmakta olan parça ve tek
+    bir kayıt bulunur.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as file:
+        buffer = ""
+        position = 0
+        eof = False
+        started = False
+        
+        def fill() -> bool:
+            nonlocal buffer, position, eof
+            chunk = file.read(chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[position:] + chunk
+            position = 0
+            return True
+        
+        def skip_whitespace() -> None:
+            nonlocal position
+            while True:
+                while position < len(buffer) and buffer[position] in " \t\r\n":
+                    position += 1
+                if position < len(buffer) or not fill():
+                    return
+        
+        skip_whitespace()
+        if position >= len(buffer) or buffer[position] != "[":
+            raise json.JSONDecodeError("JSON dizisi bekleniyordu", buffer, position)
+        position += 1
+        
+        while True:
+            skip_whitespace()
+            if position >= len(buffer):
+                raise json.JSONDecodeError("Beklenmeyen dosya sonu", buffer, position)
+            if buffer[position] == "]":
+                return
+            if started:
+                if buffer[position] != ",":
+                    raise json.JSONDecodeError("',' bekleniyordu", buffer, position)
+                position += 1
+                skip_whitespace()
+            while True:
+                try:
+                    record, end = decoder.raw_decode(buffer, position)
+                    # Sayı gibi değerler parça sınırında kesilmiş olabilir
+                    if end < len(buffer) or eof:
+                        break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                if not fill():
+                    record, end = decoder.raw_decode(buffer, position)
+                    break
+            position = end
+            started = True
+            yield record
+
+
+class StorageBackend:
+    """Library için kalıcı depolama arayüzü
+
+    Değişiklikler Library'den günlük kayıtları olarak gelir:
+    {"op": "add", "book": {...}} ve {"op": "remove", "isbn": "..."}.
+    """
+
+    filename: str
+
+    def load(self) -> List[Book]:
+        """Kayıtlı kitapları ekleme sırasıyla döndürür"""
+        raise NotImplementedError
+    
+    def iter_load(self) -> Iterator[Book]:
+        """Anlık görüntüdeki kitapları okundukça üretir"""
+        return iter(self.load())
+    
+    def load_tail(self) -> List[dict]:
+        """Anlık görüntüden sonra uygulanacak değişiklik kayıtları"""
+        return []
+    
+    def changes(self) -> Optional[List[dict]]:
+        """Son yüklemeden/yazmadan beri başka süreçlerin yaptığı değişiklikler
+        
+        Artımlı uygulanabilecek kayıtları döndürür; tam yeniden yükleme
+        gerekiyorsa None döndürür.
+        """
+        return []
+    
+    def has_changes(self) -> bool:
+        """changes() okumadan, yalnızca dosya durumlarına bakarak kontrol eder"""
+        return False
+    
+    def revision(self) -> Optional[str]:
+        """Son yüklenen/yazılan depo durumunun süreçler arası ortak kimliği
+        
+        Aynı dosya durumuna ulaşmış her süreç aynı değeri üretir; arka uç
+        böyle bir kimlik sunmuyorsa None.
+        """
+        return None
+    
+    def lock(self) -> ContextManager:
+        """Yazmalar için süreçler arası kilit (gerekmiyorsa etkisiz)"""
+        return contextlib.nullcontext()
+
+    def write(self, entries: List[dict]) -> bool:
+        """Değişiklikleri artımlı olarak yazar
+
+        Tam anlık görüntü (save_all) gerekiyorsa True döndürür.
+        """
+        raise NotImplementedError
+
+    def save_all(self, books: List[Book]) -> Optional[int]:
+        """Tüm kataloğu baştan yazar, biliniyorsa yazılan bayt sayısını döndürür"""
+        raise NotImplementedError
+
+    def open_snapshot(self) -> Optional["SqliteSnapshot"]:
+        """Kataloğu yüklemeden okunabilen değişmez görünüm (desteklenmiyorsa None)"""
+        return None
+
+    def close(self) -> None:
+        """Açık kaynakları serbest bırakır"""
+
+
+class JsonStorage(StorageBackend):
+    """library.json dosyası; isteğe bağlı append-only günlük ile
+
+    Günlük modunda değişiklikler <dosya>.journal dosyasına eklenir, günlük
+    compact_threshold baytı aşınca tam anlık görüntü istenir.
+    
+    Paylaşımlı modda (shared=True) aynı dosyayı kullanan süreçler yazmaları
+    <dosya>.lock kilidiyle sıraya sokar. Her süreç günlükte nereye kadar
+    okuduğunu ve anlık görüntünün kimliğini (inode, mtime, boyut) tutar;
+    changes() yalnızca dosya durumlarına bakarak yeni kayıtları bulur.
+    
+    fsync=True ise her write() çağrısı günlüğü diske indirir (grup
+    yazımında her grup için bir kez).
+    """
+
+    JOURNAL_SUFFIX = ".journal"
+    LOCK_SUFFIX = ".lock"
+
+    def __init__(self, filename: str = "library.json", journal: bool = False,
+                 compact_threshold: int = 1024 * 1024, shared: bool = False,
+                 fsync: bool = False):
+        # Paylaşımlı modda değişiklikler diğer süreçlere günlükle aktarılır
+        self.journal_mode = journal or shared
+        self.compact_threshold = compact_threshold
+        self.shared = shared
+        self.fsync = fsync
+        self._snapshot_stamp: Optional[Tuple[int, int, int]] = None
+        self._journal_offset = 0
+        self.filename = filename
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @filename.setter
+    def filename(self, filename: str) -> None:
+        self._filename = filename
+        self.journal = Journal(filename + self.JOURNAL_SUFFIX)
+        self._file_lock = FileLock(filename + self.LOCK_SUFFIX)
+    
+    def lock(self) -> ContextManager:
+        return self._file_lock if self.shared else contextlib.nullcontext()
+    
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        """Anlık görüntü dosyasının kimliği; yeniden yazılınca değişir"""
+        try:
+            stat = os.stat(self.filename)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def iter_load(self) -> Iterator[Book]:
+        if not os.path.exists(self.filename):
+            print("Veri dosyası bulunamadı, yeni kütüphane oluşturuluyor.")
+            return
+        try:
+            for book_data in iter_json_array(self.filename):
+                yield Book.from_dict(book_data)
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            print(f"JSON dosyası okunamadı: {e}")
+    
+    def load_tail(self) -> List[dict]:
+        self._snapshot_stamp = self._stat()
+        entries, self._journal_offset = self.journal.read_from(0)
+        return entries
+    
+    def has_changes(self) -> bool:
+        return self._stat() != self._snapshot_stamp or self.journal.size() != self._journal_offset
+    
+    def revision(self) -> Optional[str]:
+        stamp = self._snapshot_stamp
+        base = "0" if stamp is None else "-".join(f"{part:x}" for part in stamp)
+        return f"{base}.{self._journal_offset:x}"
+    
+    def changes(self) -> Optional[List[dict]]:
+        if self._stat() != self._snapshot_stamp:
+            return None
+        size = self.journal.size()
+        if size < self._journal_offset:
+            # Günlük başka bir süreçte anlık görüntüye katlanmış
+            return None
+        if size == self._journal_offset:
+            return []
+        entries, self._journal_offset = self.journal.read_from(self._journal_offset)
+        return entries
+    
+    def load(self) -> List[Book]:
+        books: Dict[str, Book] = {}
+        for book in self.iter_load():
+            books.setdefault(book.isbn, book)
+        apply_entries(
+            self.load_tail(),
+            add=lambda book: books.__setitem__(book.isbn, book),
+            remove=lambda isbn: books.pop(isbn, None),
+        )
+        return list(books.values())
+    
+    def write(self, entries: List[dict]) -> bool:
+        if not self.journal_mode:
+            return True
+        self.journal.append(entries, fsync=self.fsync)
+        size = self.journal.size()
+        # Kendi kayıtlarımızı changes() ile yeniden okumayalım (paylaşımlı
+        # modda Library bu noktaya diğer süreçlerin kayıtlarını uygulayıp gelir)
+        self._journal_offset = size
+        return size > self.compact_threshold
+
+    def save_all(self, books: List[Book]) -> Optional[int]:
+        with atomic_write(self.filename) as file:
+            json.dump([book.to_dict() for book in books], file, indent=2, ensure_ascii=False)
+            written = file.tell()
+        # Anlık görüntü artık günlükteki tüm değişiklikleri içeriyor
+        self.journal.clear()
+        self._snapshot_stamp = self._stat()
+        self._journal_offset = 0
+        return written
+
+
+class SqliteStorage(StorageBackend):
+    """SQLite veritabanı; satır bazında ekleme/silme
+
+    ISBN benzersiz indeksli, yazar sütunu indekslidir. WAL günlük modu
+    okuyucuların yazmaları beklemesini önler. Ekleme sırası otomatik
+    artan seq sütunuyla korunur.
+    
+    fsync=True ise her commit WAL'i diske indirir (synchronous=FULL);
+    aksi halde NORMAL ile güç kesintisinde son commit'ler kaybolabilir.
+    """
+
+    SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+    def __init__(self, filename: str = "library.db", fsync: bool = False):
+        self.filename = filename
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(f"PRAGMA synchronous={'FULL' if fsync else 'NORMAL'}")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS books ("
+            "seq INTEGER PRIMARY KEY AUTOINCREMENT, "
+            "isbn TEXT NOT NULL UNIQUE, title TEXT NOT NULL, author TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS books_author ON books(author)")
+        self._conn.commit()
+        self._data_version = self._read_data_version()
+    
+    def _read_data_version(self) -> int:
+        """Başka bağlantılar yazdıkça artan SQLite sayacı"""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def load(self) -> List[Book]:
+        return list(self.iter_load())
+    
+    def iter_load(self) -> Iterator[Book]:
+        with self._lock:
+            self._data_version = self._read_data_version()
+            rows = self._conn.execute("SELECT title, author, isbn FROM books ORDER BY seq")
+            for title, author, isbn in rows:
+                yield Book(title=title, author=author, isbn=isbn)
+
+    def has_changes(self) -> bool:
+        with self._lock:
+            return self._read_data_version() != self._data_version
+    
+    def changes(self) -> Optional[List[dict]]:
+        # SQLite satır bazında değişiklik günlüğü tutmaz; başka bir süreç
+        # yazdıysa tam yeniden yükleme istenir
+        return None if self.has_changes() else []
+    
+    def write(self, entries: List[dict]) -> bool:
+        with self._lock, self._conn:
+            for entry in entries:
+                if entry["op"] == "add":
+                    book = entry["book"]
+                    self._conn.execute(
+                        "INSERT INTO books (isbn, title, author) VALUES (?, ?, ?) "
+                        "ON CONFLICT(isbn) DO UPDATE SET title = excluded.title, author = excluded.author",
+                        (book["isbn"], book["title"], book["author"]),
+                    )
+                elif entry["op"] == "remove":
+                    self._conn.execute("DELETE FROM books WHERE isbn = ?", (entry["isbn"],))
+        return False
+
+    def open_snapshot(self) -> Optional["SqliteSnapshot"]:
+        with self._lock:
+            self._data_version = self._read_data_version()
+        try:
+            return SqliteSnapshot(self.filename)
+        except sqlite3.Error as e:
+            print(f"Veritabanı görünümü açılamadı, tüm satırlar yükleniyor: {e}")
+            return None
+
+    def save_all(self, books: List[Book]) -> Optional[int]:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM books")
+            self._conn.executemany(
+                "INSERT INTO books (isbn, title, author) VALUES (?, ?, ?)",
+                ((book.isbn, book.title, book.author) for book in books),
+            )
+        return None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class SqliteSnapshot:
+    """SQLite kataloğunun açıldığı andaki değişmez görünümü (BookSnapshot arayüzü)
+
+    Ayrı bir bağlantıda açık tutulan okuma işlemi, WAL modunda veritabanının
+    o anki halini görmeye devam eder; sonraki yazmalar görünümü etkilemez.
+    Açılışta yalnızca seq sütunu okunur (kitap başına 8 bayt); kitaplar
+    erişildikçe birincil anahtar ya da ISBN indeksiyle sorgulanır. Kayıt
+    numarası, satırın seq sırasındaki yeridir.
+
+    Açık okuma işlemi WAL'in checkpoint ile başa sarılmasını engeller;
+    görünümle işi biten close() ile kapatmalıdır.
+    """
+
+    # Tüm kitaplar okunurken tek sorguda alınan satır sayısı
+    CHUNK_SIZE = 1000
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(filename, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("BEGIN")
+            rows = self._conn.execute("SELECT seq FROM books ORDER BY seq")
+            self._seqs = array("q", (seq for (seq,) in rows))
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._seqs)
+
+    def _fetch(self, sql: str, row: int) -> tuple:
+        with self._lock:
+            return self._conn.execute(sql, (self._seqs[row],)).fetchone()
+
+    def isbn(self, row: int) -> str:
+        """Kayıt numarasındaki ISBN"""
+        return self._fetch("SELECT isbn FROM books WHERE seq = ?", row)[0]
+
+    def book(self, row: int) -> Book:
+        """Kayıt numarasındaki kitabı okur"""
+        title, author, isbn = self._fetch("SELECT title, author, isbn FROM books WHERE seq = ?", row)
+        return Book(title=title, author=author, isbn=isbn)
+
+    def find(self, isbn: str) -> Optional[int]:
+        """ISBN'in kayıt numarasını ISBN indeksiyle bulur"""
+        with self._lock:
+            found = self._conn.execute("SELECT seq FROM books WHERE isbn = ?", (isbn,)).fetchone()
+        if found is None:
+            return None
+        return bisect_left(self._seqs, found[0])
+
+    def iter_books(self) -> Iterator[Book]:
+        """Tüm kitaplar kayıt sırasıyla; kilit parça aralarında bırakılır"""
+        last = -1
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT seq, title, author, isbn FROM books WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (last, self.CHUNK_SIZE),
+                ).fetchall()
+            if not rows:
+                return
+            for _, title, author, isbn in rows:
+                yield Book(title=title, author=author, isbn=isbn)
+            last = rows[-1][0]
+
+    def close(self) -> None:
+        """Okuma işlemini bitirir ve bağlantıyı kapatır; tekrar çağrılabilir"""
+        with self._lock:
+            self._conn.close()
+
+
+def apply_entries(entries: List[dict], add: Callable[[Book], None],
+                  remove: Callable[[str], None]) -> int:
+    """Günlük kayıtlarını sırayla add/remove geri çağrılarına uygular
+
+    Uygulanan kayıt sayısını döndürür.
+    """
+    applied = 0
+    for entry in entries:
+        try:
+            if entry["op"] == "add":
+                add(Book.from_dict(entry["book"]))
+            elif entry["op"] == "remove":
+                remove(entry["isbn"])
+            applied += 1
+        except (KeyError, TypeError) as e:
+            print(f"Günlük kaydı uygulanamadı: {e}")
+    if applied:
+        print(f"Günlükten {applied} değişiklik uygulandı.")
+    return applied
+
+
+def open_storage(filename: str, journal: bool = False,
+                 compact_threshold: int = 1024 * 1024, shared: bool = False,
+                 fsync: bool = False) -> StorageBackend:
+    """Dosya uzantısına göre uygun depolama arka ucunu açar"""
+    if filename.endswith(SqliteStorage.SUFFIXES):
+        # SQLite süreçler arası kilitlemeyi kendisi yapar
+        return SqliteStorage(filename, fsync=fsync)
+    return JsonStorage(filename, journal=journal, compact_threshold=compact_threshold,
+                       shared=shared, fsync=fsync)
+
+
+def migrate(source: str, target: str) -> int:
+    """Bir depodaki kataloğu diğerine kopyalar (ör. library.json -> library.db)"""
+    source_storage = open_storage(source)
+    target_storage = open_storage(target)
+    try:
+        books = source_storage.load()
+        target_storage.save_all(books)
+    finally:
+        source_storage.close()
+        target_storage.close()
+    return len(books)
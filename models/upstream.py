@@ -0,0 +1,321 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Awaitable, Callable, Iterator, Optional, Tuple
+import httpx
+from .metrics import UPSTREAM_CIRCUIT_STATE, UPSTREAM_RETRIES
+
+
+class CircuitOpenError(httpx.RequestError):
+    """Devre açıkken Open Library'ye istek atılmadan verilen hata
+
+    httpx.RequestError'dan türediği için mevcut bağlantı hatası yolları
+    tarafından yakalanır.
+    """
+
+
+class TokenBucket:
+    """Saniyede rate jeton üreten, en fazla burst jeton biriktiren kova
+
+    reserve() her zaman bir jeton ayırır (kova eksiye düşebilir) ve jetonun
+    hazır olması için beklenmesi gereken süreyi döndürür; böylece bekleyenler
+    sırayla ve eşit aralıklarla geçer. rate None ise sınırsızdır.
+    """
+
+    def __init__(self, rate: Optional[float], burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Bir jeton ayırır, beklenmesi gereken saniyeyi döndürür"""
+        if not self.rate:
+            return 0.0
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    @property
+    def tokens(self) -> Optional[float]:
+        """O anki jeton sayısı (sınırsızsa None)"""
+        if not self.rate:
+            return None
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+class CircuitBreaker:
+    """Art arda failure_threshold hatadan sonra reset_timeout boyunca açılan devre
+
+    Açıkken istekler hemen CircuitOpenError ile reddedilir. Süre dolunca
+    devre yarı açık olur ve tek bir deneme isteğine izin verilir: başarılıysa
+    kapanır, başarısızsa yeniden açılır. failure_threshold 0 ise devre devre
+    dışıdır.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    # Metrik değerleri (openlibrary_circuit_state göstergesi)
+    _GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """İstek öncesi çağrılır; devre açıksa CircuitOpenError fırlatır"""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    raise CircuitOpenError("Open Library geçici olarak devre dışı (devre açık)")
+                self._set_state(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    raise CircuitOpenError("Open Library deneme isteği sürüyor (devre yarı açık)")
+                self._probing = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probing = False
+            if self.state != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self._set_state(self.OPEN)
+
+    def release_probe(self) -> None:
+        """Sonuçlanmadan biten (iptal edilen) deneme isteğinin yerini boşaltır"""
+        with self._lock:
+            self._probing = False
+
+    def retry_in(self) -> Optional[float]:
+        """Devre açıksa deneme isteğine kalan saniye"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return None
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        UPSTREAM_CIRCUIT_STATE.set(self._GAUGE[state])
+
+
+class UpstreamPolicy:
+    """Open Library çağrıları için hız sınırı, eşzamanlılık, yeniden deneme ve devre kesici
+
+    Her deneme önce devreye sorulur, sonra kovadan bir jeton alınır ve
+    eşzamanlılık sınırı içinde gönderilir. RETRY_STATUSES yanıtları ve
+    bağlantı/zaman aşımı hataları (httpx.RequestError) en fazla
+    max_retries kez, tam rastgele (full jitter) üstel beklemeyle yeniden
+    denenir; Retry-After başlığı varsa ona uyulur. Başarısız her deneme
+    devre kesicide hata olarak sayılır.
+    """
+
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+    # Ortam değişkenleri: saniyedeki istek sınırı (0 = sınırsız) ve yeniden deneme sayısı
+    RATE_ENV = "OPEN_LIBRARY_RATE"
+    RETRIES_ENV = "OPEN_LIBRARY_MAX_RETRIES"
+
+    def __init__(self, rate: Optional[float] = None, burst: int = 10, max_concurrency: int = 20,
+                 max_retries: int = 2, backoff_base: float = 0.2, backoff_max: float = 5.0,
+                 failure_threshold: int = 5, reset_timeout: float = 30.0, timeout: float = 10.0,
+                 seed: Optional[int] = None):
+        self.bucket = TokenBucket(rate, burst)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.breaker = CircuitBreaker(failure_threshold, reset_timeout)
+        self.timeout = timeout
+        self.retries = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._semaphore = threading.BoundedSemaphore(max_concurrency)
+        # asyncio.Semaphore döngüye bağlıdır; her olay döngüsü için ayrı tutulur
+        self._async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    @classmethod
+    def from_env(cls) -> "UpstreamPolicy":
+        """Varsayılan politikayı ortam değişkenleriyle ayarlayarak oluşturur"""
+        rate = float(os.environ.get(cls.RATE_ENV) or 0) or None
+        retries = int(os.environ.get(cls.RETRIES_ENV) or 2)
+        return cls(rate=rate, max_retries=retries)
+
+    def send(self, request: Callable[[], httpx.Response]) -> httpx.Response:
+        """request()'i politika altında çalıştırır
+
+        Yeniden denemeler bitince son yanıt döndürülür (durum koduna göre
+        karar çağırana kalır) ya da son bağlantı hatası fırlatılır.
+        """
+        for attempt in range(self.max_retries + 1):
+            self._before_attempt()
+            try:
+                wait = self.bucket.reserve()
+                if wait:
+                    time.sleep(wait)
+                with self._slot(self._semaphore):
+                    response, error = self._attempt(request)
+                delay = self._after_attempt(attempt, response, error)
+            except BaseException:
+                # Beklenmeyen hata ya da iptal (hız sınırı/eşzamanlılık
+                # beklemesinde dahil): deneme isteği yeri boşaltılır
+                self.breaker.release_probe()
+                raise
+            if delay is None:
+                break
+            time.sleep(delay)
+        return self._result(response, error)
+
+    async def send_async(self, request: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """send'in asenkron karşılığı"""
+        semaphore = self._async_semaphore()
+        for attempt in range(self.max_retries + 1):
+            self._before_attempt()
+            try:
+                wait = self.bucket.reserve()
+                if wait:
+                    await asyncio.sleep(wait)
+                async with semaphore:
+                    with self._slot():
+                        response, error = await self._attempt_async(request)
+                delay = self._after_attempt(attempt, response, error)
+            except BaseException:
+                self.breaker.release_probe()
+                raise
+            if delay is None:
+                break
+            await asyncio.sleep(delay)
+        return self._result(response, error)
+
+    def state(self) -> dict:
+        """Politikanın ayarları ve anlık durumu (API'de gösterilir)"""
+        tokens = self.bucket.tokens
+        return {
+            "circuit": {
+                "state": self.breaker.state,
+                "consecutive_failures": self.breaker.failures,
+                "failure_threshold": self.breaker.failure_threshold,
+                "reset_timeout": self.breaker.reset_timeout,
+                "retry_in": self.breaker.retry_in(),
+                "rejected": self.rejected,
+            },
+            "rate_limit": {
+                "rate": self.bucket.rate,
+                "burst": self.bucket.burst,
+                "tokens": round(tokens, 2) if tokens is not None else None,
+            },
+            "concurrency": {"limit": self.max_concurrency, "in_flight": self.in_flight},
+            "retry": {
+                "max_retries": self.max_retries,
+                "backoff_base": self.backoff_base,
+                "backoff_max": self.backoff_max,
+                "retries": self.retries,
+            },
+            "timeout": self.timeout,
+        }
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """attempt'inci başarısız denemeden sonra beklenecek süre"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after is not None:
+            try:
+                return min(self.backoff_max, max(0.0, float(retry_after)))
+            except ValueError:
+                pass
+        return self._random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def _before_attempt(self) -> None:
+        try:
+            self.breaker.before_request()
+        except CircuitOpenError:
+            with self._lock:
+                self.rejected += 1
+            raise
+
+    @contextmanager
+    def _slot(self, semaphore: Optional[threading.BoundedSemaphore] = None) -> Iterator[None]:
+        """Eşzamanlılık sınırı içinde bir istek yeri tutar ve sayar"""
+        if semaphore is not None:
+            semaphore.acquire()
+        with self._lock:
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            if semaphore is not None:
+                semaphore.release()
+
+    def _attempt(self, request: Callable[[], httpx.Response]) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
+        """Tek deneme: yanıtı ya da bağlantı hatasını döndürür"""
+        try:
+            return request(), None
+        except httpx.RequestError as e:
+            return None, e
+
+    async def _attempt_async(self, request: Callable[[], Awaitable[httpx.Response]]
+                             ) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
+        """_attempt'in asenkron karşılığı"""
+        try:
+            return await request(), None
+        except httpx.RequestError as e:
+            return None, e
+
+    def _after_attempt(self, attempt: int, response: Optional[httpx.Response],
+                       error: Optional[Exception]) -> Optional[float]:
+        """Denemenin sonucunu devreye yazar; yeniden denenecekse bekleme süresini döndürür"""
+        if response is not None and response.status_code not in self.RETRY_STATUSES:
+            self.breaker.record_success()
+            return None
+        self.breaker.record_failure()
+        if attempt >= self.max_retries or self.breaker.state == CircuitBreaker.OPEN:
+            return None
+        with self._lock:
+            self.retries += 1
+        UPSTREAM_RETRIES.inc()
+        return self.backoff(attempt, response)
+
+    def _result(self, response: Optional[httpx.Response], error: Optional[Exception]) -> httpx.Response:
+        if response is None:
+            raise error
+        return response
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._async_semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
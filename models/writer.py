@@ -0,0 +1,121 @@
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, List, Optional
+
+
+class GroupCommitWriter:
+    """Değişiklik kayıtlarını gruplayıp arka planda yazan yazıcı
+
+    submit() kayıtları kuyruğa ekler ve kayıtların yazıldığı grup
+    tamamlanınca sonuçlanan bir Future döndürür; çağıran bekleyebilir ya da
+    beklemeden devam edebilir. Bir grup, ilk kaydından interval saniye sonra
+    ya da kuyrukta max_pending kayıt biriktiğinde tek bir flush çağrısıyla
+    yazılır. Gruplar gönderildikleri sırayla yazılır.
+    """
+
+    DEFAULT_INTERVAL = 0.05
+    DEFAULT_MAX_PENDING = 256
+
+    def __init__(self, flush: Callable[[List[dict]], None],
+                 interval: float = DEFAULT_INTERVAL, max_pending: int = DEFAULT_MAX_PENDING,
+                 name: str = "library-writer"):
+        self._flush = flush
+        self.interval = interval
+        self.max_pending = max_pending
+        self._condition = threading.Condition()
+        self._pending: List[dict] = []
+        self._waiters: List[Future] = []
+        self._deadline: Optional[float] = None
+        self._flush_requested = False
+        self._closed = False
+        self.groups = 0
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    @property
+    def pending(self) -> int:
+        """Henüz yazılmamış kayıt sayısı"""
+        with self._condition:
+            return len(self._pending)
+
+    def submit(self, entries: List[dict]) -> Future:
+        """Kayıtları bir sonraki gruba ekler
+
+        Dönen Future, grup yazılınca gruptaki kayıt sayısıyla sonuçlanır.
+        """
+        future: Future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Yazıcı kapatıldı")
+            self._pending.extend(entries)
+            self._waiters.append(future)
+            # Yeni grubun süresi başlar ya da eşik aşıldı: yazıcı uyandırılır
+            if self._deadline is None or len(self._pending) >= self.max_pending:
+                if self._deadline is None:
+                    self._deadline = time.monotonic() + self.interval
+                self._condition.notify()
+        return future
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Bekleyen grubu beklemeden yazdırır ve yazılmasını bekler
+
+        Zaman aşımında False döndürür.
+        """
+        with self._condition:
+            if self._closed:
+                return True
+            future: Future = Future()
+            self._waiters.append(future)
+            self._flush_requested = True
+            self._condition.notify()
+        try:
+            future.result(timeout)
+        except FutureTimeoutError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """Bekleyen kayıtları yazar ve arka plan iş parçacığını durdurur"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def _next_group(self) -> Optional[tuple]:
+        """Yazılacak sıradaki grubu bekler; kapatıldıysa ve boşsa None"""
+        with self._condition:
+            while True:
+                if self._waiters:
+                    if self._closed or self._flush_requested or len(self._pending) >= self.max_pending:
+                        break
+                    remaining = self._deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                elif self._closed:
+                    return None
+                else:
+                    self._condition.wait()
+            group = (self._pending, self._waiters)
+            self._pending, self._waiters = [], []
+            self._deadline = None
+            self._flush_requested = False
+            return group
+
+    def _run(self) -> None:
+        while True:
+            group = self._next_group()
+            if group is None:
+                return
+            entries, waiters = group
+            try:
+                if entries:
+                    self._flush(entries)
+                    self.groups += 1
+            except Exception as e:
+                for waiter in waiters:
+                    waiter.set_exception(e)
+            else:
+                for waiter in waiters:
+                    waiter.set_result(len(entries))
@@ -0,0 +1,19 @@
+import pytest
+import sys
+import os
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.library import Library
+
+
+@pytest.fixture
+def api_library(tmp_path, monkeypatch):
+    """API'nin kullandığı global kütüphaneyi geçici dosyalı boş bir örnekle değiştirir"""
+    import api
+
+    library = Library(str(tmp_path / "library.json"))
+    monkeypatch.setattr(api, "library", library)
+    yield library
+    library.close()
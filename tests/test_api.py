@@ -1,211 +1,494 @@
-import pytest
-import sys
-import os
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
-
-# Test için modülleri import etmek için path ayarı
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from api import app
-from models.book import Book
-
-
-class TestAPI:
-    """FastAPI endpoint testleri"""
-    
-    @pytest.fixture
-    def client(self):
-        """Test client'ı"""
-        return TestClient(app)
-    
-    def test_root_endpoint(self, client):
-        """Ana endpoint testi"""
-        response = client.get("/")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "message" in data
-        assert "version" in data
-        assert data["version"] == "1.0.0"
-    
-    def test_health_endpoint(self, client):
-        """Sağlık kontrolü endpoint testi"""
-        response = client.get("/health")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "healthy"
-        assert "total_books" in data
-    
-    def test_get_books_empty(self, client):
-        """Boş kütüphane listeleme testi"""
-        # Önce kütüphaneyi temizle
-        app.state.library = None
-        from models.library import Library
-        import tempfile
-        temp_file = tempfile.NamedTemporaryFile(delete=False)
-        temp_file.close()
-        
-        # Yeni boş kütüphane oluştur
-        from api import library
-        library.books = []
-        
-        response = client.get("/books")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data == []
-    
-    @patch('models.library.Library.add_book')
-    def test_add_book_success(self, mock_add_book, client):
-        """Başarılı kitap ekleme testi"""
-        mock_add_book.return_value = True
-        
-        # Mock library.find_book to return the added book
-        with patch('models.library.Library.find_book') as mock_find:
-            mock_book = Book("Test Book", "Test Author", "978-0441172719")
-            mock_find.return_value = mock_book
-            
-            response = client.post("/books", json={"isbn": "978-0441172719"})
-            
-            assert response.status_code == 200
-            data = response.json()
-            assert data["title"] == "Test Book"
-            assert data["author"] == "Test Author"
-            assert data["isbn"] == "978-0441172719"
-    
-    def test_add_book_empty_isbn(self, client):
-        """Boş ISBN ile kitap ekleme testi"""
-        response = client.post("/books", json={"isbn": ""})
-        
-        assert response.status_code == 400
-        data = response.json()
-        assert "ISBN boş olamaz" in data["detail"]
-    
-    @patch('models.library.Library.find_book')
-    def test_add_book_duplicate(self, mock_find_book, client):
-        """Duplicate kitap ekleme testi"""
-        mock_book = Book("Existing Book", "Existing Author", "978-0441172719")
-        mock_find_book.return_value = mock_book
-        
-        response = client.post("/books", json={"isbn": "978-0441172719"})
-        
-        assert response.status_code == 409
-        data = response.json()
-        assert "zaten mevcut" in data["detail"]
-    
-    @patch('models.library.Library.add_book')
-    @patch('models.library.Library.find_book')
-    def test_add_book_api_failure(self, mock_find_book, mock_add_book, client):
-        """API hatası ile kitap ekleme testi"""
-        mock_find_book.side_effect = [None, None]  # İlk check'te yok, ekledikten sonra da yok
-        mock_add_book.return_value = False
-        
-        response = client.post("/books", json={"isbn": "978-0441172719"})
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "bulunamadı" in data["detail"] or "API hatası" in data["detail"]
-    
-    @patch('models.library.Library.find_book')
-    def test_get_book_success(self, mock_find_book, client):
-        """Başarılı kitap bulma testi"""
-        mock_book = Book("Found Book", "Found Author", "978-0441172719")
-        mock_find_book.return_value = mock_book
-        
-        response = client.get("/books/978-0441172719")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert data["title"] == "Found Book"
-        assert data["author"] == "Found Author"
-        assert data["isbn"] == "978-0441172719"
-    
-    @patch('models.library.Library.find_book')
-    def test_get_book_not_found(self, mock_find_book, client):
-        """Bulunamayan kitap testi"""
-        mock_find_book.return_value = None
-        
-        response = client.get("/books/nonexistent")
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "bulunamadı" in data["detail"]
-    
-    def test_get_book_empty_isbn(self, client):
-        """Boş ISBN ile kitap arama testi"""
-        response = client.get("/books/")
-        
-        # Bu durumda endpoint bulunamaz
-        assert response.status_code == 404
-    
-    @patch('models.library.Library.find_book')
-    @patch('models.library.Library.remove_book')
-    def test_delete_book_success(self, mock_remove_book, mock_find_book, client):
-        """Başarılı kitap silme testi"""
-        mock_book = Book("Book to Delete", "Author", "978-0441172719")
-        mock_find_book.return_value = mock_book
-        mock_remove_book.return_value = True
-        
-        response = client.delete("/books/978-0441172719")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert "başarıyla silindi" in data["message"]
-        assert "Book to Delete" in data["message"]
-    
-    @patch('models.library.Library.find_book')
-    def test_delete_book_not_found(self, mock_find_book, client):
-        """Olmayan kitap silme testi"""
-        mock_find_book.return_value = None
-        
-        response = client.delete("/books/nonexistent")
-        
-        assert response.status_code == 404
-        data = response.json()
-        assert "bulunamadı" in data["detail"]
-    
-    @patch('models.library.Library.find_book')
-    @patch('models.library.Library.remove_book')
-    def test_delete_book_failure(self, mock_remove_book, mock_find_book, client):
-        """Kitap silme hatası testi"""
-        mock_book = Book("Book to Delete", "Author", "978-0441172719")
-        mock_find_book.return_value = mock_book
-        mock_remove_book.return_value = False
-        
-        response = client.delete("/books/978-0441172719")
-        
-        assert response.status_code == 500
-        data = response.json()
-        assert "hata oluştu" in data["detail"]
-    
-    def test_delete_book_empty_isbn(self, client):
-        """Boş ISBN ile kitap silme testi"""
-        response = client.delete("/books/")
-        
-        # Bu durumda endpoint bulunamaz
-        assert response.status_code == 404
-    
-    @patch('models.library.Library.list_books')
-    def test_get_books_with_data(self, mock_list_books, client):
-        """Kitap listesi dolu testi"""
-        mock_books = [
-            Book("Book 1", "Author 1", "111"),
-            Book("Book 2", "Author 2", "222")
-        ]
-        mock_list_books.return_value = mock_books
-        
-        response = client.get("/books")
-        
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 2
-        assert data[0]["title"] == "Book 1"
-        assert data[1]["title"] == "Book 2"
-    
-    def test_invalid_json_request(self, client):
-        """Geçersiz JSON isteği testi"""
-        response = client.post("/books", data="invalid json")
-        
-        assert response.status_code == 422  # Unprocessable Entity
\ No newline at end of file
+import pytest
+import sys
+import os
+from unittest.mock import patch, MagicMock, AsyncMock
+from fastapi.testclient import TestClient
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from api import app, encode_cursor
+from models.book import Book
+
+
+class TestAPI:
+    """FastAPI endpoint testleri"""
+    
+    @pytest.fixture
+    def client(self):
+        """Test client'ı"""
+        return TestClient(app)
+    
+    def test_root_endpoint(self, client):
+        """Ana endpoint testi"""
+        response = client.get("/")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "message" in data
+        assert "version" in data
+        assert data["version"] == "1.0.0"
+    
+    def test_health_endpoint(self, client):
+        """Sağlık kontrolü endpoint testi"""
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert "total_books" in data
+
+    def test_upstream_status_endpoint(self, client):
+        """Open Library politika durumu JSON olarak döner"""
+        response = client.get("/upstream")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["circuit"]["state"] == "closed"
+        assert set(data) >= {"rate_limit", "concurrency", "retry"}
+
+    def test_metrics_endpoint(self, client):
+        """Metrikler Prometheus biçiminde, route şablonuyla etiketlenir"""
+        client.get("/books/metrics-test-isbn")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert "# TYPE http_requests_total counter" in text
+        assert 'http_requests_total{method="GET",route="/books/{isbn}",status="404"}' in text
+        assert "http_request_duration_seconds_bucket" in text
+        assert "library_books " in text
+        assert "metrics-test-isbn" not in text
+
+    def test_get_books_empty(self, client):
+        """Boş kütüphane listeleme testi"""
+        # Önce kütüphaneyi temizle
+        app.state.library = None
+        from models.library import Library
+        import tempfile
+        temp_file = tempfile.NamedTemporaryFile(delete=False)
+        temp_file.close()
+        
+        # Yeni boş kütüphane oluştur
+        from api import library
+        library.books = []
+        
+        response = client.get("/books")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data == {"items": [], "next_cursor": None}
+    
+    @patch('models.library.Library.add_book_async', new_callable=AsyncMock)
+    def test_add_book_success(self, mock_add_book, client):
+        """Başarılı kitap ekleme testi"""
+        mock_add_book.return_value = True
+        
+        # Mock library.find_book: ilk kontrolde yok, eklendikten sonra var
+        with patch('models.library.Library.find_book') as mock_find:
+            mock_book = Book("Test Book", "Test Author", "978-0441172719")
+            mock_find.side_effect = [None, mock_book]
+            
+            response = client.post("/books", json={"isbn": "978-0441172719"})
+            
+            assert response.status_code == 200
+            data = response.json()
+            assert data["title"] == "Test Book"
+            assert data["author"] == "Test Author"
+            assert data["isbn"] == "978-0441172719"
+    
+    def test_add_book_empty_isbn(self, client):
+        """Boş ISBN ile kitap ekleme testi"""
+        response = client.post("/books", json={"isbn": ""})
+        
+        assert response.status_code == 400
+        data = response.json()
+        assert "ISBN boş olamaz" in data["detail"]
+    
+    @patch('models.library.Library.add_books_async', new_callable=AsyncMock)
+    def test_add_books_batch(self, mock_add_books, client):
+        """Toplu kitap ekleme testi"""
+        mock_add_books.return_value = {
+            "111": "added",
+            "222": "duplicate",
+            "333": "not_found",
+        }
+        
+        response = client.post("/books/batch", json={"isbns": ["111", "222", "333"], "concurrency": 5})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"]["111"] == "added"
+        assert data["summary"] == {"added": 1, "duplicate": 1, "not_found": 1}
+        assert mock_add_books.call_args.kwargs["concurrency"] == 5
+    
+    def test_add_books_batch_empty(self, client):
+        """Boş ISBN listesi ile toplu ekleme testi"""
+        response = client.post("/books/batch", json={"isbns": [" "]})
+        
+        assert response.status_code == 400
+    
+    def test_delete_books_batch(self, client, api_library):
+        """Toplu silme ISBN listesi ya da yazarla çalışır, rapor döndürür"""
+        api_library.books = [
+            Book("İnce Memed", "Yaşar Kemal", "111"),
+            Book("Yer Demir Gök Bakır", "YAŞAR KEMAL", "222"),
+            Book("Tutunamayanlar", "Oğuz Atay", "333"),
+        ]
+        
+        response = client.request("DELETE", "/books", json={"isbns": ["333", "999"]})
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": {"333": "removed", "999": "not_found"},
+            "summary": {"removed": 1, "not_found": 1},
+        }
+        
+        response = client.request("DELETE", "/books", json={"author": "yaşar kemal"})
+        assert response.json()["results"] == {"111": "removed", "222": "removed"}
+        assert api_library.count_books() == 0
+    
+    def test_delete_books_batch_requires_one_filter(self, client):
+        """ISBN listesi ve yazar birlikte ya da hiç verilmezse 400 döner"""
+        assert client.request("DELETE", "/books", json={}).status_code == 400
+        assert client.request("DELETE", "/books", json={"isbns": ["1"], "author": "X"}).status_code == 400
+        assert client.request("DELETE", "/books", json={"isbns": [" "]}).status_code == 400
+    
+    @patch('models.library.Library.search_books')
+    def test_search_books(self, mock_search_books, client):
+        """Başlık/yazar arama endpoint testi"""
+        mock_search_books.return_value = [Book("İnce Memed", "Yaşar Kemal", "222")]
+        
+        response = client.get("/books/search", params={"q": "ince", "limit": 10})
+        
+        assert response.status_code == 200
+        assert response.json() == [{"title": "İnce Memed", "author": "Yaşar Kemal", "isbn": "222"}]
+        mock_search_books.assert_called_once_with("ince", limit=10)
+    
+    def test_search_books_empty_query(self, client):
+        """Boş sorgu ile arama testi"""
+        response = client.get("/books/search", params={"q": ""})
+        
+        assert response.status_code == 422
+    
+    @patch('models.library.Library.find_book')
+    def test_add_book_duplicate(self, mock_find_book, client):
+        """Duplicate kitap ekleme testi"""
+        mock_book = Book("Existing Book", "Existing Author", "978-0441172719")
+        mock_find_book.return_value = mock_book
+        
+        response = client.post("/books", json={"isbn": "978-0441172719"})
+        
+        assert response.status_code == 409
+        data = response.json()
+        assert "zaten mevcut" in data["detail"]
+    
+    @patch('models.library.Library.add_book_async', new_callable=AsyncMock)
+    @patch('models.library.Library.find_book')
+    def test_add_book_api_failure(self, mock_find_book, mock_add_book, client):
+        """API hatası ile kitap ekleme testi"""
+        mock_find_book.side_effect = [None, None]  # İlk check'te yok, ekledikten sonra da yok
+        mock_add_book.return_value = False
+        
+        response = client.post("/books", json={"isbn": "978-0441172719"})
+        
+        assert response.status_code == 404
+        data = response.json()
+        assert "bulunamadı" in data["detail"] or "API hatası" in data["detail"]
+    
+    @patch('models.library.Library.find_book')
+    def test_get_book_success(self, mock_find_book, client):
+        """Başarılı kitap bulma testi"""
+        mock_book = Book("Found Book", "Found Author", "978-0441172719")
+        mock_find_book.return_value = mock_book
+        
+        response = client.get("/books/978-0441172719")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["title"] == "Found Book"
+        assert data["author"] == "Found Author"
+        assert data["isbn"] == "978-0441172719"
+    
+    @patch('models.library.Library.find_book')
+    def test_get_book_not_found(self, mock_find_book, client):
+        """Bulunamayan kitap testi"""
+        mock_find_book.return_value = None
+        
+        response = client.get("/books/nonexistent")
+        
+        assert response.status_code == 404
+        data = response.json()
+        assert "bulunamadı" in data["detail"]
+    
+    def test_get_book_empty_isbn(self, client):
+        """Boş ISBN ile kitap arama testi"""
+        response = client.get("/books/")
+        
+        # Bu durumda endpoint bulunamaz
+        assert response.status_code == 404
+    
+    @patch('models.library.Library.find_book')
+    @patch('models.library.Library.remove_book_async', new_callable=AsyncMock)
+    def test_delete_book_success(self, mock_remove_book, mock_find_book, client):
+        """Başarılı kitap silme testi"""
+        mock_book = Book("Book to Delete", "Author", "978-0441172719")
+        mock_find_book.return_value = mock_book
+        mock_remove_book.return_value = True
+        
+        response = client.delete("/books/978-0441172719")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert "başarıyla silindi" in data["message"]
+        assert "Book to Delete" in data["message"]
+    
+    @patch('models.library.Library.find_book')
+    def test_delete_book_not_found(self, mock_find_book, client):
+        """Olmayan kitap silme testi"""
+        mock_find_book.return_value = None
+        
+        response = client.delete("/books/nonexistent")
+        
+        assert response.status_code == 404
+        data = response.json()
+        assert "bulunamadı" in data["detail"]
+    
+    @patch('models.library.Library.find_book')
+    @patch('models.library.Library.remove_book_async', new_callable=AsyncMock)
+    def test_delete_book_failure(self, mock_remove_book, mock_find_book, client):
+        """Kitap silme hatası testi"""
+        mock_book = Book("Book to Delete", "Author", "978-0441172719")
+        mock_find_book.return_value = mock_book
+        mock_remove_book.return_value = False
+        
+        response = client.delete("/books/978-0441172719")
+        
+        assert response.status_code == 500
+        data = response.json()
+        assert "hata oluştu" in data["detail"]
+    
+    def test_mutations_wait_for_load_off_the_event_loop(self, tmp_path, monkeypatch):
+        """Yükleme sürerken gelen ekleme/silme istekleri diğer istekleri bekletmez"""
+        import api
+        import asyncio
+        import httpx
+        import json
+        import threading
+        from models.library import Library
+        from models.storage import JsonStorage
+
+        filename = tmp_path / "library.json"
+        filename.write_text(json.dumps([
+            {"title": "Kitap", "author": "Yazar", "isbn": "111"},
+            {"title": "Diğer", "author": "Yazar", "isbn": "222"},
+        ]), encoding="utf-8")
+        release = threading.Event()
+        first_loaded = threading.Event()
+        original_iter_load = JsonStorage.iter_load
+
+        def gated_iter_load(storage):
+            for i, book in enumerate(original_iter_load(storage)):
+                yield book
+                if i == 0:
+                    first_loaded.set()
+                    release.wait(5)
+
+        monkeypatch.setattr(JsonStorage, "iter_load", gated_iter_load)
+        test_library = Library(str(filename), background_load=True)
+        monkeypatch.setattr(api, "library", test_library)
+        assert first_loaded.wait(5)
+
+        async def run():
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+                add = asyncio.create_task(async_client.post("/books", json={"isbn": "111"}))
+                delete = asyncio.create_task(async_client.delete("/books/222"))
+                health = await asyncio.wait_for(async_client.get("/health"), 2)
+                pending = not add.done() and not delete.done()
+                release.set()
+                return health, pending, await add, await delete
+
+        health, pending, add, delete = asyncio.run(run())
+        assert health.status_code == 200
+        assert health.json()["loading"] is True
+        assert pending
+        assert add.status_code == 409
+        assert delete.status_code == 200
+        test_library.close()
+
+    def test_delete_book_empty_isbn(self, client):
+        """Boş ISBN ile kitap silme testi"""
+        response = client.delete("/books/")
+        
+        # Bu durumda endpoint bulunamaz
+        assert response.status_code == 404
+    
+    def test_get_books_with_data(self, client, api_library):
+        """Kitap listesi dolu testi"""
+        api_library.books = [
+            Book("Book 1", "Author 1", "111"),
+            Book("Book 2", "Author 2", "222")
+        ]
+        
+        response = client.get("/books", params={"all": "true"})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert data[0]["title"] == "Book 1"
+        assert data[1]["title"] == "Book 2"
+    
+    def test_invalid_json_request(self, client):
+        """Geçersiz JSON isteği testi"""
+        response = client.post("/books", data="invalid json")
+        
+        assert response.status_code == 422  # Unprocessable Entity
+    
+    def test_get_books_pagination(self, client, api_library):
+        """İmleçli sayfalama, sayfalar arası ekleme/silmeye dayanıklıdır"""
+        for i in range(5):
+            api_library.add_book_manual(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        
+        first = client.get("/books", params={"limit": 2}).json()
+        assert [b["isbn"] for b in first["items"]] == ["isbn-0", "isbn-1"]
+        assert first["next_cursor"]
+        
+        # Sayfalar arasında son görülen kitap silinir, yeni kitap eklenir
+        api_library.remove_book("isbn-1")
+        api_library.add_book_manual(Book("Yeni", "Yazar", "isbn-new"))
+        
+        second = client.get("/books", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        assert [b["isbn"] for b in second["items"]] == ["isbn-2", "isbn-3"]
+        
+        third = client.get("/books", params={"limit": 2, "cursor": second["next_cursor"]}).json()
+        assert [b["isbn"] for b in third["items"]] == ["isbn-4", "isbn-new"]
+        assert third["next_cursor"] is None
+    
+    def test_cursor_survives_delete_and_readd(self, client, api_library):
+        """İmlecin kitabı silinip yeniden eklense de kalan kitaplar atlanmaz"""
+        for i in range(6):
+            api_library.add_book_manual(Book(f"Kitap {i}", "Yazar", f"i{i}"))
+
+        first = client.get("/books", params={"limit": 2}).json()
+        assert [b["isbn"] for b in first["items"]] == ["i0", "i1"]
+        api_library.remove_book("i1")
+        api_library.add_book_manual(Book("Kitap 1", "Yazar", "i1"))
+
+        second = client.get("/books", params={"limit": 2, "cursor": first["next_cursor"]}).json()
+        assert [b["isbn"] for b in second["items"]] == ["i2", "i3"]
+        assert second["next_cursor"]
+
+    def test_conditional_get_with_etag(self, client, api_library):
+        """Değişmeyen liste ve kitap için If-None-Match ile 304 döner"""
+        api_library.add_book_manual(Book("Kitap", "Yazar", "111"))
+        api_library.add_book_manual(Book("Diğer", "Yazar", "222"))
+
+        listing = client.get("/books")
+        list_etag = listing.headers["etag"]
+        book_etag = client.get("/books/111").headers["etag"]
+
+        unchanged = client.get("/books", headers={"If-None-Match": list_etag})
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert client.get("/books/111", headers={"If-None-Match": f'W/{book_etag}'}).status_code == 304
+
+        # Başka bir kitap silinince liste değişir, kitabın kendi ETag'i değişmez
+        api_library.remove_book("222")
+        changed = client.get("/books", headers={"If-None-Match": list_etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != list_etag
+        assert [b["isbn"] for b in changed.json()["items"]] == ["111"]
+        assert client.get("/books/111", headers={"If-None-Match": book_etag}).status_code == 304
+
+    def test_get_books_serialized_body_cached(self, client, api_library):
+        """Sayfa gövdesi sürüm değişene kadar yeniden üretilmez"""
+        api_library.add_book_manual(Book("Kitap", "Yazar", "111"))
+
+        with patch.object(api_library, "page", wraps=api_library.page) as page_spy:
+            first = client.get("/books", params={"limit": 10})
+            second = client.get("/books", params={"limit": 10})
+            assert first.content == second.content
+            assert page_spy.call_count == 1
+
+            api_library.add_book_manual(Book("Yeni", "Yazar", "222"))
+            third = client.get("/books", params={"limit": 10})
+            assert page_spy.call_count == 2
+
+        assert [b["isbn"] for b in third.json()["items"]] == ["111", "222"]
+        full = client.get("/books", params={"all": "true"})
+        assert full.headers["content-type"] == "application/json"
+        assert full.json() == [
+            {"title": "Kitap", "author": "Yazar", "isbn": "111"},
+            {"title": "Yeni", "author": "Yazar", "isbn": "222"},
+        ]
+
+    def test_only_affected_pages_rebuilt_after_change(self, client, api_library):
+        """Değişiklik yalnızca değişen kitabı kapsayan sayfaları ve son sayfayı geçersiz kılar"""
+        for i in range(6):
+            api_library.add_book_manual(Book(f"Kitap {i}", "Yazar", str(i)))
+        first = client.get("/books", params={"limit": 2}).json()
+        cursor = first["next_cursor"]
+        client.get("/books", params={"limit": 2, "cursor": cursor})
+
+        with patch.object(api_library, "page", wraps=api_library.page) as page_spy:
+            # Sona ekleme ilk iki sayfayı etkilemez
+            api_library.add_book_manual(Book("Yeni", "Yazar", "yeni"))
+            assert client.get("/books", params={"limit": 2}).json() == first
+            second = client.get("/books", params={"limit": 2, "cursor": cursor})
+            assert page_spy.call_count == 0
+
+            # İkinci sayfadaki kitabın silinmesi yalnızca o sayfayı yeniden kurar
+            api_library.remove_book("3")
+            client.get("/books", params={"limit": 2})
+            changed = client.get("/books", params={"limit": 2, "cursor": cursor})
+            assert page_spy.call_count == 1
+
+        assert changed.headers["etag"] != second.headers["etag"]
+        assert [b["isbn"] for b in changed.json()["items"]] == ["2", "4"]
+
+    def test_cursor_and_etag_shared_between_workers(self, client, tmp_path, monkeypatch):
+        """Aynı dosyayı paylaşan iki worker aynı ETag'i verir, imleç diğerinde de geçerlidir"""
+        import api
+        from models.library import Library
+        filename = str(tmp_path / "library.json")
+        first = Library(filename, shared=True)
+        for i in range(6):
+            first.add_book_manual(Book(f"Kitap {i}", "Yazar", str(i)))
+        first.remove_book("0")
+        first.compact()
+        # İkinci worker anlık görüntüden yükler; sıra numaraları birincidekinden farklıdır
+        second = Library(filename, shared=True)
+        assert second.cursor_seq("3") != first.cursor_seq("3")
+
+        monkeypatch.setattr(api, "library", first)
+        page = client.get("/books", params={"limit": 3})
+        assert [b["isbn"] for b in page.json()["items"]] == ["1", "2", "3"]
+
+        monkeypatch.setattr(api, "library", second)
+        other = client.get("/books", params={"limit": 3})
+        assert other.headers["etag"] == page.headers["etag"]
+        assert other.json()["items"] == page.json()["items"]
+        rest = client.get("/books", params={"limit": 3, "cursor": page.json()["next_cursor"]})
+        assert [b["isbn"] for b in rest.json()["items"]] == ["4", "5"]
+
+        # İkinci worker'ın değişikliği birincide refresh ile görülür, ETag'ler yine eşleşir
+        second.add_book_manual(Book("Yeni", "Yazar", "6"))
+        changed = client.get("/books", params={"limit": 3}, headers={"If-None-Match": page.headers["etag"]})
+        assert changed.status_code == 200
+        monkeypatch.setattr(api, "library", first)
+        assert client.get("/books", params={"limit": 3}).headers["etag"] == changed.headers["etag"]
+        first.close()
+        second.close()
+
+    def test_get_books_unknown_cursor(self, client, api_library):
+        """Çözülemeyen imleç için 410 döner"""
+        response = client.get("/books", params={"cursor": encode_cursor("yok", 0)})
+
+        assert response.status_code == 410
+
+    def test_get_books_invalid_cursor(self, client):
+        """Geçersiz imleç testi"""
+        response = client.get("/books", params={"cursor": "bozuk!"})
+        
+        assert response.status_code == 400
@@ -0,0 +1,109 @@
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch, MagicMock
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.cache import ResponseCache
+from models.library import Library
+
+
+class TestResponseCache:
+    """ResponseCache sınıfı test senaryoları"""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Geçici önbellek örneği"""
+        cache = ResponseCache(str(tmp_path / "cache.db"))
+        yield cache
+        cache.close()
+    
+    def test_hit_and_miss_counters(self, cache):
+        """İsabet ve ıskalama sayaçları testi"""
+        assert cache.get("/isbn/1.json") is None
+        cache.set("/isbn/1.json", {"title": "Bir"})
+        
+        assert cache.get("/isbn/1.json") == {"title": "Bir"}
+        assert cache.stats() == {"hits": 1, "misses": 1, "entries": 1}
+    
+    def test_ttl_expiry(self, tmp_path):
+        """Süresi dolan kayıt ıskalama sayılır ve silinir"""
+        cache = ResponseCache(str(tmp_path / "ttl.db"), ttl=10)
+        cache.set("/isbn/1.json", {"title": "Bir"})
+        
+        with patch('models.cache.time.time', return_value=time.time() + 60):
+            assert cache.get("/isbn/1.json") is None
+        assert cache.stats()["entries"] == 0
+        cache.close()
+    
+    def test_lru_eviction(self, tmp_path):
+        """Kayıt sınırı aşılınca en eski erişilen kayıt atılır"""
+        cache = ResponseCache(str(tmp_path / "lru.db"), ttl=None, max_entries=2)
+        with patch('models.cache.time.time', side_effect=[1.0, 2.0, 3.0, 4.0]):
+            cache.set("a", {"v": 1})
+            cache.set("b", {"v": 2})
+            cache.get("a")  # "a" yeniden kullanıldı, "b" en eski oldu
+            cache.set("c", {"v": 3})
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("c") == {"v": 3}
+        cache.close()
+    
+    def test_hits_do_not_write_until_batch(self, tmp_path):
+        """İsabetler diske yazmaz; erişim zamanları toplu ya da kapanışta yazılır"""
+        filename = str(tmp_path / "toplu.db")
+        cache = ResponseCache(filename, ttl=None)
+        cache.set("a", {"v": 1})
+        changes = cache._conn.total_changes
+
+        with patch('models.cache.time.time', return_value=1e10):
+            for _ in range(3):
+                assert cache.get("a") == {"v": 1}
+        assert cache._conn.total_changes == changes
+        cache.close()
+
+        reopened = ResponseCache(filename, ttl=None)
+        assert reopened._conn.execute("SELECT accessed_at FROM responses").fetchone()[0] == 1e10
+        reopened.close()
+
+    def test_persists_between_instances(self, tmp_path):
+        """Önbellek diskte kalıcıdır"""
+        filename = str(tmp_path / "kalici.db")
+        first = ResponseCache(filename)
+        first.set("/authors/OL1A.json", {"name": "Yazar"})
+        first.close()
+        
+        second = ResponseCache(filename)
+        assert second.get("/authors/OL1A.json") == {"name": "Yazar"}
+        second.close()
+    
+    def test_export_and_seed(self, cache, tmp_path):
+        """Dökümden önbellek doldurma testi"""
+        cache.set("/isbn/1.json", {"title": "Bir"})
+        cache.set("/authors/OL1A.json", {"name": "Yazar"})
+        dump = str(tmp_path / "dump.ndjson")
+        assert cache.export(dump) == 2
+        
+        fresh = ResponseCache(str(tmp_path / "fresh.db"))
+        assert fresh.seed(dump) == 2
+        assert fresh.get("/isbn/1.json") == {"title": "Bir"}
+        fresh.close()
+    
+    @patch('httpx.Client')
+    def test_library_uses_cache_offline(self, mock_client, cache, tmp_path):
+        """Önbellekteki yanıtlarla ağa çıkmadan kitap eklenir"""
+        cache.set("/isbn/978-0441172719.json", {"title": "Dune", "authors": [{"key": "/authors/OL1A"}]})
+        cache.set("/authors/OL1A.json", {"name": "Frank Herbert"})
+        library = Library(str(tmp_path / "library.json"), cache=cache)
+        
+        mock_client_instance = MagicMock()
+        mock_client.return_value = mock_client_instance
+        
+        assert library.add_book("978-0441172719") is True
+        assert library.find_book("978-0441172719").author == "Frank Herbert"
+        mock_client_instance.get.assert_not_called()
+        assert cache.stats()["hits"] == 2
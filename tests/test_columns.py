@@ -0,0 +1,99 @@
+import sys
+import os
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.columns import BookColumns
+from models.library import Library
+
+
+class TestBookColumns:
+    """BookColumns sınıfı test senaryoları"""
+    
+    def test_mapping_roundtrip(self):
+        """Sütunlara yazılan kitap aynı alanlarla geri okunur"""
+        columns = BookColumns()
+        columns["111"] = Book("Tutunamayanlar", "Oğuz Atay", "111")
+        
+        book = columns["111"]
+        assert str(book) == "Tutunamayanlar by Oğuz Atay (ISBN: 111)"
+        assert book.to_dict() == {"title": "Tutunamayanlar", "author": "Oğuz Atay", "isbn": "111"}
+        assert "111" in columns
+        assert columns.get("222") is None
+    
+    def test_order_preserved_after_delete_and_update(self):
+        """Silme ve güncelleme sonrasında ekleme sırası korunur"""
+        columns = BookColumns()
+        for i in range(4):
+            columns[str(i)] = Book(f"Kitap {i}", "Yazar", str(i))
+        del columns["1"]
+        columns["2"] = Book("Güncel", "Yazar", "2")
+        
+        assert list(columns) == ["0", "2", "3"]
+        assert [book.title for book in columns.values()] == ["Kitap 0", "Güncel", "Kitap 3"]
+        assert len(columns) == 3
+    
+    def test_authors_dictionary_encoded(self):
+        """Aynı yazar adı sütunlarda bir kez saklanır"""
+        columns = BookColumns()
+        for i in range(100):
+            columns[str(i)] = Book(f"Kitap {i}", "Sabahattin Ali", str(i))
+        
+        assert len(columns._authors) == 1
+        assert columns["42"].author == "Sabahattin Ali"
+    
+    def test_compaction(self):
+        """Silinen satırlar çoğalınca sütunlar sıkıştırılır"""
+        columns = BookColumns()
+        count = BookColumns._COMPACT_MIN_ROWS * 3
+        for i in range(count):
+            columns[str(i)] = Book("Başlık", "Yazar", str(i))
+        for i in range(0, count, 3):
+            del columns[str(i)]
+        for i in range(1, count, 3):
+            del columns[str(i)]
+        
+        assert len(columns._isbns) < count
+        assert len(columns) == count // 3
+        assert columns["5"].isbn == "5"
+        assert list(columns)[:2] == ["2", "5"]
+    
+    def test_columnar_library(self, tmp_path):
+        """Sütunlu modda Library kaydeder, yükler ve arar"""
+        filename = str(tmp_path / "library.json")
+        library = Library(filename, columnar=True)
+        library.add_book_manual(Book("Kuyucaklı Yusuf", "Sabahattin Ali", "111"))
+        library.add_book_manual(Book("İnce Memed", "Yaşar Kemal", "222"))
+        library.remove_book("111")
+        
+        reloaded = Library(filename, columnar=True)
+        assert isinstance(reloaded._index, BookColumns)
+        assert [book.isbn for book in reloaded.list_books()] == ["222"]
+        assert reloaded.find_book("222").author == "Yaşar Kemal"
+        assert [book.isbn for book in reloaded.search_books("memed")] == ["222"]
+
+    def test_columnar_paging_keeps_no_books_in_memory(self, tmp_path):
+        """Sayfa ve tam liste okumak Book nesnelerini bellekte bırakmaz"""
+        import gc
+        import tracemalloc
+
+        library = Library(str(tmp_path / "library.json"), columnar=True)
+        library.books = [Book(f"Kitap {i}", f"Yazar {i % 10}", str(i)) for i in range(20_000)]
+        library.list_books_page(100)
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        after = None
+        for _ in range(20):
+            books, after = library.list_books_page(100, after)
+        assert len(library.list_books()) == 20_000
+        del books
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+
+        assert library._view is None
+        # Tam liste saklansaydı kitap başına ~100 bayttan fazlası kalırdı
+        assert retained < 20_000 * 5
@@ -0,0 +1,104 @@
+import pytest
+import sys
+import os
+import json
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.importer import BookImporter, detect_format, is_valid_isbn, iter_records, normalize_isbn
+from models.library import Library
+
+
+class TestImporter:
+    """CSV/NDJSON toplu içe aktarma test senaryoları"""
+
+    @pytest.fixture
+    def library(self, tmp_path):
+        return Library(str(tmp_path / "library.json"), journal=True)
+
+    def test_iter_records_csv_and_ndjson(self, tmp_path):
+        """Her iki biçim de küçük harfli alan adlarıyla okunur"""
+        csv_file = tmp_path / "books.csv"
+        csv_file.write_text("ISBN,Title,Author\n9789750719387,Tutunamayanlar,Oğuz Atay\n", encoding="utf-8")
+        ndjson_file = tmp_path / "books.ndjson"
+        ndjson_file.write_text('{"isbn": "9789750719387", "Title": "Tutunamayanlar"}\n\nbozuk\n', encoding="utf-8")
+
+        assert list(iter_records(str(csv_file))) == [
+            {"isbn": "9789750719387", "title": "Tutunamayanlar", "author": "Oğuz Atay"}
+        ]
+        assert list(iter_records(str(ndjson_file))) == [
+            {"isbn": "9789750719387", "title": "Tutunamayanlar"}, {}
+        ]
+        with pytest.raises(ValueError):
+            detect_format("books.xlsx")
+
+    def test_isbn_validation(self):
+        """ISBN-10 (X dahil) ve ISBN-13 kontrol hanesiyle doğrulanır, tireler yok sayılır"""
+        assert is_valid_isbn("978-975-07-1938-7")
+        assert is_valid_isbn("0441172717")
+        assert is_valid_isbn("0-8044-2957-x")
+        assert not is_valid_isbn("9789750719388")  # kontrol hanesi yanlış
+        assert not is_valid_isbn("0441172718")
+        assert not is_valid_isbn("12345")
+        assert not is_valid_isbn("")
+        assert normalize_isbn(" 0-8044-2957-x ") == "080442957X"
+
+    def test_import_validates_dedupes_and_commits_in_chunks(self, library, tmp_path):
+        """Geçersiz ve tekrar eden kayıtlar atlanır, her parça tek seferde yazılır"""
+        isbns = ["9780000000002", "9780000000019", "9780000000026", "9780000000033", "9780000000040"]
+        library.add_book_manual(Book("Mevcut", "Yazar", isbns[0]))
+        source = tmp_path / "books.ndjson"
+        rows = [{"isbn": isbn, "title": f"Kitap {i}", "author": "Yazar"} for i, isbn in enumerate(isbns)]
+        rows += [{"isbn": "978-0-00-000001-9", "title": "Tekrar", "author": "Yazar"},
+                 {"isbn": "abc", "title": "Geçersiz", "author": "Yazar"},
+                 {"isbn": "9780000000001", "title": "Kontrol hanesi yanlış", "author": "Yazar"},
+                 {"isbn": "9780000000095", "title": "Yazarsız"}]
+        source.write_text("\n".join(json.dumps(row) for row in rows), encoding="utf-8")
+
+        with patch.object(library.storage, 'write', wraps=library.storage.write) as write:
+            stats = BookImporter(library, chunk_size=2).run(str(source))
+
+        assert stats["read"] == 9
+        assert stats["added"] == 4
+        assert stats["duplicate"] == 2
+        assert stats["invalid"] == 3
+        assert write.call_count == 2
+        assert library.find_book("9780000000040").title == "Kitap 4"
+
+    def test_import_stores_normalized_isbn(self, library, tmp_path):
+        """Tireli/küçük x'li ISBN normalize edilmiş haliyle kaydedilir ve tekilleştirilir"""
+        library.add_book_manual(Book("Mevcut", "Yazar", "9789750719387"))
+        source = tmp_path / "books.csv"
+        source.write_text(
+            "isbn,title,author\n0-8044-2957-x,Kitap,Yazar\n080442957X,Tekrar,Yazar\n"
+            "978-975-07-1938-7,Mevcut,Yazar\n", encoding="utf-8"
+        )
+
+        stats = BookImporter(library).run(str(source))
+
+        assert (stats["added"], stats["duplicate"]) == (1, 2)
+        assert library.find_book("080442957X").title == "Kitap"
+
+    def test_import_enriches_missing_fields(self, library, tmp_path):
+        """Eksik başlık/yazar Open Library'den tamamlanır; bulunamayan ve hata alınanlar ayrı sayılır"""
+        source = tmp_path / "books.csv"
+        source.write_text(
+            "isbn,title,author\n9780000000019,,Kendi Yazarım\n9780000000026,,\n9780000000033,,\n",
+            encoding="utf-8",
+        )
+        # Hata alınan ISBN (9780000000033) fetch_books sonucunda yer almaz
+        fetched = {"9780000000019": Book("Uzak Başlık", "Uzak Yazar", "9780000000019"),
+                   "9780000000026": None}
+
+        with patch.object(Library, 'fetch_books', return_value=fetched) as fetch:
+            stats = BookImporter(library, enrich=True, concurrency=4).run(str(source))
+
+        fetch.assert_called_once_with(["9780000000019", "9780000000026", "9780000000033"], concurrency=4)
+        assert stats["enriched"] == 1
+        assert stats["not_found"] == 1
+        assert stats["errors"] == 1
+        book = library.find_book("9780000000019")
+        assert (book.title, book.author) == ("Uzak Başlık", "Kendi Yazarım")
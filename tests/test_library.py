@@ -1,187 +1,618 @@
-import pytest
-import os
-import json
-import sys
-from unittest.mock import patch, MagicMock
-
-# Test için modülleri import etmek için path ayarı
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
-from models.book import Book
-from models.library import Library
-
-
-class TestLibrary:
-    """Library sınıfı test senaryoları"""
-    
-    @pytest.fixture
-    def temp_library_file(self, tmp_path):
-        """Geçici test dosyası oluşturur"""
-        return str(tmp_path / "test_library.json")
-    
-    @pytest.fixture
-    def library(self, temp_library_file):
-        """Test kütüphanesi örneği"""
-        return Library(temp_library_file)
-    
-    @pytest.fixture
-    def sample_book(self):
-        """Örnek kitap nesnesi"""
-        return Book("Test Book", "Test Author", "123456789")
-    
-    def test_library_creation(self, library):
-        """Kütüphane oluşturma testi"""
-        assert isinstance(library.books, list)
-        assert len(library.books) == 0
-    
-    def test_add_book_manual(self, library, sample_book):
-        """Manuel kitap ekleme testi"""
-        result = library.add_book_manual(sample_book)
-        
-        assert result is True
-        assert len(library.books) == 1
-        assert library.books[0] == sample_book
-    
-    def test_add_duplicate_book(self, library, sample_book):
-        """Aynı ISBN ile kitap ekleme testi"""
-        library.add_book_manual(sample_book)
-        result = library.add_book_manual(sample_book)
-        
-        assert result is False
-        assert len(library.books) == 1
-    
-    def test_find_book_existing(self, library, sample_book):
-        """Mevcut kitap arama testi"""
-        library.add_book_manual(sample_book)
-        found_book = library.find_book("123456789")
-        
-        assert found_book == sample_book
-    
-    def test_find_book_non_existing(self, library):
-        """Olmayan kitap arama testi"""
-        found_book = library.find_book("nonexistent")
-        
-        assert found_book is None
-    
-    def test_remove_book_existing(self, library, sample_book):
-        """Mevcut kitap silme testi"""
-        library.add_book_manual(sample_book)
-        result = library.remove_book("123456789")
-        
-        assert result is True
-        assert len(library.books) == 0
-    
-    def test_remove_book_non_existing(self, library):
-        """Olmayan kitap silme testi"""
-        result = library.remove_book("nonexistent")
-        
-        assert result is False
-    
-    def test_list_books_empty(self, library):
-        """Boş kütüphane listeleme testi"""
-        books = library.list_books()
-        
-        assert books == []
-    
-    def test_list_books_with_content(self, library, sample_book):
-        """Dolu kütüphane listeleme testi"""
-        library.add_book_manual(sample_book)
-        books = library.list_books()
-        
-        assert len(books) == 1
-        assert books[0] == sample_book
-    
-    def test_save_and_load_books(self, temp_library_file):
-        """Kitap kaydetme ve yükleme testi"""
-        # İlk kütüphane oluştur ve kitap ekle
-        library1 = Library(temp_library_file)
-        book = Book("Save Test", "Test Author", "987654321")
-        library1.add_book_manual(book)
-        
-        # Yeni kütüphane oluştur ve kitapları yükle
-        library2 = Library(temp_library_file)
-        
-        assert len(library2.books) == 1
-        assert library2.books[0].title == "Save Test"
-        assert library2.books[0].author == "Test Author"
-        assert library2.books[0].isbn == "987654321"
-    
-    @patch('httpx.Client')
-    def test_add_book_api_success(self, mock_client, library):
-        """API ile başarılı kitap ekleme testi"""
-        # Mock HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "title": "Test API Book",
-            "authors": [{"key": "/authors/OL1A"}]
-        }
-        
-        mock_author_response = MagicMock()
-        mock_author_response.status_code = 200
-        mock_author_response.json.return_value = {"name": "Test API Author"}
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get.side_effect = [mock_response, mock_author_response]
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-        
-        result = library.add_book("978-0441172719")
-        
-        assert result is True
-        assert len(library.books) == 1
-        assert library.books[0].title == "Test API Book"
-        assert library.books[0].author == "Test API Author"
-        assert library.books[0].isbn == "978-0441172719"
-    
-    @patch('httpx.Client')
-    def test_add_book_api_not_found(self, mock_client, library):
-        """API ile bulunamayan kitap testi"""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get.return_value = mock_response
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-        
-        result = library.add_book("invalid-isbn")
-        
-        assert result is False
-        assert len(library.books) == 0
-    
-    @patch('httpx.Client')
-    def test_add_book_api_connection_error(self, mock_client, library):
-        """API bağlantı hatası testi"""
-        from httpx import RequestError
-        
-        mock_client_instance = MagicMock()
-        mock_client_instance.get.side_effect = RequestError("Connection failed")
-        mock_client.return_value.__enter__.return_value = mock_client_instance
-        
-        result = library.add_book("978-0441172719")
-        
-        assert result is False
-        assert len(library.books) == 0
-    
-    def test_save_books_error_handling(self, library, sample_book):
-        """Kayıt hatası yönetimi testi"""
-        library.add_book_manual(sample_book)
-        
-        # Geçersiz dosya yolu ile kaydetmeye çalış
-        library.filename = "/invalid/path/library.json"
-        
-        # Hata fırlatmamalı, sadece hata mesajı yazdırmalı
-        try:
-            library.save_books()
-        except Exception:
-            pytest.fail("save_books should handle errors gracefully")
-    
-    def test_load_books_invalid_json(self, temp_library_file):
-        """Geçersiz JSON dosyası yükleme testi"""
-        # Geçersiz JSON dosyası oluştur
-        with open(temp_library_file, 'w') as f:
-            f.write("invalid json content")
-        
-        library = Library(temp_library_file)
-        
-        # Boş liste ile başlamalı
-        assert library.books == []
\ No newline at end of file
+import pytest
+import os
+import json
+import sys
+from unittest.mock import patch, MagicMock
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.search import SearchIndex
+
+
+class TestLibrary:
+    """Library sınıfı test senaryoları"""
+    
+    @pytest.fixture
+    def temp_library_file(self, tmp_path):
+        """Geçici test dosyası oluşturur"""
+        return str(tmp_path / "test_library.json")
+    
+    @pytest.fixture
+    def library(self, temp_library_file):
+        """Test kütüphanesi örneği"""
+        return Library(temp_library_file)
+    
+    @pytest.fixture
+    def sample_book(self):
+        """Örnek kitap nesnesi"""
+        return Book("Test Book", "Test Author", "123456789")
+    
+    def test_library_creation(self, library):
+        """Kütüphane oluşturma testi"""
+        assert isinstance(library.books, list)
+        assert len(library.books) == 0
+    
+    def test_add_book_manual(self, library, sample_book):
+        """Manuel kitap ekleme testi"""
+        result = library.add_book_manual(sample_book)
+        
+        assert result is True
+        assert len(library.books) == 1
+        assert library.books[0] == sample_book
+    
+    def test_add_duplicate_book(self, library, sample_book):
+        """Aynı ISBN ile kitap ekleme testi"""
+        library.add_book_manual(sample_book)
+        result = library.add_book_manual(sample_book)
+        
+        assert result is False
+        assert len(library.books) == 1
+    
+    def test_find_book_existing(self, library, sample_book):
+        """Mevcut kitap arama testi"""
+        library.add_book_manual(sample_book)
+        found_book = library.find_book("123456789")
+        
+        assert found_book == sample_book
+    
+    def test_find_book_non_existing(self, library):
+        """Olmayan kitap arama testi"""
+        found_book = library.find_book("nonexistent")
+        
+        assert found_book is None
+    
+    def test_remove_book_existing(self, library, sample_book):
+        """Mevcut kitap silme testi"""
+        library.add_book_manual(sample_book)
+        result = library.remove_book("123456789")
+        
+        assert result is True
+        assert len(library.books) == 0
+    
+    def test_remove_book_non_existing(self, library):
+        """Olmayan kitap silme testi"""
+        result = library.remove_book("nonexistent")
+        
+        assert result is False
+    
+    def test_list_books_empty(self, library):
+        """Boş kütüphane listeleme testi"""
+        books = library.list_books()
+        
+        assert books == []
+    
+    def test_list_books_with_content(self, library, sample_book):
+        """Dolu kütüphane listeleme testi"""
+        library.add_book_manual(sample_book)
+        books = library.list_books()
+        
+        assert len(books) == 1
+        assert books[0] == sample_book
+    
+    def test_save_and_load_books(self, temp_library_file):
+        """Kitap kaydetme ve yükleme testi"""
+        # İlk kütüphane oluştur ve kitap ekle
+        library1 = Library(temp_library_file)
+        book = Book("Save Test", "Test Author", "987654321")
+        library1.add_book_manual(book)
+        
+        # Yeni kütüphane oluştur ve kitapları yükle
+        library2 = Library(temp_library_file)
+        
+        assert len(library2.books) == 1
+        assert library2.books[0].title == "Save Test"
+        assert library2.books[0].author == "Test Author"
+        assert library2.books[0].isbn == "987654321"
+    
+    @patch('httpx.Client')
+    def test_add_book_api_success(self, mock_client, library):
+        """API ile başarılı kitap ekleme testi"""
+        # Mock HTTP response
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "title": "Test API Book",
+            "authors": [{"key": "/authors/OL1A"}]
+        }
+        
+        mock_author_response = MagicMock()
+        mock_author_response.status_code = 200
+        mock_author_response.json.return_value = {"name": "Test API Author"}
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.get.side_effect = [mock_response, mock_author_response]
+        mock_client.return_value = mock_client_instance
+        
+        result = library.add_book("978-0441172719")
+        
+        assert result is True
+        assert len(library.books) == 1
+        assert library.books[0].title == "Test API Book"
+        assert library.books[0].author == "Test API Author"
+        assert library.books[0].isbn == "978-0441172719"
+    
+    @patch('httpx.Client')
+    def test_add_book_api_not_found(self, mock_client, library):
+        """API ile bulunamayan kitap testi"""
+        mock_response = MagicMock()
+        mock_response.status_code = 404
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.get.return_value = mock_response
+        mock_client.return_value = mock_client_instance
+        
+        result = library.add_book("invalid-isbn")
+        
+        assert result is False
+        assert len(library.books) == 0
+    
+    @patch('httpx.Client')
+    def test_add_book_api_connection_error(self, mock_client, library):
+        """API bağlantı hatası testi"""
+        from httpx import RequestError
+        
+        mock_client_instance = MagicMock()
+        mock_client_instance.get.side_effect = RequestError("Connection failed")
+        mock_client.return_value = mock_client_instance
+        
+        result = library.add_book("978-0441172719")
+        
+        assert result is False
+        assert len(library.books) == 0
+    
+    def test_save_books_error_handling(self, library, sample_book):
+        """Kayıt hatası yönetimi testi"""
+        library.add_book_manual(sample_book)
+        
+        # Geçersiz dosya yolu ile kaydetmeye çalış
+        library.filename = "/invalid/path/library.json"
+        
+        # Hata fırlatmamalı, sadece hata mesajı yazdırmalı
+        try:
+            library.save_books()
+        except Exception:
+            pytest.fail("save_books should handle errors gracefully")
+    
+    def test_load_books_invalid_json(self, temp_library_file):
+        """Geçersiz JSON dosyası yükleme testi"""
+        # Geçersiz JSON dosyası oluştur
+        with open(temp_library_file, 'w') as f:
+            f.write("invalid json content")
+        
+        library = Library(temp_library_file)
+        
+        # Boş liste ile başlamalı
+        assert library.books == []
+    
+    def test_version_bumped_on_changes(self, library, sample_book):
+        """Ekleme ve silme sürümü artırır, okuma artırmaz"""
+        start = library.version
+        library.add_book_manual(sample_book)
+        after_add = library.version
+        library.list_books()
+        library.find_book(sample_book.isbn)
+        assert library.version == after_add > start
+
+        library.remove_book(sample_book.isbn)
+        assert library.version > after_add
+        assert library.revision == f"{library.instance_id}-{library.version}"
+
+    def test_index_keeps_insertion_order(self, library):
+        """İndeks ekleme sırasını ve silme sonrası sırayı korur"""
+        for i in range(5):
+            library.add_book_manual(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        library.remove_book("isbn-2")
+        
+        assert [b.isbn for b in library.list_books()] == ["isbn-0", "isbn-1", "isbn-3", "isbn-4"]
+        assert library.find_book("isbn-2") is None
+        assert library.find_book("isbn-4").title == "Kitap 4"
+    
+    def test_page_cut_without_building_view(self, temp_library_file):
+        """Sayfalar değişiklikten sonra da tam görünüm kurulmadan kesilir"""
+        with open(temp_library_file, 'w', encoding='utf-8') as f:
+            json.dump([{"title": f"Kitap {i}", "author": "Yazar", "isbn": str(i)} for i in range(6)], f)
+        library = Library(temp_library_file)
+        library.remove_book("2")
+        library.add_book_manual(Book("Yeni", "Yazar", "yeni"))
+        
+        books, after = library.list_books_page(3)
+        assert [b.isbn for b in books] == ["0", "1", "3"]
+        books, after = library.list_books_page(3, after)
+        assert [b.isbn for b in books] == ["4", "5", "yeni"]
+        assert after is None
+        assert library._view is None
+        assert library.page(3, after=0)[2:] == (library.revision, library.version)
+    
+    def test_load_books_builds_index(self, temp_library_file):
+        """Yüklenen kitaplar ISBN indeksi üzerinden bulunabilir"""
+        with open(temp_library_file, 'w', encoding='utf-8') as f:
+            json.dump([
+                {"title": "A", "author": "X", "isbn": "1"},
+                {"title": "B", "author": "Y", "isbn": "2"},
+            ], f)
+        
+        library = Library(temp_library_file)
+        
+        assert library.find_book("2").title == "B"
+        assert [b.isbn for b in library.books] == ["1", "2"]
+    
+    def test_journal_mode_appends_instead_of_rewriting(self, temp_library_file):
+        """Günlük modunda değişiklikler anlık görüntüyü yeniden yazmaz"""
+        library = Library(temp_library_file, journal=True)
+        library.add_book_manual(Book("Günlük", "Yazar", "111"))
+        library.add_book_manual(Book("Silinecek", "Yazar", "222"))
+        library.remove_book("222")
+        
+        assert not os.path.exists(temp_library_file)
+        with open(temp_library_file + Library.JOURNAL_SUFFIX, encoding='utf-8') as f:
+            ops = [json.loads(line)["op"] for line in f]
+        assert ops == ["add", "add", "remove"]
+        
+        # Anlık görüntü + günlük yeniden oynatılır
+        reloaded = Library(temp_library_file, journal=True)
+        assert [b.isbn for b in reloaded.books] == ["111"]
+    
+    def test_journal_compaction(self, temp_library_file):
+        """Günlük eşiği aşınca anlık görüntüye katlanır"""
+        library = Library(temp_library_file, journal=True, compact_threshold=200)
+        for i in range(5):
+            library.add_book_manual(Book(f"Kitap {i}", "Yazar", f"isbn-{i}"))
+        
+        assert os.path.exists(temp_library_file)
+        assert library.journal.size() < 200
+        
+        reloaded = Library(temp_library_file)
+        assert len(reloaded.books) == 5
+    
+    def test_journal_skips_torn_last_line(self, temp_library_file):
+        """Yarım kalmış son günlük satırı yüklemeyi bozmaz"""
+        library = Library(temp_library_file, journal=True)
+        library.add_book_manual(Book("Sağlam", "Yazar", "111"))
+        with open(temp_library_file + Library.JOURNAL_SUFFIX, 'a', encoding='utf-8') as f:
+            f.write('{"op": "add", "book": {"tit')
+        
+        reloaded = Library(temp_library_file, journal=True)
+        assert [b.isbn for b in reloaded.books] == ["111"]
+    
+    def test_remove_books_single_persistence_pass(self, temp_library_file):
+        """Toplu silme tek kayıtla yazılır ve ISBN başına rapor döndürür"""
+        library = Library(temp_library_file, journal=True)
+        library.books = [Book(f"Kitap {i}", "Yazar" if i % 2 else "Başka", str(i)) for i in range(6)]
+        library.save_books()
+        
+        with patch.object(library.storage, 'write', wraps=library.storage.write) as write:
+            report = library.remove_books(["1", "2", "1", "99"])
+        
+        assert write.call_count == 1
+        assert report == {"1": "removed", "2": "removed", "99": "not_found"}
+        assert library.remove_books(author="yazar") == {"3": "removed", "5": "removed"}
+        
+        reloaded = Library(temp_library_file, journal=True)
+        assert [book.isbn for book in reloaded.books] == ["0", "4"]
+        with pytest.raises(ValueError):
+            library.remove_books()
+    
+    def test_remove_books_compacts_large_batches(self, temp_library_file):
+        """Büyük toplu silmede günlük anlık görüntüye katlanır"""
+        library = Library(temp_library_file, journal=True)
+        library.books = [Book(f"Kitap {i}", "Yazar", str(i)) for i in range(5)]
+        library.save_books()
+        library.BULK_COMPACT_MIN = 3
+        
+        library.remove_books(["0", "1", "2"])
+        
+        assert library.journal.size() == 0
+        assert len(Library(temp_library_file, journal=True).books) == 2
+    
+    def test_remove_books_by_author_does_not_scan_catalog(self, library):
+        """Yazara göre silme tüm kataloğu normalize etmez, arama indeksinden aday alır"""
+        library.books = [Book(f"Kitap {i}", f"Yazar {i}", str(i)) for i in range(200)]
+        library.add_book_manual(Book("Aranan 1", "Ömer Seyfettin", "a1"))
+        library.add_book_manual(Book("Aranan 2", "ÖMER SEYFETTİN", "a2"))
+        library.add_book_manual(Book("Başka", "Ömer Seyfettinoğlu", "a3"))
+        library.search_books("kitap")
+        
+        with patch("models.library.SearchIndex.normalize", wraps=SearchIndex.normalize) as normalize:
+            report = library.remove_books(author="ömer seyfettin")
+        
+        assert report == {"a1": "removed", "a2": "removed"}
+        assert normalize.call_count < 20
+        assert library.find_book("a3") is not None
+    
+    def test_add_books_batch_report(self, library, sample_book):
+        """Toplu eklemede ISBN başına sonuç raporu ve tek kayıt"""
+        import asyncio
+        import httpx
+        
+        def handler(request):
+            path = request.url.path
+            if path == "/isbn/111.json":
+                return httpx.Response(200, json={"title": "Bir", "authors": [{"key": "/authors/OL1A"}]})
+            if path == "/authors/OL1A.json":
+                return httpx.Response(200, json={"name": "Yazar Bir"})
+            if path == "/isbn/500.json":
+                return httpx.Response(500)
+            return httpx.Response(404)
+        
+        library.add_book_manual(sample_book)
+        
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+                return await library.add_books_async(
+                    ["111", "404", "500", sample_book.isbn, "111"], client=client
+                )
+        
+        with patch.object(library, '_write_snapshot') as mock_save:
+            report = asyncio.run(run())
+        
+        assert report == {
+            "111": Library.STATUS_ADDED,
+            "404": Library.STATUS_NOT_FOUND,
+            "500": Library.STATUS_ERROR,
+            sample_book.isbn: Library.STATUS_DUPLICATE,
+        }
+        assert library.find_book("111").author == "Yazar Bir"
+        mock_save.assert_called_once()
+    
+    def test_shared_client_reused_across_adds(self, temp_library_file):
+        """Dışarıdan verilen istemci tüm eklemelerde yeniden kullanılır"""
+        import httpx
+        
+        requests_seen = []
+        
+        def handler(request):
+            requests_seen.append(request.url.path)
+            if request.url.path.startswith("/isbn/"):
+                return httpx.Response(200, json={"title": "Kitap"})
+            return httpx.Response(404)
+        
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        library = Library(temp_library_file, client=client)
+        
+        assert library.add_book("111") is True
+        assert library.add_book("222") is True
+        assert requests_seen == ["/isbn/111.json", "/isbn/222.json"]
+        assert library._get_client() is client
+        
+        # Dışarıdan verilen istemciyi kapatmak çağıranın sorumluluğundadır
+        library.close()
+        assert not client.is_closed
+        client.close()
+    
+    def test_base_url_configurable(self, temp_library_file, monkeypatch):
+        """Open Library adresi parametre veya ortam değişkeniyle değiştirilebilir"""
+        import httpx
+
+        hosts_seen = []
+
+        def handler(request):
+            hosts_seen.append(f"{request.url.host}:{request.url.port}")
+            return httpx.Response(200, json={"title": "Kitap"})
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        library = Library(temp_library_file, client=client, base_url="http://127.0.0.1:8100/")
+        assert library.add_book("111") is True
+
+        monkeypatch.setenv(Library.BASE_URL_ENV, "http://localhost:9000")
+        assert Library(temp_library_file).base_url == "http://localhost:9000"
+        monkeypatch.delenv(Library.BASE_URL_ENV)
+        assert Library(temp_library_file).base_url == Library.OPEN_LIBRARY_URL
+
+        assert hosts_seen == ["127.0.0.1:8100"]
+        client.close()
+
+    def test_close_owned_client(self, library):
+        """Kütüphanenin oluşturduğu istemci close ile kapanır"""
+        client = library._get_client()
+        library.close()
+        
+        assert client.is_closed
+        assert library.client is None
+    
+    def test_add_and_remove_book_async(self, temp_library_file):
+        """Asenkron ekleme/silme paylaşılan AsyncClient ile çalışır ve kaydeder"""
+        import asyncio
+        import httpx
+        
+        def handler(request):
+            if request.url.path == "/isbn/111.json":
+                return httpx.Response(200, json={"title": "Asenkron", "authors": [{"key": "/authors/OL1A"}]})
+            if request.url.path == "/authors/OL1A.json":
+                return httpx.Response(200, json={"name": "Yazar"})
+            return httpx.Response(404)
+        
+        async def run(library):
+            added = await library.add_book_async("111")
+            duplicate = await library.add_book_async("111")
+            missing = await library.add_book_async("404")
+            return added, duplicate, missing
+        
+        async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        library = Library(temp_library_file, async_client=async_client)
+        
+        assert asyncio.run(run(library)) == (True, False, False)
+        library.close()
+        assert Library(temp_library_file).find_book("111").author == "Yazar"
+        
+        assert asyncio.run(library.remove_book_async("111")) is True
+        library.close()
+        assert Library(temp_library_file).books == []
+        asyncio.run(async_client.aclose())
+    
+    def test_async_persist_builds_snapshot_off_loop(self, temp_library_file):
+        """Asenkron kayıtta anlık görüntünün kitap listesi döngü iş parçacığında alınmaz"""
+        import asyncio
+        import threading
+        library = Library(temp_library_file)
+        library.books = [Book(f"Kitap {i}", "Yazar", str(i)) for i in range(5)]
+        library.save_books()
+        threads = []
+        view = library.view
+        
+        def spy():
+            threads.append(threading.current_thread())
+            return view()
+        
+        with patch.object(library, "view", spy):
+            assert asyncio.run(library.remove_book_async("0")) is True
+        
+        assert threads and threading.main_thread() not in threads
+        assert [b.isbn for b in Library(temp_library_file).books] == ["1", "2", "3", "4"]
+    
+    def test_author_lookups_deduplicated_and_memoized(self, temp_library_file):
+        """Yazarlar tekilleştirilir, paralel çekilir ve oturum boyunca hatırlanır"""
+        import asyncio
+        import httpx
+        
+        author_requests = []
+        editions = {
+            "/isbn/111.json": {"title": "Antoloji", "authors": [
+                {"key": "/authors/OL1A"}, {"key": "/authors/OL2A"}, {"key": "/authors/OL1A"}
+            ]},
+            "/isbn/222.json": {"title": "Roman", "authors": [{"key": "/authors/OL1A"}]},
+        }
+        names = {"/authors/OL1A.json": "Birinci", "/authors/OL2A.json": "İkinci"}
+        
+        def handler(request):
+            path = request.url.path
+            if path in editions:
+                return httpx.Response(200, json=editions[path])
+            author_requests.append(path)
+            return httpx.Response(200, json={"name": names[path]})
+        
+        # Senkron yol: iki farklı yazar iş parçacıklarıyla çekilir
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        library = Library(temp_library_file, client=client)
+        assert library.add_book("111") is True
+        assert library.find_book("111").author == "Birinci, İkinci"
+        assert sorted(author_requests) == ["/authors/OL1A.json", "/authors/OL2A.json"]
+        
+        # Asenkron yol: bilinen yazar yeniden çekilmez
+        async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        library.async_client = async_client
+        assert asyncio.run(library.add_book_async("222")) is True
+        assert library.find_book("222").author == "Birinci"
+        assert len(author_requests) == 2
+        
+        library.close()
+        client.close()
+        asyncio.run(async_client.aclose())
+    
+    def test_concurrent_adds_share_one_fetch(self, temp_library_file):
+        """Aynı ISBN için eşzamanlı eklemeler ve ortak yazarlar tek istekle çözülür"""
+        import asyncio
+        import httpx
+        
+        requests = []
+        editions = {
+            "/isbn/111.json": {"title": "Antoloji", "authors": [{"key": "/authors/OL1A"}]},
+            "/isbn/222.json": {"title": "Roman", "authors": [{"key": "/authors/OL1A"}]},
+        }
+        
+        async def handler(request):
+            requests.append(request.url.path)
+            await asyncio.sleep(0.05)
+            if request.url.path in editions:
+                return httpx.Response(200, json=editions[request.url.path])
+            return httpx.Response(200, json={"name": "Birinci"})
+        
+        library = Library(temp_library_file, journal=True)
+        
+        async def run():
+            library.async_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            results = await asyncio.gather(
+                library.add_book_async("111"), library.add_book_async("111"), library.add_book_async("222")
+            )
+            await library.async_client.aclose()
+            return results
+        
+        assert asyncio.run(run()) == [True, True, True]
+        assert sorted(requests) == ["/authors/OL1A.json", "/isbn/111.json", "/isbn/222.json"]
+        assert [book.isbn for book in Library(temp_library_file, journal=True).books] == ["111", "222"]
+        assert len(library._flights) == 0
+    
+    def test_streaming_load_large_file(self, temp_library_file):
+        """Parça parça okunan büyük dosya eksiksiz ve sırayla yüklenir"""
+        records = [{"title": f"Kitap {i}", "author": "Yazar", "isbn": str(i)} for i in range(2000)]
+        with open(temp_library_file, 'w', encoding='utf-8') as f:
+            json.dump(records, f, indent=2)
+        
+        library = Library(temp_library_file)
+        
+        assert library.count_books() == 2000
+        assert [b.isbn for b in library.books[:3]] == ["0", "1", "2"]
+        assert library.find_book("1999").title == "Kitap 1999"
+    
+    def test_background_load_serves_lookups(self, temp_library_file):
+        """Arka planda yüklemede yüklenen ISBN'ler yükleme bitmeden bulunur"""
+        import threading
+        from models.storage import JsonStorage
+        
+        with open(temp_library_file, 'w', encoding='utf-8') as f:
+            json.dump([{"title": f"Kitap {i}", "author": "Yazar", "isbn": str(i)} for i in range(3)], f)
+        
+        release = threading.Event()
+        first_loaded = threading.Event()
+        original_iter_load = JsonStorage.iter_load
+        
+        def slow_iter_load(storage):
+            for i, book in enumerate(original_iter_load(storage)):
+                yield book
+                if i == 0:
+                    first_loaded.set()
+                    release.wait(5)
+        
+        with patch.object(JsonStorage, 'iter_load', slow_iter_load):
+            library = Library(temp_library_file, background_load=True)
+            assert first_loaded.wait(5)
+            
+            assert library.loading is True
+            assert library.find_book("0", wait=False).title == "Kitap 0"
+            assert library.find_book("2", wait=False) is None
+            
+            release.set()
+            assert library.find_book("2").title == "Kitap 2"
+            assert library.loading is False
+            assert len(library.list_books()) == 3
+    
+    def test_concurrent_writers_and_readers(self, temp_library_file):
+        """Eşzamanlı ekleme ve okumalar tutarlı görünümler görür"""
+        import threading
+        
+        library = Library(temp_library_file, journal=True)
+        errors = []
+        done = threading.Event()
+        
+        def writer(offset):
+            for i in range(50):
+                library.add_book_manual(Book(f"Kitap {offset + i}", "Yazar", str(offset + i)))
+        
+        def reader():
+            try:
+                while not done.is_set():
+                    view = library.view()
+                    assert len(view.books) == len(view.seqs)
+                    assert view.seqs == sorted(view.seqs)
+                    library.list_books_page(10, view=view)
+                    library.search_books("kitap")
+            except Exception as e:
+                errors.append(e)
+        
+        readers = [threading.Thread(target=reader) for _ in range(2)]
+        writers = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+        # Aynı ISBN'i iki iş parçacığı birden ekleyemez
+        duplicates = [threading.Thread(target=writer, args=(0,)) for _ in range(2)]
+        for thread in readers + writers + duplicates:
+            thread.start()
+        for thread in writers + duplicates:
+            thread.join()
+        done.set()
+        for thread in readers:
+            thread.join()
+        
+        assert errors == []
+        assert library.count_books() == 200
+        assert len(Library(temp_library_file, journal=True).list_books()) == 200
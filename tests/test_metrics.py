@@ -0,0 +1,93 @@
+import pytest
+import sys
+import os
+import httpx
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.metrics import (
+    MetricsRegistry, SAVE_BYTES, SAVE_DURATION, UPSTREAM_ERRORS, UPSTREAM_LATENCY,
+)
+
+
+class TestMetricsRegistry:
+    """Prometheus metin biçimi test senaryoları"""
+
+    def test_counter_and_gauge_render(self):
+        """Sayaç ve göstergeler etiketleriyle yazılır"""
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "İstekler", ("route",))
+        size = registry.gauge("size", "Boyut")
+        requests.inc(route="/books")
+        requests.inc(2, route='/a"b')
+        size.set(42)
+
+        text = registry.render()
+        assert "# TYPE requests_total counter" in text
+        assert 'requests_total{route="/books"} 1' in text
+        assert 'requests_total{route="/a\\"b"} 2' in text
+        assert "size 42" in text
+
+    def test_histogram_buckets_cumulative(self):
+        """Histogram kovaları kümülatif, _sum ve _count ile yazılır"""
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Süre", buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 5):
+            latency.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_sum 5.55" in text
+        assert "latency_seconds_count 3" in text
+
+    def test_label_validation_and_reregistration(self):
+        """Eksik etiket ve farklı türle yeniden kayıt reddedilir"""
+        registry = MetricsRegistry()
+        counter = registry.counter("events_total", "Olaylar", ("kind",))
+        with pytest.raises(ValueError):
+            counter.inc()
+        assert registry.counter("events_total", "Olaylar", ("kind",)) is counter
+        with pytest.raises(ValueError):
+            registry.gauge("events_total", "Olaylar")
+
+
+class TestLibraryMetrics:
+    """Library'nin Open Library ve kayıt metrikleri"""
+
+    def test_upstream_latency_and_errors_by_kind(self, tmp_path):
+        """Baskı ve yazar istekleri ayrı ayrı ölçülür, 5xx hata sayılır"""
+        def handler(request):
+            if request.url.path.startswith("/isbn/"):
+                return httpx.Response(200, json={"title": "Kitap", "authors": [{"key": "/authors/OL1A"}]})
+            return httpx.Response(503)
+
+        editions = UPSTREAM_LATENCY.count(kind="edition")
+        authors = UPSTREAM_LATENCY.count(kind="author")
+        errors = UPSTREAM_ERRORS.value(kind="author", reason=503)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        library = Library(str(tmp_path / "library.json"), client=client)
+        assert library.add_book("111") is True
+
+        assert UPSTREAM_LATENCY.count(kind="edition") == editions + 1
+        assert UPSTREAM_LATENCY.count(kind="author") == authors + 1
+        assert UPSTREAM_ERRORS.value(kind="author", reason=503) == errors + 1
+        client.close()
+
+    def test_save_duration_and_bytes(self, tmp_path):
+        """save_books süresi ve yazılan bayt sayısı kaydedilir"""
+        filename = str(tmp_path / "library.json")
+        library = Library(filename)
+        library.books = [Book("Tutunamayanlar", "Oğuz Atay", "111")]
+        saves = SAVE_DURATION.count()
+        written = SAVE_BYTES.value()
+
+        library.save_books()
+
+        assert SAVE_DURATION.count() == saves + 1
+        assert SAVE_BYTES.value() == written + os.path.getsize(filename)
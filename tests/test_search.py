@@ -0,0 +1,106 @@
+import pytest
+import sys
+import os
+import threading
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.search import SearchIndex
+
+
+class TestSearchIndex:
+    """SearchIndex sınıfı test senaryoları"""
+    
+    @pytest.fixture
+    def index(self):
+        """Örnek kitaplarla kurulmuş indeks"""
+        index = SearchIndex()
+        index.build([
+            Book("İstanbul Hatırası", "Ahmet Ümit", "1"),
+            Book("Kürk Mantolu Madonna", "Sabahattin Ali", "2"),
+            Book("Içimizdeki Şeytan", "Sabahattin Ali", "3"),
+            Book("The Iliad", "Homer", "4"),
+        ])
+        return index
+    
+    def test_turkish_case_folding(self):
+        """Türkçe büyük/küçük harf ve aksan dönüşümü testi"""
+        assert SearchIndex.normalize("İSTANBUL") == "istanbul"
+        assert SearchIndex.normalize("Istanbul") == "istanbul"
+        assert SearchIndex.normalize("Şeytan Ümit") == "seytan umit"
+    
+    def test_search_by_title_and_author(self, index):
+        """Başlık ve yazar kelimeleriyle arama testi"""
+        assert index.search("istanbul") == {"1"}
+        assert index.search("sabahattin") == {"2", "3"}
+        assert index.search("ILIAD") == {"4"}
+    
+    def test_prefix_and_multi_term(self, index):
+        """Önek eşleşmesi ve çok kelimeli sorgu testi"""
+        assert index.search("sab") == {"2", "3"}
+        assert index.search("sab kürk") == {"2"}
+        assert index.search("umi") == {"1"}
+        assert index.search("sab homer") == set()
+    
+    def test_add_and_remove(self, index):
+        """Ekleme ve silme sonrası indeks güncel kalır"""
+        book = Book("Saatleri Ayarlama Enstitüsü", "Ahmet Hamdi Tanpınar", "5")
+        index.add(book)
+        assert index.search("ahmet") == {"1", "5"}
+        
+        index.remove(book)
+        assert index.search("ahmet") == {"1"}
+        assert index.search("tanpinar") == set()
+    
+    def test_ranked_returns_first_titles_only(self, index):
+        """Sonuçlar başlığa göre sıralanır ve limit kadar seçilir"""
+        assert index.ranked("sabahattin", 10) == ["3", "2"]
+        assert index.ranked("sabahattin", 1) == ["3"]
+        assert index.ranked("yok", 5) == []
+    
+    def test_library_builds_search_index_on_first_search(self, tmp_path):
+        """Yükleme arama indeksini kurmaz, ilk arama kurar"""
+        filename = str(tmp_path / "library.json")
+        seed = Library(filename)
+        seed.books = [Book(f"Kitap {i}", "Yazar", str(i)) for i in range(5)]
+        seed.save_books()
+        
+        library = Library(filename)
+        assert library._search_ready is False
+        assert [b.isbn for b in library.search_books("kitap", limit=2)] == ["0", "1"]
+        assert library._search_ready is True
+    
+    def test_library_search_books(self, tmp_path):
+        """Library.search_books ekleme/silme ile güncellenir"""
+        library = Library(str(tmp_path / "library.json"))
+        library.add_book_manual(Book("Kuyucaklı Yusuf", "Sabahattin Ali", "111"))
+        library.add_book_manual(Book("İnce Memed", "Yaşar Kemal", "222"))
+        
+        assert [b.isbn for b in library.search_books("ince")] == ["222"]
+        assert [b.isbn for b in library.search_books("sabahattin")] == ["111"]
+        
+        library.remove_book("111")
+        assert library.search_books("sabahattin") == []
+    
+    def test_library_search_ranks_outside_write_lock(self, tmp_path):
+        """Birleşim ve sıralama sırasında yazma kilidi tutulmaz"""
+        library = Library(str(tmp_path / "library.json"))
+        library.books = [Book(f"Kitap {i}", "Yazar", str(i)) for i in range(5)]
+        rank = SearchIndex.rank
+        lock_free = []
+        
+        def spy(index, isbns, limit):
+            # Başka bir iş parçacığı kilidi hemen alabilmeli (RLock sahibi biz değiliz)
+            thread = threading.Thread(target=lambda: lock_free.append(
+                library._write_lock.acquire(timeout=1) and library._write_lock.release() is None))
+            thread.start()
+            thread.join()
+            return rank(index, isbns, limit)
+        
+        with patch.object(SearchIndex, "rank", spy):
+            assert [b.isbn for b in library.search_books("kitap", limit=2)] == ["0", "1"]
+        assert lock_free == [True]
@@ -0,0 +1,61 @@
+import sys
+import os
+import asyncio
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Eşzamanlı çağrıları birleştiren kayıt test senaryoları"""
+
+    def test_concurrent_calls_share_one_run(self):
+        """Süren iş varken gelen çağrılar onun sonucunu paylaşır"""
+        flights = SingleFlight()
+        calls = []
+
+        async def work(value):
+            calls.append(value)
+            await asyncio.sleep(0.01)
+            return value
+
+        async def run():
+            first = await asyncio.gather(
+                flights.do("a", lambda: work(1)), flights.do("a", lambda: work(2)), flights.do("b", lambda: work(3))
+            )
+            # İş bitince anahtar düşer; sonraki çağrı yeniden çalıştırır
+            second = await flights.do("a", lambda: work(4))
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == [(1, False), (1, True), (3, False)]
+        assert second == (4, False)
+        assert calls == [1, 3, 4]
+        assert len(flights) == 0
+
+    def test_errors_and_cancellation(self):
+        """Hata tüm bekleyenlere iletilir; bir bekleyenin iptali işi durdurmaz"""
+        flights = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("bozuk yanıt")
+
+        async def slow():
+            await asyncio.sleep(0.02)
+            return "tamam"
+
+        async def run():
+            results = await asyncio.gather(flights.do("x", fail), flights.do("x", fail), return_exceptions=True)
+            assert all(isinstance(result, ValueError) for result in results)
+
+            leader = asyncio.ensure_future(flights.do("y", slow))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.do("y", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower
+
+        assert asyncio.run(run()) == ("tamam", True)
@@ -0,0 +1,180 @@
+import pytest
+import sys
+import os
+import time
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.snapshot import BookSnapshot, SnapshotIndex, snapshot_is_fresh, write_snapshot
+from models.storage import JsonStorage
+
+
+class TestBookSnapshot:
+    """İkili anlık görüntü biçimi test senaryoları"""
+
+    @pytest.fixture
+    def books(self):
+        return [
+            Book("Tutunamayanlar", "Oğuz Atay", "978-3"),
+            Book("Kürk Mantolu Madonna", "Sabahattin Ali", "978-1"),
+            Book("İnce Memed", "Yaşar Kemal", "978-2"),
+        ]
+
+    def test_roundtrip_and_binary_search(self, tmp_path, books):
+        """Kayıtlar sırasıyla okunur, ISBN ikili aramayla bulunur"""
+        filename = str(tmp_path / "library.json.snap")
+        assert write_snapshot(filename, books) == 3
+
+        snapshot = BookSnapshot(filename)
+        assert len(snapshot) == 3
+        assert [snapshot.book(row).to_dict() for row in range(3)] == [book.to_dict() for book in books]
+        assert snapshot.find("978-2") == 2
+        assert snapshot.find("978-3") == 0
+        assert snapshot.find("999") is None
+        snapshot.close()
+
+    def test_invalid_file_rejected(self, tmp_path):
+        """Sihirli değeri tutmayan dosya açılmaz"""
+        filename = tmp_path / "bad.snap"
+        filename.write_bytes(b"not a snapshot file")
+        with pytest.raises(ValueError):
+            BookSnapshot(str(filename))
+
+    def test_index_overlay(self, tmp_path, books):
+        """Değişiklikler anlık görüntünün üzerine katman olarak uygulanır"""
+        filename = str(tmp_path / "library.json.snap")
+        write_snapshot(filename, books)
+        index = SnapshotIndex(BookSnapshot(filename))
+
+        del index["978-1"]
+        index["978-2"] = Book("İnce Memed 2", "Yaşar Kemal", "978-2")
+        index["978-4"] = Book("Saatleri Ayarlama Enstitüsü", "Ahmet Hamdi Tanpınar", "978-4")
+        index.seqs["978-4"] = 3
+
+        assert "978-1" not in index
+        assert list(index) == ["978-3", "978-2", "978-4"]
+        assert index["978-2"].title == "İnce Memed 2"
+        books_in_order, seqs = index.ordered()
+        assert [book.isbn for book in books_in_order] == ["978-3", "978-2", "978-4"]
+        assert seqs == [0, 2, 3]
+        assert len(index) == 3
+
+    def test_frozen_view_pages_without_decoding_all(self, tmp_path, books):
+        """Görünüm sonraki değişikliklerden etkilenmez, sayfa yalnızca gereken kayıtları çözer"""
+        filename = str(tmp_path / "library.json.snap")
+        write_snapshot(filename, books)
+        index = SnapshotIndex(BookSnapshot(filename))
+        del index["978-1"]
+        index["978-4"] = Book("Saatleri Ayarlama Enstitüsü", "Ahmet Hamdi Tanpınar", "978-4")
+        index.seqs["978-4"] = 3
+        view = index.freeze()
+        index["978-5"] = Book("Yeni", "Yazar", "978-5")
+
+        with patch.object(BookSnapshot, "book", wraps=index.snapshot.book) as decode:
+            page, next_after = view.page(1)
+            assert [book.isbn for book in page] == ["978-3"]
+            assert decode.call_count == 2
+        assert next_after == 0
+        page, next_after = view.page(5, after=next_after)
+        assert [book.isbn for book in page] == ["978-2", "978-4"]
+        assert next_after is None
+        assert len(view) == 3
+
+
+class TestLibrarySnapshot:
+    """Library'nin anlık görüntü modu test senaryoları"""
+
+    @pytest.fixture
+    def temp_library_file(self, tmp_path):
+        return str(tmp_path / "test_library.json")
+
+    def _seed(self, filename, count=5):
+        library = Library(filename)
+        library.books = [Book(f"Kitap {i}", f"Yazar {i % 2}", f"isbn-{i}") for i in range(count)]
+        library.save_books()
+
+    def test_snapshot_generated_then_used(self, temp_library_file):
+        """İlk açılışta .snap üretilir, sonraki açılış JSON'u okumaz"""
+        self._seed(temp_library_file)
+        first = Library(temp_library_file, snapshot=True)
+        assert os.path.exists(first.snapshot_filename)
+        assert not isinstance(first._index, SnapshotIndex)
+
+        with patch.object(JsonStorage, 'iter_load', side_effect=AssertionError("JSON okundu")):
+            second = Library(temp_library_file, snapshot=True)
+        assert isinstance(second._index, SnapshotIndex)
+        assert second.count_books() == 5
+        assert second.find_book("isbn-3").title == "Kitap 3"
+        assert [book.isbn for book in second.list_books()] == [f"isbn-{i}" for i in range(5)]
+
+    def test_snapshot_regenerated_when_json_newer(self, temp_library_file):
+        """JSON anlık görüntüden yeniyse yeniden okunur ve .snap güncellenir"""
+        self._seed(temp_library_file)
+        Library(temp_library_file, snapshot=True)
+
+        self._seed(temp_library_file, count=2)
+        future = time.time() + 60
+        os.utime(temp_library_file, (future, future))
+
+        library = Library(temp_library_file, snapshot=True)
+        assert library.count_books() == 2
+        assert len(BookSnapshot(library.snapshot_filename)) == 2
+
+    def test_snapshot_stale_after_same_mtime_edit(self, temp_library_file):
+        """Değişiklik zamanı korunarak düzenlenen JSON da bayat sayılır"""
+        self._seed(temp_library_file)
+        library = Library(temp_library_file, snapshot=True)
+        assert snapshot_is_fresh(library.snapshot_filename, temp_library_file)
+
+        stat = os.stat(temp_library_file)
+        self._seed(temp_library_file, count=2)
+        os.utime(temp_library_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert not snapshot_is_fresh(library.snapshot_filename, temp_library_file)
+        assert Library(temp_library_file, snapshot=True).count_books() == 2
+
+    def test_replaced_snapshots_closed(self, temp_library_file):
+        """Yeniden yüklemede eski anlık görüntü bir yayım sonra, kalanlar close() ile kapanır"""
+        self._seed(temp_library_file)
+        Library(temp_library_file, snapshot=True)
+        library = Library(temp_library_file, snapshot=True)
+        first = library._index.snapshot
+
+        library.load_books()
+        second = library._index.snapshot
+        assert second is not first
+        assert not first._mm.closed  # eski görünümler hâlâ okuyabilir
+        assert library.count_books() == 5
+
+        library.load_books()
+        assert first._mm.closed
+        assert not second._mm.closed
+
+        current = library._index.snapshot
+        library.close()
+        assert second._mm.closed and current._mm.closed
+
+    def test_mutations_on_snapshot(self, temp_library_file):
+        """Anlık görüntüden açılan kütüphanede ekleme, silme, arama ve sayfalama"""
+        self._seed(temp_library_file)
+        Library(temp_library_file, snapshot=True, journal=True)
+        library = Library(temp_library_file, snapshot=True, journal=True)
+        assert isinstance(library._index, SnapshotIndex)
+
+        assert library.remove_book("isbn-1")
+        assert library.add_book_manual(Book("Yeni Kitap", "Yazar 9", "isbn-9"))
+        assert not library.add_book_manual(Book("Kopya", "Yazar", "isbn-2"))
+
+        page, next_after = library.list_books_page(2, after=0)
+        assert [book.isbn for book in page] == ["isbn-2", "isbn-3"]
+        assert [book.isbn for book in library.list_books_page(10, after=next_after)[0]] == ["isbn-4", "isbn-9"]
+        assert [book.isbn for book in library.search_books("yeni")] == ["isbn-9"]
+        assert [book.isbn for book in library.search_books("yazar 1")] == ["isbn-3"]
+
+        # Günlük kayıtları anlık görüntünün üzerine yeniden uygulanır
+        reopened = Library(temp_library_file, snapshot=True, journal=True)
+        assert isinstance(reopened._index, SnapshotIndex)
+        assert [book.isbn for book in reopened.list_books()] == ["isbn-0", "isbn-2", "isbn-3", "isbn-4", "isbn-9"]
@@ -0,0 +1,284 @@
+import pytest
+import sys
+import os
+import json
+import sqlite3
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.snapshot import SnapshotIndex
+from models.storage import JsonStorage, SqliteStorage, iter_json_array, migrate, open_storage
+
+
+class TestStorage:
+    """Depolama arka uçları test senaryoları"""
+    
+    @pytest.fixture
+    def db_file(self, tmp_path):
+        """Geçici SQLite dosyası"""
+        return str(tmp_path / "library.db")
+    
+    def test_open_storage_by_extension(self, tmp_path):
+        """Uzantıya göre arka uç seçimi testi"""
+        json_storage = open_storage(str(tmp_path / "library.json"))
+        sqlite_storage = open_storage(str(tmp_path / "library.sqlite"))
+        
+        assert isinstance(json_storage, JsonStorage)
+        assert isinstance(sqlite_storage, SqliteStorage)
+        sqlite_storage.close()
+    
+    def test_sqlite_schema(self, db_file):
+        """WAL modu ve ISBN/yazar indeksleri testi"""
+        SqliteStorage(db_file).close()
+        
+        conn = sqlite3.connect(db_file)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(books)")}
+        assert "books_author" in indexes
+        assert any(row[2] for row in conn.execute("PRAGMA index_list(books)"))  # ISBN UNIQUE
+        conn.close()
+    
+    def test_sqlite_fsync_uses_full_synchronous(self, db_file):
+        """fsync istenince (grup yazımı) SQLite her commit'i diske indirir"""
+        normal = open_storage(db_file)
+        assert normal._conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        normal.close()
+
+        durable = open_storage(db_file, fsync=True)
+        assert durable._conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+        durable.close()
+    
+    def test_library_with_sqlite_backend(self, db_file):
+        """SQLite arka ucu ile satır bazında ekleme/silme ve yeniden yükleme"""
+        library = Library(db_file)
+        library.add_book_manual(Book("Kitap 1", "Yazar", "111"))
+        library.add_book_manual(Book("Kitap 2", "Yazar", "222"))
+        library.add_book_manual(Book("Kitap 3", "Yazar", "333"))
+        library.remove_book("222")
+        library.close()
+        
+        reloaded = Library(db_file)
+        assert [book.isbn for book in reloaded.books] == ["111", "333"]
+        assert reloaded.journal is None
+        reloaded.close()
+    
+    def test_sqlite_write_does_not_rewrite_catalog(self, db_file):
+        """Satır bazında yazımda tam anlık görüntü istenmez"""
+        storage = SqliteStorage(db_file)
+        needs_snapshot = storage.write([
+            {"op": "add", "book": {"title": "A", "author": "X", "isbn": "1"}},
+            {"op": "add", "book": {"title": "A2", "author": "X", "isbn": "1"}},
+            {"op": "remove", "isbn": "nonexistent"},
+        ])
+        
+        assert needs_snapshot is False
+        assert [book.title for book in storage.load()] == ["A2"]
+        storage.close()
+    
+    def test_sqlite_snapshot_is_isolated_from_later_writes(self, db_file):
+        """Görünüm açıldığı andaki satırları görür; sonraki yazmalar etkilemez"""
+        storage = SqliteStorage(db_file)
+        storage.write([{"op": "add", "book": {"title": f"K{i}", "author": "Y", "isbn": str(i)}} for i in range(3)])
+        snapshot = storage.open_snapshot()
+        storage.write([{"op": "remove", "isbn": "1"},
+                       {"op": "add", "book": {"title": "Yeni", "author": "Y", "isbn": "9"}}])
+        
+        assert len(snapshot) == 3
+        assert snapshot.book(1).isbn == "1"
+        assert snapshot.find("2") == 2
+        assert snapshot.find("9") is None
+        assert [book.title for book in snapshot.iter_books()] == ["K0", "K1", "K2"]
+        snapshot.close()
+        storage.close()
+    
+    def test_library_sqlite_snapshot_loads_lazily(self, db_file):
+        """Anlık görüntü modunda SQLite satırları açılışta yüklenmez"""
+        seed = Library(db_file)
+        seed.books = [Book(f"Kitap {i}", f"Yazar {i % 2}", str(i)) for i in range(5)]
+        seed.save_books()
+        seed.close()
+        
+        with patch.object(SqliteStorage, 'iter_load', side_effect=AssertionError("satırlar yüklendi")):
+            library = Library(db_file, snapshot=True)
+        assert isinstance(library._index, SnapshotIndex)
+        assert library.count_books() == 5
+        assert library.find_book("3").title == "Kitap 3"
+        
+        assert library.remove_book("1")
+        assert library.add_book_manual(Book("Yeni", "Yazar 9", "9"))
+        assert [book.isbn for book in library.list_books_page(2, after=0)[0]] == ["2", "3"]
+        assert [book.isbn for book in library.search_books("yazar 1")] == ["3"]
+        assert [book.isbn for book in library.books] == ["0", "2", "3", "4", "9"]
+        library.close()
+        
+        reopened = Library(db_file, snapshot=True)
+        assert [book.isbn for book in reopened.books] == ["0", "2", "3", "4", "9"]
+        reopened.close()
+    
+    def test_library_sqlite_snapshot_rebased(self, db_file):
+        """Değişiklik katmanı büyüyünce görünüm güncel veritabanıyla yenilenir"""
+        Library(db_file).close()
+        library = Library(db_file, snapshot=True)
+        library.SNAPSHOT_REBASE_MIN = 3
+        first = library._index.snapshot
+        library.search_books("kitap")
+        
+        for i in range(3):
+            library.add_book_manual(Book(f"Kitap {i}", "Yazar", str(i)))
+        
+        assert library._index.snapshot is not first
+        assert library._index.changes == 0
+        assert library._search_ready
+        assert [book.isbn for book in library.search_books("kitap")] == ["0", "1", "2"]
+        assert [book.isbn for book in library.books] == ["0", "1", "2"]
+        library.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            first.find("0")
+    
+    def test_migrate_json_to_sqlite(self, tmp_path, db_file):
+        """library.json dosyasının SQLite'a taşınması testi"""
+        source = str(tmp_path / "library.json")
+        with open(source, 'w', encoding='utf-8') as f:
+            json.dump([
+                {"title": "Kürk Mantolu Madonna", "author": "Sabahattin Ali", "isbn": "1"},
+                {"title": "Tutunamayanlar", "author": "Oğuz Atay", "isbn": "2"},
+            ], f, ensure_ascii=False)
+        
+        assert migrate(source, db_file) == 2
+        
+        library = Library(db_file)
+        assert library.find_book("1").title == "Kürk Mantolu Madonna"
+        assert [book.isbn for book in library.books] == ["1", "2"]
+        library.close()
+    
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+    def test_iter_json_array_chunk_boundaries(self, tmp_path, chunk_size):
+        """Kayıtlar ve sayılar parça sınırında bölünse de doğru okunur"""
+        path = str(tmp_path / "stream.json")
+        records = [{"title": f"Başlık {i}", "author": "Yazar", "isbn": str(i), "n": i * 10} for i in range(50)]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(records + [12345], f, indent=2, ensure_ascii=False)
+        
+        assert list(iter_json_array(path, chunk_size)) == records + [12345]
+    
+    @pytest.mark.parametrize("content", ["invalid json", '[{"a": 1} {"b": 2}]', '[{"a": 1},', '{"a": 1}'])
+    def test_iter_json_array_invalid(self, tmp_path, content):
+        """Bozuk dosyada JSONDecodeError fırlatılır"""
+        path = str(tmp_path / "bad.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_array(path, 4))
+
+
+def _add_books_in_worker(filename, worker, count):
+    """Ayrı süreçte paylaşımlı kütüphaneye kitap ekler"""
+    library = Library(filename, shared=True, compact_threshold=2048)
+    for i in range(count):
+        library.add_book_manual(Book(f"Kitap {worker}-{i}", "Yazar", f"{worker}-{i}"))
+    library.close()
+
+
+class TestSharedStorage:
+    """Paylaşımlı (çok süreçli) mod test senaryoları"""
+    
+    def test_save_is_atomic_and_leaves_no_temp_files(self, tmp_path):
+        """Anlık görüntü geçici dosya üzerinden yazılır"""
+        filename = str(tmp_path / "library.json")
+        storage = JsonStorage(filename)
+        storage.save_all([Book("Kitap", "Yazar", "111")])
+        
+        assert sorted(os.listdir(tmp_path)) == ["library.json"]
+        assert json.load(open(filename, encoding='utf-8'))[0]["isbn"] == "111"
+    
+    def test_changes_detects_journal_and_snapshot_updates(self, tmp_path):
+        """Diğer sürecin günlük kayıtları artımlı, anlık görüntüsü tam yükleme olarak görülür"""
+        filename = str(tmp_path / "library.json")
+        reader = JsonStorage(filename, shared=True)
+        writer = JsonStorage(filename, shared=True)
+        reader.load_tail()
+        writer.load_tail()
+        assert not reader.has_changes()
+        
+        writer.write([{"op": "add", "book": {"title": "A", "author": "B", "isbn": "1"}}])
+        assert reader.has_changes()
+        assert [entry["book"]["isbn"] for entry in reader.changes()] == ["1"]
+        assert reader.changes() == []
+        
+        writer.save_all([Book("A", "B", "1")])
+        assert reader.changes() is None
+    
+    def test_libraries_see_each_others_changes(self, tmp_path):
+        """Aynı dosyayı paylaşan iki kütüphane refresh ile eşitlenir"""
+        filename = str(tmp_path / "library.json")
+        first = Library(filename, shared=True)
+        second = Library(filename, shared=True)
+        
+        first.add_book_manual(Book("Birinci", "Yazar", "111"))
+        assert second.refresh() is True
+        assert second.find_book("111").title == "Birinci"
+        assert second.refresh() is False
+        
+        # second yazarken first'ün silmesini de içeren anlık görüntü alır
+        first.remove_book("111")
+        second.add_book_manual(Book("İkinci", "Yazar", "222"))
+        second.compact()
+        assert first.refresh() is True
+        assert [book.isbn for book in first.list_books()] == ["222"]
+        assert [book.isbn for book in Library(filename).list_books()] == ["222"]
+    
+    def test_save_and_compact_keep_other_workers_changes(self, tmp_path):
+        """Anlık görüntü yazmadan önce diğer sürecin günlük kayıtları uygulanır"""
+        filename = str(tmp_path / "library.json")
+        first = Library(filename, shared=True)
+        second = Library(filename, shared=True)
+        first.add_book_manual(Book("Bir", "Yazar", "1"))
+        first.add_book_manual(Book("İki", "Yazar", "2"))
+        
+        second.add_book_manual(Book("Üç", "Yazar", "3"))
+        first.save_books()
+        assert [book.isbn for book in Library(filename).list_books()] == ["1", "2", "3"]
+        
+        second.remove_book("1")
+        first.compact()
+        assert [book.isbn for book in Library(filename).list_books()] == ["2", "3"]
+        assert [book.isbn for book in first.list_books()] == ["2", "3"]
+    
+    def test_bulk_remove_compaction_keeps_other_workers_changes(self, tmp_path):
+        """Çok sayıda silmeden sonraki katlama diğer sürecin eklemesini silmez"""
+        filename = str(tmp_path / "library.json")
+        first = Library(filename, shared=True)
+        first.add_books_manual([Book(f"Kitap {i}", "Yazar", str(i)) for i in range(Library.BULK_COMPACT_MIN)])
+        second = Library(filename, shared=True)
+        
+        def commit_then_other_worker_writes(entries, strict=False):
+            # Silmeler yazıldıktan sonra, katlamadan önce diğer süreç ekler
+            Library._commit(first, entries, strict)
+            second.add_book_manual(Book("Yeni", "Yazar", "yeni"))
+        
+        with patch.object(first, "_commit", side_effect=commit_then_other_worker_writes):
+            first.remove_books(author="Yazar")
+        assert [book.isbn for book in Library(filename).list_books()] == ["yeni"]
+    
+    def test_concurrent_processes_do_not_lose_books(self, tmp_path):
+        """Aynı anda yazan süreçler birbirinin kitaplarını ezmez"""
+        import multiprocessing
+        
+        filename = str(tmp_path / "library.json")
+        processes = [
+            multiprocessing.Process(target=_add_books_in_worker, args=(filename, worker, 25))
+            for worker in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(60)
+            assert process.exitcode == 0
+        
+        isbns = {book.isbn for book in Library(filename).list_books()}
+        assert isbns == {f"{worker}-{i}" for worker in range(4) for i in range(25)}
@@ -0,0 +1,139 @@
+import pytest
+import sys
+import os
+import asyncio
+import time
+import httpx
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.library import Library
+from models.metrics import UPSTREAM_ERRORS
+from models.upstream import CircuitBreaker, CircuitOpenError, TokenBucket, UpstreamPolicy
+
+
+class TestUpstreamPolicy:
+    """Open Library çağrı politikası test senaryoları"""
+
+    def test_token_bucket_paces_after_burst(self):
+        """Kova dolu olduğu sürece bekleme yok, sonra 1/rate aralıkla"""
+        bucket = TokenBucket(rate=10, burst=2)
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1, abs=0.01)
+        assert bucket.reserve() == pytest.approx(0.2, abs=0.01)
+        assert TokenBucket(rate=None).reserve() == 0
+
+    def test_circuit_breaker_opens_and_recovers(self):
+        """Eşikten sonra açılır, süre dolunca tek deneme ile kapanır"""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        breaker.record_failure()
+        breaker.before_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+
+        time.sleep(0.06)
+        breaker.before_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_retries_retryable_statuses_with_backoff(self):
+        """503 yeniden denenir, Retry-After'a uyulur, 404 denenmez"""
+        responses = [httpx.Response(503), httpx.Response(429, headers={"Retry-After": "1"}), httpx.Response(200)]
+        policy = UpstreamPolicy(max_retries=3, backoff_base=0.001, seed=1)
+        sleeps = []
+
+        with patch("models.upstream.time.sleep", sleeps.append):
+            response = policy.send(lambda: responses.pop(0))
+            not_found = policy.send(lambda: httpx.Response(404))
+
+        assert response.status_code == 200
+        assert not_found.status_code == 404
+        assert policy.retries == 2
+        assert sleeps[0] <= 0.001 and sleeps[1] == 1.0
+        assert policy.state()["circuit"]["state"] == "closed"
+
+    def test_async_send_fails_fast_when_circuit_open(self):
+        """Bağlantı hataları devreyi açar, sonraki istekler upstream'e gitmez"""
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            raise httpx.ConnectError("bağlantı reddedildi")
+
+        policy = UpstreamPolicy(max_retries=5, backoff_base=0.001, failure_threshold=3, reset_timeout=60)
+
+        async def run():
+            with pytest.raises(httpx.ConnectError):
+                await policy.send_async(failing)
+            with pytest.raises(CircuitOpenError):
+                await policy.send_async(failing)
+
+        asyncio.run(run())
+        assert len(calls) == 3
+        state = policy.state()
+        assert state["circuit"]["state"] == "open"
+        assert state["circuit"]["rejected"] == 1
+        assert state["concurrency"]["in_flight"] == 0
+
+    def test_cancelled_probe_releases_half_open_slot(self):
+        """Hız sınırı ya da eşzamanlılık beklemesinde iptal edilen deneme isteği devreyi kilitlemez"""
+        async def ok():
+            return httpx.Response(200)
+
+        policy = UpstreamPolicy(rate=1, burst=1, max_concurrency=1, failure_threshold=1, reset_timeout=0.01)
+
+        async def cancel_probe():
+            task = asyncio.create_task(policy.send_async(ok))
+            await asyncio.sleep(0.05)
+            assert policy.breaker.state == CircuitBreaker.HALF_OPEN
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert not policy.breaker._probing
+
+        # Hız sınırı beklemesi: kova boşken açılan devre
+        policy.bucket.reserve()
+        policy.breaker.record_failure()
+        time.sleep(0.02)
+        asyncio.run(cancel_probe())
+
+        # Eşzamanlılık beklemesi: tek yer başka bir istekte
+        policy.bucket.rate = None
+
+        async def cancel_probe_waiting_for_slot():
+            semaphore = policy._async_semaphore()
+            async with semaphore:
+                await cancel_probe()
+            assert (await policy.send_async(ok)).status_code == 200
+
+        asyncio.run(cancel_probe_waiting_for_slot())
+        assert policy.breaker.state == CircuitBreaker.CLOSED
+        assert policy.state()["concurrency"]["in_flight"] == 0
+
+    def test_library_reports_circuit_open_errors(self, tmp_path):
+        """Açık devre Library'de bağlantı hatası gibi ele alınır ve ayrı sayılır"""
+        requests = []
+
+        def handler(request):
+            requests.append(request.url.path)
+            return httpx.Response(503)
+
+        client = httpx.Client(transport=httpx.MockTransport(handler))
+        policy = UpstreamPolicy(max_retries=0, failure_threshold=1, reset_timeout=60)
+        library = Library(str(tmp_path / "library.json"), client=client, upstream=policy)
+        rejected = UPSTREAM_ERRORS.value(kind="edition", reason="circuit_open")
+
+        assert library.add_book("111") is False
+        assert library.add_book("222") is False
+
+        assert requests == ["/isbn/111.json"]
+        assert UPSTREAM_ERRORS.value(kind="edition", reason="circuit_open") == rejected + 1
+        client.close()
@@ -0,0 +1,141 @@
+import pytest
+import sys
+import os
+import json
+import asyncio
+from unittest.mock import patch
+
+# Test için modülleri import etmek için path ayarı
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from models.book import Book
+from models.library import Library
+from models.writer import GroupCommitWriter
+
+
+class TestGroupCommitWriter:
+    """Grup yazımı yapan arka plan yazıcısı test senaryoları"""
+
+    def test_entries_coalesced_into_one_group(self):
+        """Süre dolmadan gelen kayıtlar tek bir flush çağrısında yazılır"""
+        groups = []
+        writer = GroupCommitWriter(groups.append, interval=10)
+        futures = [writer.submit([{"n": i}]) for i in range(5)]
+
+        assert writer.pending == 5
+        assert writer.flush(timeout=5) is True
+        assert groups == [[{"n": i} for i in range(5)]]
+        assert all(future.result(0) == 5 for future in futures)
+        writer.close()
+
+    def test_threshold_and_interval_trigger_flush(self):
+        """Eşik aşılınca ya da süre dolunca beklemeden yazılır"""
+        groups = []
+        writer = GroupCommitWriter(groups.append, interval=10, max_pending=3)
+        writer.submit([{"n": 1}, {"n": 2}])
+        writer.submit([{"n": 3}]).result(timeout=5)
+        assert len(groups) == 1
+        writer.close()
+
+        groups = []
+        writer = GroupCommitWriter(groups.append, interval=0.01)
+        writer.submit([{"n": 1}]).result(timeout=5)
+        assert groups == [[{"n": 1}]]
+        writer.close()
+
+    def test_close_flushes_pending_and_rejects_new(self):
+        """Kapanışta bekleyen kayıtlar yazılır, sonrasında kayıt kabul edilmez"""
+        groups = []
+        writer = GroupCommitWriter(groups.append, interval=10)
+        future = writer.submit([{"n": 1}])
+        writer.close()
+
+        assert future.done()
+        assert groups == [[{"n": 1}]]
+        with pytest.raises(RuntimeError):
+            writer.submit([{"n": 2}])
+
+    def test_flush_error_reported_to_waiters(self):
+        """flush hatası gruptaki tüm bekleyenlere iletilir"""
+        def failing(entries):
+            raise OSError("disk dolu")
+
+        writer = GroupCommitWriter(failing, interval=10)
+        future = writer.submit([{"n": 1}])
+        with pytest.raises(OSError):
+            writer.flush(timeout=5)
+        with pytest.raises(OSError):
+            future.result(0)
+        writer.close()
+
+
+class TestLibraryGroupCommit:
+    """Library'nin grup yazımı modu"""
+
+    @pytest.fixture
+    def temp_library_file(self, tmp_path):
+        return str(tmp_path / "library.json")
+
+    def test_burst_of_adds_written_in_few_groups(self, temp_library_file):
+        """Beklemeden yapılan çok sayıda ekleme birkaç grupta kaydedilir"""
+        library = Library(temp_library_file, group_commit=True, commit_interval=10)
+        for i in range(100):
+            assert library.add_book_manual(Book(f"Kitap {i}", "Yazar", str(i)), durable=False)
+        assert not os.path.exists(temp_library_file)
+
+        assert library.flush(timeout=5) is True
+        with open(temp_library_file, 'r', encoding='utf-8') as f:
+            assert len(json.load(f)) == 100
+        assert library._writer.groups == 1
+        library.close()
+
+    def test_durable_call_waits_for_write(self, temp_library_file):
+        """durable=True çağrı, kayıt diske yazılınca döner"""
+        library = Library(temp_library_file, journal=True, group_commit=True)
+        assert library.add_book_manual(Book("Kitap", "Yazar", "111"))
+        assert library.journal.size() > 0
+        library.close()
+
+        assert Library(temp_library_file, journal=True).find_book("111").title == "Kitap"
+
+    def test_close_flushes_pending_changes(self, temp_library_file):
+        """close() bekleyen değişiklikleri diske yazar"""
+        library = Library(temp_library_file, journal=True, group_commit=True, commit_interval=10)
+        library.add_book_manual(Book("Kitap", "Yazar", "111"), durable=False)
+        library.add_book_manual(Book("Kitap 2", "Yazar", "222"), durable=False)
+        library.remove_book("111", durable=False)
+        library.close()
+
+        reopened = Library(temp_library_file, journal=True)
+        assert [book.isbn for book in reopened.list_books()] == ["222"]
+
+    def test_async_removal_waits_for_group(self, temp_library_file):
+        """Asenkron yol da grubu bekler ya da beklemeden döner"""
+        library = Library(temp_library_file, journal=True, group_commit=True, commit_interval=0.5)
+        library.add_book_manual(Book("Kitap", "Yazar", "111"), durable=False)
+        library.add_book_manual(Book("Kitap 2", "Yazar", "222"), durable=False)
+
+        async def run():
+            assert await library.remove_book_async("111", durable=False)
+            assert library._writer.pending == 3
+            assert await library.remove_book_async("222")
+            assert library._writer.pending == 0
+
+        asyncio.run(run())
+        assert library._writer.groups == 1
+        library.close()
+
+    def test_durable_call_raises_when_write_fails(self, temp_library_file):
+        """Yazılamayan grup durable=True çağrıya hata olarak döner"""
+        library = Library(temp_library_file, journal=True, group_commit=True)
+
+        with patch.object(library.storage, 'write', side_effect=OSError("disk dolu")):
+            with pytest.raises(OSError):
+                library.add_book_manual(Book("Kitap", "Yazar", "111"))
+
+            async def run():
+                with pytest.raises(OSError):
+                    await library.remove_book_async("111")
+
+            asyncio.run(run())
+        library.close()